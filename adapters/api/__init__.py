@@ -1,5 +1,25 @@
 # API adapters module
+# The HTTPX adapter is resolved lazily (PEP 562) so sync-only runs never
+# import httpx and h2.
+import importlib
+
 from .api_actions_impl import RequestsAPIActions
 
-__all__ = ["RequestsAPIActions"]
+_EXPORTS = {
+    "HTTPXAsyncAPIActions": ".api_actions_async_impl",
+}
+
+__all__ = ["RequestsAPIActions", "HTTPXAsyncAPIActions"]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,201 @@
+"""HTTPX async implementation for API automation actions."""
+import asyncio
+from typing import Optional, Any, Awaitable, List
+import httpx
+from loguru import logger
+import orjson
+
+from adapters import reporting
+from adapters.base import AsyncBaseAPIActions
+from adapters.api.api_actions_impl import (
+    LOG_PREVIEW_CHARS,
+    MAX_LOGGED_BODY_BYTES,
+    _build_url,
+    _debug_enabled,
+    _dumps,
+    _loads_response,
+)
+
+
+class HTTPXAsyncAPIActions(AsyncBaseAPIActions):
+    """
+    HTTPX-based asynchronous API automation implementation.
+
+    Independent calls can be fanned out concurrently with ``gather``:
+
+        responses = await api.gather(api.get("/a"), api.get("/b"))
+    """
+
+    def __init__(self, base_url: str, timeout: float = 30, http2: bool = True):
+        """
+        Initialize with base URL and default timeout.
+
+        Args:
+            base_url: Base URL for all API requests
+            timeout: Default timeout in seconds
+            http2: Negotiate HTTP/2 when the server supports it
+        """
+        self.base_url = base_url.rstrip("/")
+        self._base_prefix = self.base_url + "/"
+        self.timeout = timeout
+        self._last_response: Optional[httpx.Response] = None
+        self._default_headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate, br",
+        }
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers=self._default_headers,
+            http2=http2,
+        )
+
+    def _build_url(self, endpoint: str) -> str:
+        """Build full URL from endpoint."""
+        return _build_url(self._base_prefix, endpoint)
+
+    def _log_response(self, response: httpx.Response) -> None:
+        """Log response details."""
+        logger.info(f"Response: {response.status_code}")
+        if not _debug_enabled():
+            return
+        if len(response.content) > MAX_LOGGED_BODY_BYTES:
+            logger.debug(f"Response text: {response.text[:LOG_PREVIEW_CHARS]}")
+            return
+        try:
+            body = _loads_response(response)
+            logger.debug(f"Response body: {_dumps(body)[:LOG_PREVIEW_CHARS]}")
+        except (orjson.JSONDecodeError, ValueError):
+            logger.debug(f"Response text: {response.text[:LOG_PREVIEW_CHARS]}")
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request and record it as the last response."""
+        url = self._build_url(endpoint)
+        with reporting.step(f"{method} {endpoint}"):
+            logger.info(f"{method} {url}")
+            response = await self.client.request(method, url, **kwargs)
+            self._log_response(response)
+            self._last_response = response
+            return response
+
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """Perform GET request."""
+        return await self._request("GET", endpoint, params=params, headers=headers)
+
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json_data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """Perform POST request."""
+        return await self._request(
+            "POST",
+            endpoint,
+            data=data if not json_data else None,
+            json=json_data,
+            headers=headers,
+        )
+
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json_data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """Perform PUT request."""
+        return await self._request(
+            "PUT",
+            endpoint,
+            data=data if not json_data else None,
+            json=json_data,
+            headers=headers,
+        )
+
+    async def patch(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json_data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """Perform PATCH request."""
+        return await self._request(
+            "PATCH",
+            endpoint,
+            data=data if not json_data else None,
+            json=json_data,
+            headers=headers,
+        )
+
+    async def delete(
+        self,
+        endpoint: str,
+        headers: Optional[dict] = None,
+    ) -> httpx.Response:
+        """Perform DELETE request."""
+        return await self._request("DELETE", endpoint, headers=headers)
+
+    async def gather(self, *requests: Awaitable[httpx.Response]) -> List[httpx.Response]:
+        """Run independent requests concurrently and return responses in order."""
+        return list(await asyncio.gather(*requests))
+
+    def set_auth_token(self, token: str) -> None:
+        """Set authentication token for requests."""
+        with reporting.step("Set authentication token"):
+            logger.info("Setting auth token")
+            self.client.headers["Authorization"] = f"Bearer {token}"
+
+    def set_header(self, key: str, value: str) -> None:
+        """Set a custom header."""
+        logger.info(f"Setting header: {key}")
+        self.client.headers[key] = value
+
+    def remove_header(self, key: str) -> None:
+        """Remove a header."""
+        logger.info(f"Removing header: {key}")
+        self.client.headers.pop(key, None)
+
+    def get_last_response(self) -> Optional[httpx.Response]:
+        """Get the last response object."""
+        return self._last_response
+
+    def get_last_status_code(self) -> Optional[int]:
+        """Get the last response status code."""
+        if self._last_response:
+            return self._last_response.status_code
+        return None
+
+    def get_last_json(self) -> Optional[dict]:
+        """Get the last response as JSON."""
+        if self._last_response:
+            try:
+                return _loads_response(self._last_response)
+            except (orjson.JSONDecodeError, ValueError):
+                return None
+        return None
+
+    async def close(self) -> None:
+        """Close the client."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "HTTPXAsyncAPIActions":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
@@ -1,13 +1,92 @@
 """Requests/HTTPX implementation for API automation actions."""
-from typing import Optional, Any, Union
-import allure
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Any, List, Tuple, Union
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
 from loguru import logger
-import json
+import orjson
 
+from adapters import reporting
 from adapters.base import BaseAPIActions
 
+# Bodies larger than this are logged as a raw text preview instead of being
+# parsed and re-serialized just to be truncated.
+MAX_LOGGED_BODY_BYTES = 2048
+LOG_PREVIEW_CHARS = 500
+
+# Connection pool sizing so parallel runs against one host keep reusing
+# keep-alive connections instead of opening new ones.
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+_ABSOLUTE_URL_PREFIXES = ("http://", "https://")
+
+# Marks the last response body as not yet parsed (None is a valid result)
+_UNPARSED = object()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an object to an indented JSON string using orjson."""
+    return orjson.dumps(
+        obj,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    ).decode()
+
+
+def _dumps_compact(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes; Allure pretty-prints on view."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str)
+
+
+def _loads_response(response: Response) -> Any:
+    """Parse a response body as JSON using orjson, skipping charset detection."""
+    content = response.content
+    if not content:
+        return None
+    return orjson.loads(content)
+
+
+@lru_cache(maxsize=1024)
+def _build_url(base_prefix: str, endpoint: str) -> str:
+    """Build full URL from a slash-terminated base prefix and endpoint."""
+    if endpoint.startswith(_ABSOLUTE_URL_PREFIXES):
+        return endpoint
+    return base_prefix + endpoint.lstrip("/")
+
+
+@lru_cache(maxsize=1024)
+def _split_field(field: str) -> tuple:
+    """Split a dotted JSON field path into its keys."""
+    return tuple(field.split("."))
+
+
+def _form_fields(data: Optional[dict]) -> List[Tuple[str, Union[str, bytes]]]:
+    """
+    Encode extra form fields the way requests' ``data=`` does for multipart.
+
+    ``None`` values are skipped, lists/tuples become repeated fields, bytes
+    and str pass through and anything else is converted with str().
+    """
+    fields = []
+    for key, value in (data or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            if item is None:
+                continue
+            fields.append((key, item if isinstance(item, (str, bytes)) else str(item)))
+    return fields
+
+
+def _debug_enabled() -> bool:
+    """Check whether any loguru handler accepts DEBUG records."""
+    return logger._core.min_level <= logger.level("DEBUG").no
+
 
 class RequestsAPIActions(BaseAPIActions):
     """Requests-based API automation implementation."""
@@ -19,22 +98,41 @@ class RequestsAPIActions(BaseAPIActions):
         Args:
             base_url: Base URL for all API requests
             timeout: Default timeout in seconds
+
+        Set ``ALLURE_ENABLED=0`` to skip request/response attachments.
         """
         self.base_url = base_url.rstrip("/")
+        self._base_prefix = self.base_url + "/"
         self.timeout = timeout
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            # Only connection errors are retried: tests assert on 5xx
+            # responses, and retrying them would only slow those tests down
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self._last_response: Optional[Response] = None
+        self._last_json: Any = _UNPARSED
+        self._allure_enabled = reporting.ALLURE_ENABLED
         self._default_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate, br",
         }
         self.session.headers.update(self._default_headers)
+        self._headers_snapshot = dict(self.session.headers)
+        self._initial_headers = self._headers_snapshot
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
-        if endpoint.startswith("http"):
-            return endpoint
-        return f"{self.base_url}/{endpoint.lstrip('/')}"
+        return _build_url(self._base_prefix, endpoint)
+
+    def _refresh_headers_snapshot(self) -> None:
+        """Refresh the cached copy of session headers after a change."""
+        self._headers_snapshot = dict(self.session.headers)
 
     def _log_request(
         self,
@@ -47,18 +145,26 @@ class RequestsAPIActions(BaseAPIActions):
         """Log request details."""
         logger.info(f"{method} {url}")
         if params:
-            logger.debug(f"Params: {params}")
+            logger.debug("Params: {}", params)
         if data:
-            logger.debug(f"Body: {json.dumps(data, indent=2)[:500]}")
+            # Serialized only when a DEBUG handler is active
+            logger.opt(lazy=True).debug(
+                "Body: {}", lambda: _dumps(data)[:LOG_PREVIEW_CHARS]
+            )
 
     def _log_response(self, response: Response) -> None:
         """Log response details."""
         logger.info(f"Response: {response.status_code}")
+        if not _debug_enabled():
+            return
+        if len(response.content) > MAX_LOGGED_BODY_BYTES:
+            logger.debug(f"Response text: {response.text[:LOG_PREVIEW_CHARS]}")
+            return
         try:
-            body = response.json()
-            logger.debug(f"Response body: {json.dumps(body, indent=2)[:500]}")
-        except (json.JSONDecodeError, ValueError):
-            logger.debug(f"Response text: {response.text[:500]}")
+            body = _loads_response(response)
+            logger.debug(f"Response body: {_dumps(body)[:LOG_PREVIEW_CHARS]}")
+        except (orjson.JSONDecodeError, ValueError):
+            logger.debug(f"Response text: {response.text[:LOG_PREVIEW_CHARS]}")
 
     def _attach_to_allure(
         self,
@@ -68,35 +174,43 @@ class RequestsAPIActions(BaseAPIActions):
         request_body: Any = None,
     ) -> None:
         """Attach request/response details to Allure report."""
+        if not self._allure_enabled:
+            return
+
         # Attach request details
-        request_details = {
-            "method": method,
-            "url": url,
-            "headers": dict(self.session.headers),
-        }
         if request_body:
-            request_details["body"] = request_body
-
-        allure.attach(
-            json.dumps(request_details, indent=2, default=str),
+            request_details = {
+                "method": method,
+                "url": url,
+                "headers": self._headers_snapshot,
+                "body": request_body,
+            }
+        else:
+            request_details = {
+                "method": method,
+                "url": url,
+                "headers": self._headers_snapshot,
+            }
+        reporting.attach(
+            _dumps_compact(request_details),
             name="Request",
-            attachment_type=allure.attachment_type.JSON,
+            attachment_type="JSON",
         )
 
         # Attach response details
+        try:
+            response_body = _loads_response(response)
+        except (orjson.JSONDecodeError, ValueError):
+            response_body = response.text
         response_details = {
             "status_code": response.status_code,
             "headers": dict(response.headers),
+            "body": response_body,
         }
-        try:
-            response_details["body"] = response.json()
-        except (json.JSONDecodeError, ValueError):
-            response_details["body"] = response.text
-
-        allure.attach(
-            json.dumps(response_details, indent=2, default=str),
+        reporting.attach(
+            _dumps_compact(response_details),
             name="Response",
-            attachment_type=allure.attachment_type.JSON,
+            attachment_type="JSON",
         )
 
     def get(
@@ -107,7 +221,7 @@ class RequestsAPIActions(BaseAPIActions):
     ) -> Response:
         """Perform GET request."""
         url = self._build_url(endpoint)
-        with allure.step(f"GET {endpoint}"):
+        with reporting.step(f"GET {endpoint}"):
             self._log_request("GET", url, headers, params)
 
             self._last_response = self.session.get(
@@ -116,11 +230,66 @@ class RequestsAPIActions(BaseAPIActions):
                 headers=headers,
                 timeout=self.timeout,
             )
+            self._last_json = _UNPARSED
 
             self._log_response(self._last_response)
             self._attach_to_allure("GET", url, self._last_response)
             return self._last_response
 
+    def get_many(
+        self,
+        endpoints: List[str],
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> List[Response]:
+        """
+        Perform independent GET requests concurrently.
+
+        Session headers and auth must not be changed while requests are in
+        flight. The last response afterwards is the one for the last endpoint.
+
+        Returns:
+            Responses in the same order as ``endpoints``
+        """
+        return self.get_batch([(endpoint, params) for endpoint in endpoints], headers=headers)
+
+    def get_batch(
+        self,
+        queries: List[Tuple[str, Optional[dict]]],
+        headers: Optional[dict] = None,
+        max_workers: int = POOL_MAXSIZE,
+    ) -> List[Response]:
+        """
+        Perform independent GET requests, one per (endpoint, params) pair, concurrently.
+
+        Worker threads only send; logging, Allure attachments and the last
+        response are all handled on the calling thread under a single step.
+
+        Returns:
+            Responses in the same order as ``queries``
+        """
+        if not queries:
+            return []
+        urls = [(self._build_url(endpoint), params) for endpoint, params in queries]
+        with reporting.step(f"GET {len(urls)} endpoints concurrently"):
+            for url, params in urls:
+                self._log_request("GET", url, headers, params)
+            workers = min(len(urls), max_workers)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                responses = list(
+                    executor.map(lambda query: self._send_get(query[0], query[1], headers), urls)
+                )
+            for (url, _), response in zip(urls, responses):
+                self._log_response(response)
+                self._attach_to_allure("GET", url, response)
+            self._last_response = responses[-1]
+            self._last_json = _UNPARSED
+            return responses
+
+    def _send_get(self, url: str, params: Optional[dict], headers: Optional[dict]) -> Response:
+        """Send a GET on the shared session without touching any instance state."""
+        return self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+
     def post(
         self,
         endpoint: str,
@@ -131,7 +300,7 @@ class RequestsAPIActions(BaseAPIActions):
         """Perform POST request."""
         url = self._build_url(endpoint)
         body = json_data or data
-        with allure.step(f"POST {endpoint}"):
+        with reporting.step(f"POST {endpoint}"):
             self._log_request("POST", url, headers, data=body)
 
             self._last_response = self.session.post(
@@ -141,6 +310,7 @@ class RequestsAPIActions(BaseAPIActions):
                 headers=headers,
                 timeout=self.timeout,
             )
+            self._last_json = _UNPARSED
 
             self._log_response(self._last_response)
             self._attach_to_allure("POST", url, self._last_response, body)
@@ -156,7 +326,7 @@ class RequestsAPIActions(BaseAPIActions):
         """Perform PUT request."""
         url = self._build_url(endpoint)
         body = json_data or data
-        with allure.step(f"PUT {endpoint}"):
+        with reporting.step(f"PUT {endpoint}"):
             self._log_request("PUT", url, headers, data=body)
 
             self._last_response = self.session.put(
@@ -166,6 +336,7 @@ class RequestsAPIActions(BaseAPIActions):
                 headers=headers,
                 timeout=self.timeout,
             )
+            self._last_json = _UNPARSED
 
             self._log_response(self._last_response)
             self._attach_to_allure("PUT", url, self._last_response, body)
@@ -181,7 +352,7 @@ class RequestsAPIActions(BaseAPIActions):
         """Perform PATCH request."""
         url = self._build_url(endpoint)
         body = json_data or data
-        with allure.step(f"PATCH {endpoint}"):
+        with reporting.step(f"PATCH {endpoint}"):
             self._log_request("PATCH", url, headers, data=body)
 
             self._last_response = self.session.patch(
@@ -191,6 +362,7 @@ class RequestsAPIActions(BaseAPIActions):
                 headers=headers,
                 timeout=self.timeout,
             )
+            self._last_json = _UNPARSED
 
             self._log_response(self._last_response)
             self._attach_to_allure("PATCH", url, self._last_response, body)
@@ -203,7 +375,7 @@ class RequestsAPIActions(BaseAPIActions):
     ) -> Response:
         """Perform DELETE request."""
         url = self._build_url(endpoint)
-        with allure.step(f"DELETE {endpoint}"):
+        with reporting.step(f"DELETE {endpoint}"):
             self._log_request("DELETE", url, headers)
 
             self._last_response = self.session.delete(
@@ -211,6 +383,7 @@ class RequestsAPIActions(BaseAPIActions):
                 headers=headers,
                 timeout=self.timeout,
             )
+            self._last_json = _UNPARSED
 
             self._log_response(self._last_response)
             self._attach_to_allure("DELETE", url, self._last_response)
@@ -218,13 +391,14 @@ class RequestsAPIActions(BaseAPIActions):
 
     def set_auth_token(self, token: str) -> None:
         """Set authentication token for requests."""
-        with allure.step("Set authentication token"):
+        with reporting.step("Set authentication token"):
             logger.info("Setting auth token")
             self.session.headers["Authorization"] = f"Bearer {token}"
+            self._refresh_headers_snapshot()
 
     def set_basic_auth(self, username: str, password: str) -> None:
         """Set basic authentication."""
-        with allure.step("Set basic authentication"):
+        with reporting.step("Set basic authentication"):
             logger.info(f"Setting basic auth for user: {username}")
             self.session.auth = (username, password)
 
@@ -232,11 +406,13 @@ class RequestsAPIActions(BaseAPIActions):
         """Set a custom header."""
         logger.info(f"Setting header: {key}")
         self.session.headers[key] = value
+        self._refresh_headers_snapshot()
 
     def remove_header(self, key: str) -> None:
         """Remove a header."""
         logger.info(f"Removing header: {key}")
         self.session.headers.pop(key, None)
+        self._refresh_headers_snapshot()
 
     def get_last_response(self) -> Optional[Response]:
         """Get the last response object."""
@@ -251,15 +427,17 @@ class RequestsAPIActions(BaseAPIActions):
     def get_last_json(self) -> Optional[dict]:
         """Get the last response as JSON."""
         if self._last_response:
-            try:
-                return self._last_response.json()
-            except (json.JSONDecodeError, ValueError):
-                return None
+            if self._last_json is _UNPARSED:
+                try:
+                    self._last_json = _loads_response(self._last_response)
+                except (orjson.JSONDecodeError, ValueError):
+                    self._last_json = None
+            return self._last_json
         return None
 
     def assert_status_code(self, expected: int) -> None:
         """Assert the last response has expected status code."""
-        with allure.step(f"Assert status code is {expected}"):
+        with reporting.step(f"Assert status code is {expected}"):
             actual = self.get_last_status_code()
             assert actual == expected, (
                 f"Expected status code {expected}, got {actual}"
@@ -267,20 +445,31 @@ class RequestsAPIActions(BaseAPIActions):
 
     def assert_json_field(self, field: str, expected: Any) -> None:
         """Assert a field in the last JSON response."""
-        with allure.step(f"Assert JSON field '{field}' equals {expected}"):
+        with reporting.step(f"Assert JSON field '{field}' equals {expected}"):
             json_data = self.get_last_json()
             assert json_data is not None, "Response is not valid JSON"
-            
-            # Support nested fields with dot notation
-            keys = field.split(".")
-            value = json_data
-            for key in keys:
-                assert key in value, f"Field '{key}' not found in response"
-                value = value[key]
-            
-            assert value == expected, (
-                f"Expected '{field}' to be {expected}, got {value}"
-            )
+            self._assert_field_value(json_data, field, expected)
+
+    def assert_json_fields(self, expected: dict) -> None:
+        """Assert several fields in the last JSON response, parsing it once."""
+        with reporting.step(f"Assert JSON fields: {', '.join(expected)}"):
+            json_data = self.get_last_json()
+            assert json_data is not None, "Response is not valid JSON"
+            for field, expected_value in expected.items():
+                self._assert_field_value(json_data, field, expected_value)
+
+    @staticmethod
+    def _assert_field_value(json_data: Any, field: str, expected: Any) -> None:
+        """Resolve a dotted field path and assert its value."""
+        # Support nested fields with dot notation
+        value = json_data
+        for key in _split_field(field):
+            assert key in value, f"Field '{key}' not found in response"
+            value = value[key]
+
+        assert value == expected, (
+            f"Expected '{field}' to be {expected}, got {value}"
+        )
 
     def upload_file(
         self,
@@ -291,21 +480,43 @@ class RequestsAPIActions(BaseAPIActions):
     ) -> Response:
         """Upload a file."""
         url = self._build_url(endpoint)
-        with allure.step(f"Upload file to {endpoint}"):
+        with reporting.step(f"Upload file to {endpoint}"):
             logger.info(f"Uploading file: {file_path}")
 
             with open(file_path, "rb") as f:
-                files = {file_field: f}
+                # Stream the multipart body instead of buffering the whole file
+                fields = _form_fields(additional_data)
+                fields.append((
+                    file_field,
+                    (os.path.basename(file_path), f, "application/octet-stream"),
+                ))
+                encoder = MultipartEncoder(fields=fields)
                 self._last_response = self.session.post(
                     url,
-                    files=files,
-                    data=additional_data,
+                    data=encoder,
+                    headers={"Content-Type": encoder.content_type},
                     timeout=self.timeout,
                 )
+                self._last_json = _UNPARSED
 
             self._log_response(self._last_response)
             return self._last_response
 
+    def reset(self) -> None:
+        """
+        Drop per-test state (auth, custom headers, cookies, last response).
+
+        Pooled connections are kept, so a shared instance can be reused
+        across tests without paying for new TCP/TLS handshakes.
+        """
+        self.session.headers.clear()
+        self.session.headers.update(self._initial_headers)
+        self.session.auth = None
+        self.session.cookies.clear()
+        self._refresh_headers_snapshot()
+        self._last_response = None
+        self._last_json = _UNPARSED
+
     def close(self) -> None:
         """Close the session."""
         self.session.close()
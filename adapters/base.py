@@ -6,6 +6,8 @@ from typing import Any, Optional
 class BaseUIActions(ABC):
     """Abstract base class for UI automation actions."""
 
+    __slots__ = ()
+
     @abstractmethod
     def navigate(self, url: str) -> None:
         """Navigate to a URL."""
@@ -182,3 +184,69 @@ class BaseAPIActions(ABC):
     def get_last_response(self) -> Any:
         """Get the last response object."""
         pass
+
+
+class AsyncBaseAPIActions(ABC):
+    """Abstract base class for asynchronous API automation actions."""
+
+    @abstractmethod
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """Perform GET request."""
+        pass
+
+    @abstractmethod
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """Perform POST request."""
+        pass
+
+    @abstractmethod
+    async def put(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """Perform PUT request."""
+        pass
+
+    @abstractmethod
+    async def patch(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """Perform PATCH request."""
+        pass
+
+    @abstractmethod
+    async def delete(
+        self,
+        endpoint: str,
+        headers: Optional[dict] = None,
+    ) -> Any:
+        """Perform DELETE request."""
+        pass
+
+    @abstractmethod
+    def set_auth_token(self, token: str) -> None:
+        """Set authentication token for requests."""
+        pass
+
+    @abstractmethod
+    def get_last_response(self) -> Any:
+        """Get the last response object."""
+        pass
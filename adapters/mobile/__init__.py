@@ -1,6 +1,16 @@
 # Mobile adapters module
-from .mobile_actions_impl import AppiumMobileActions
-from .mobile_factory import MobileFactory, MobileConfig, get_mobile_factory, close_mobile_factory
+# Exports are resolved lazily (PEP 562) so importing this package does not
+# pull in the Appium client until a mobile class is actually used.
+import importlib
+
+_EXPORTS = {
+    "AppiumMobileActions": ".mobile_actions_impl",
+    "MobileFactory": ".mobile_factory",
+    "MobileConfig": ".mobile_factory",
+    "get_mobile_factory": ".mobile_factory",
+    "close_mobile_factory": ".mobile_factory",
+    "quit_pooled_drivers": ".mobile_factory",
+}
 
 __all__ = [
     "AppiumMobileActions",
@@ -8,4 +18,18 @@ __all__ = [
     "MobileConfig",
     "get_mobile_factory",
     "close_mobile_factory",
+    "quit_pooled_drivers",
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
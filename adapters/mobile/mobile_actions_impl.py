@@ -1,15 +1,82 @@
 """Appium implementation for mobile automation actions."""
-from typing import Optional
-import allure
-from appium.webdriver.webdriver import WebDriver
-from appium.webdriver.common.appiumby import AppiumBy
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from __future__ import annotations
+
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
 from loguru import logger
 
+from adapters import reporting
 from adapters.base import BaseMobileActions
 
+if TYPE_CHECKING:
+    from appium.webdriver.webdriver import WebDriver
+    from appium.webdriver.webelement import WebElement
+    from selenium.webdriver.support.ui import WebDriverWait
+
+Locator = Union[str, Tuple[str, str]]
+
+# Locator prefix -> AppiumBy attribute name
+_STRATEGY_MAP = MappingProxyType({
+    "id": "ID",
+    "xpath": "XPATH",
+    "accessibility_id": "ACCESSIBILITY_ID",
+    "class": "CLASS_NAME",
+    "name": "NAME",
+    "css": "CSS_SELECTOR",
+    "android_uiautomator": "ANDROID_UIAUTOMATOR",
+    "ios_predicate": "IOS_PREDICATE",
+    "ios_class_chain": "IOS_CLASS_CHAIN",
+})
+
+
+@lru_cache(maxsize=1)
+def _load_appium() -> SimpleNamespace:
+    """
+    Import the Appium/Selenium pieces used by the actions on first use.
+    
+    Keeps the Appium client out of module import, so the mobile package can
+    be imported (e.g. by MobileFactory) when Appium is not installed.
+    
+    Raises:
+        ImportError: If Appium is not installed
+    """
+    try:
+        from appium.webdriver.common.appiumby import AppiumBy
+        from selenium.webdriver.common.actions.action_builder import ActionBuilder
+        from selenium.webdriver.common.actions.interaction import POINTER_TOUCH
+        from selenium.webdriver.common.actions.pointer_input import PointerInput
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions
+        from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    except ImportError as e:
+        raise ImportError(
+            "Appium is not installed. Install with: pip install Appium-Python-Client"
+        ) from e
+    return SimpleNamespace(
+        AppiumBy=AppiumBy,
+        ActionBuilder=ActionBuilder,
+        POINTER_TOUCH=POINTER_TOUCH,
+        PointerInput=PointerInput,
+        WebDriverWait=WebDriverWait,
+        EC=expected_conditions,
+        TimeoutException=TimeoutException,
+        NoSuchElementException=NoSuchElementException,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_locator(locator: str) -> Tuple[str, str]:
+    """Parse a `strategy=value` locator string into an Appium (by, value) pair."""
+    AppiumBy = _load_appium().AppiumBy
+    if "=" not in locator:
+        # Default to accessibility_id if no strategy specified
+        return AppiumBy.ACCESSIBILITY_ID, locator
+
+    strategy, value = locator.split("=", 1)
+    strategy = strategy.lower().strip()
+    return getattr(AppiumBy, _STRATEGY_MAP.get(strategy, "ACCESSIBILITY_ID")), value
+
 
 class AppiumMobileActions(BaseMobileActions):
     """Appium-based mobile automation implementation."""
@@ -23,8 +90,11 @@ class AppiumMobileActions(BaseMobileActions):
         """
         self.driver = driver
         self._default_timeout = 30
+        self._caps = dict(driver.capabilities)
+        self._app_id = self._caps.get("appPackage") or self._caps.get("bundleId")
+        self._waits: Dict[float, WebDriverWait] = {}
 
-    def _get_locator_strategy(self, locator: str) -> tuple:
+    def _get_locator_strategy(self, locator: Locator) -> tuple:
         """
         Parse locator string and return appropriate strategy and value.
 
@@ -38,49 +108,63 @@ class AppiumMobileActions(BaseMobileActions):
             - android_uiautomator=expression
             - ios_predicate=expression
             - ios_class_chain=expression
+
+        A pre-parsed (by, value) tuple is returned unchanged.
         """
-        if "=" not in locator:
-            # Default to accessibility_id if no strategy specified
-            return AppiumBy.ACCESSIBILITY_ID, locator
-
-        strategy, value = locator.split("=", 1)
-        strategy = strategy.lower().strip()
-
-        strategy_map = {
-            "id": AppiumBy.ID,
-            "xpath": AppiumBy.XPATH,
-            "accessibility_id": AppiumBy.ACCESSIBILITY_ID,
-            "class": AppiumBy.CLASS_NAME,
-            "name": AppiumBy.NAME,
-            "css": AppiumBy.CSS_SELECTOR,
-            "android_uiautomator": AppiumBy.ANDROID_UIAUTOMATOR,
-            "ios_predicate": AppiumBy.IOS_PREDICATE,
-            "ios_class_chain": AppiumBy.IOS_CLASS_CHAIN,
-        }
-
-        return strategy_map.get(strategy, AppiumBy.ACCESSIBILITY_ID), value
-
-    def _find_element(self, locator: str):
+        if isinstance(locator, tuple):
+            return locator
+        return _parse_locator(locator)
+
+    def _wait(self, timeout: float) -> WebDriverWait:
+        """Get a cached WebDriverWait for the given timeout."""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = _load_appium().WebDriverWait(self.driver, timeout)
+        return wait
+
+    def _find_element(self, locator: Locator):
         by, value = self._get_locator_strategy(locator)
         return self.driver.find_element(by, value)
 
-    def _find_elements(self, locator: str):
+    def _find_elements(self, locator: Locator):
         by, value = self._get_locator_strategy(locator)
         return self.driver.find_elements(by, value)
 
-    def tap(self, locator: str) -> None:
-        with allure.step(f"Tap element: {locator}"):
+    def tap(self, locator: str, element: Optional[WebElement] = None) -> None:
+        with reporting.step(f"Tap element: {locator}"):
             logger.info(f"Tapping element: {locator}")
-            element = self._find_element(locator)
+            if element is None:
+                element = self._find_element(locator)
             element.click()
 
-    def send_keys(self, locator: str, text: str) -> None:
-        with allure.step(f"Send keys '{text}' to: {locator}"):
+    def send_keys(
+        self,
+        locator: str,
+        text: str,
+        element: Optional[WebElement] = None,
+    ) -> None:
+        with reporting.step(f"Send keys '{text}' to: {locator}"):
             logger.info(f"Sending keys to: {locator}")
-            element = self._find_element(locator)
+            if element is None:
+                element = self._find_element(locator)
             element.clear()
             element.send_keys(text)
 
+    def tap_when_clickable(self, locator: str, timeout: float = 30) -> None:
+        """Wait for an element to be clickable and tap the located element."""
+        element = self.wait_for_element_clickable(locator, timeout)
+        self.tap(locator, element=element)
+
+    def send_keys_when_visible(
+        self,
+        locator: str,
+        text: str,
+        timeout: float = 30,
+    ) -> None:
+        """Wait for an element to be visible and send keys to the located element."""
+        element = self.wait_for_element_visible(locator, timeout)
+        self.send_keys(locator, text, element=element)
+
     def swipe(
         self,
         start_x: int,
@@ -90,7 +174,7 @@ class AppiumMobileActions(BaseMobileActions):
         duration: int = 500,
     ) -> None:
         """Perform swipe gesture."""
-        with allure.step(
+        with reporting.step(
             f"Swipe from ({start_x}, {start_y}) to ({end_x}, {end_y})"
         ):
             logger.info(
@@ -98,9 +182,76 @@ class AppiumMobileActions(BaseMobileActions):
             )
             self.driver.swipe(start_x, start_y, end_x, end_y, duration)
 
+    def _android_scrollable_selector(self, by: str, value: str) -> Optional[str]:
+        """Build a UiSelector expression for a locator, if the strategy maps to one."""
+        AppiumBy = _load_appium().AppiumBy
+        quoted = value.replace('"', '\\"')
+        if by == AppiumBy.ANDROID_UIAUTOMATOR:
+            return value
+        if by == AppiumBy.ID:
+            return f'new UiSelector().resourceId("{quoted}")'
+        if by == AppiumBy.ACCESSIBILITY_ID:
+            return f'new UiSelector().description("{quoted}")'
+        if by == AppiumBy.NAME:
+            return f'new UiSelector().text("{quoted}")'
+        if by == AppiumBy.CLASS_NAME:
+            return f'new UiSelector().className("{quoted}")'
+        return None
+
+    def _ios_scroll_params(self, by: str, value: str) -> Optional[dict]:
+        """Build `mobile: scroll` arguments for a locator, if the strategy maps to one."""
+        AppiumBy = _load_appium().AppiumBy
+        if by == AppiumBy.IOS_PREDICATE:
+            return {"direction": "down", "predicateString": value}
+        if by in (AppiumBy.ACCESSIBILITY_ID, AppiumBy.NAME):
+            return {"direction": "down", "name": value}
+        return None
+
+    def _native_scroll_to(self, locator: str, max_scrolls: int) -> bool:
+        """
+        Scroll to an element using a single native Appium command.
+
+        Returns:
+            True if the element was brought into view, False if the platform
+            or locator strategy has no native scroll support.
+        """
+        by, value = self._get_locator_strategy(locator)
+        platform = (self._caps.get("platformName") or "").lower()
+
+        if platform == "android":
+            selector = self._android_scrollable_selector(by, value)
+            if selector is None:
+                return False
+            element = self.driver.find_element(
+                _load_appium().AppiumBy.ANDROID_UIAUTOMATOR,
+                "new UiScrollable(new UiSelector().scrollable(true))"
+                f".setMaxSearchSwipes({max_scrolls})"
+                f".scrollIntoView({selector})",
+            )
+            return element.is_displayed()
+
+        if platform == "ios":
+            params = self._ios_scroll_params(by, value)
+            if params is None:
+                return False
+            self.driver.execute_script("mobile: scroll", params)
+            return self._find_element(locator).is_displayed()
+
+        return False
+
     def scroll_to_element(self, locator: str, max_scrolls: int = 10) -> None:
-        with allure.step(f"Scroll to element: {locator}"):
+        with reporting.step(f"Scroll to element: {locator}"):
             logger.info(f"Scrolling to element: {locator}")
+            NoSuchElementException = _load_appium().NoSuchElementException
+            try:
+                if self._native_scroll_to(locator, max_scrolls):
+                    logger.info("Element found via native scroll")
+                    return
+            except NoSuchElementException:
+                raise NoSuchElementException(
+                    f"Element {locator} not found after {max_scrolls} scrolls"
+                )
+
             screen_size = self.driver.get_window_size()
             start_x = screen_size["width"] // 2
             start_y = int(screen_size["height"] * 0.8)
@@ -121,61 +272,58 @@ class AppiumMobileActions(BaseMobileActions):
                 f"Element {locator} not found after {max_scrolls} scrolls"
             )
 
-    def get_text(self, locator: str) -> str:
-        with allure.step(f"Get text from: {locator}"):
-            element = self._find_element(locator)
+    def get_text(self, locator: str, element: Optional[WebElement] = None) -> str:
+        with reporting.step(f"Get text from: {locator}"):
+            if element is None:
+                element = self._find_element(locator)
             text = element.text or element.get_attribute("text") or ""
             logger.info(f"Got text from {locator}: {text[:50]}...")
             return text
 
     def is_displayed(self, locator: str) -> bool:
-        with allure.step(f"Check if displayed: {locator}"):
+        with reporting.step(f"Check if displayed: {locator}"):
             try:
                 element = self._find_element(locator)
                 is_visible = element.is_displayed()
                 logger.info(f"Element displayed status for {locator}: {is_visible}")
                 return is_visible
-            except NoSuchElementException:
+            except _load_appium().NoSuchElementException:
                 logger.info(f"Element not found: {locator}")
                 return False
 
     def take_screenshot(self, name: str) -> bytes:
-        with allure.step(f"Take screenshot: {name}"):
+        with reporting.step(f"Take screenshot: {name}"):
             logger.info(f"Taking screenshot: {name}")
             screenshot = self.driver.get_screenshot_as_png()
-            allure.attach(
-                screenshot,
-                name=name,
-                attachment_type=allure.attachment_type.PNG,
-            )
+            reporting.attach(screenshot, name=name, attachment_type="PNG")
             return screenshot
 
-    def wait_for_element(self, locator: str, timeout: float = 30) -> None:
-        with allure.step(f"Wait for element: {locator}"):
+    def wait_for_element(self, locator: str, timeout: float = 30) -> WebElement:
+        with reporting.step(f"Wait for element: {locator}"):
             logger.info(f"Waiting for element: {locator}")
             by, value = self._get_locator_strategy(locator)
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((by, value))
+            return self._wait(timeout).until(
+                _load_appium().EC.presence_of_element_located((by, value))
             )
 
-    def wait_for_element_visible(self, locator: str, timeout: float = 30) -> None:
-        with allure.step(f"Wait for element visible: {locator}"):
+    def wait_for_element_visible(self, locator: str, timeout: float = 30) -> WebElement:
+        with reporting.step(f"Wait for element visible: {locator}"):
             logger.info(f"Waiting for element visible: {locator}")
             by, value = self._get_locator_strategy(locator)
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located((by, value))
+            return self._wait(timeout).until(
+                _load_appium().EC.visibility_of_element_located((by, value))
             )
 
-    def wait_for_element_clickable(self, locator: str, timeout: float = 30) -> None:
-        with allure.step(f"Wait for element clickable: {locator}"):
+    def wait_for_element_clickable(self, locator: str, timeout: float = 30) -> WebElement:
+        with reporting.step(f"Wait for element clickable: {locator}"):
             logger.info(f"Waiting for element clickable: {locator}")
             by, value = self._get_locator_strategy(locator)
-            WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable((by, value))
+            return self._wait(timeout).until(
+                _load_appium().EC.element_to_be_clickable((by, value))
             )
 
     def hide_keyboard(self) -> None:
-        with allure.step("Hide keyboard"):
+        with reporting.step("Hide keyboard"):
             logger.info("Hiding keyboard")
             try:
                 self.driver.hide_keyboard()
@@ -183,8 +331,8 @@ class AppiumMobileActions(BaseMobileActions):
                 logger.warning(f"Could not hide keyboard: {e}")
 
     def get_device_info(self) -> dict:
-        with allure.step("Get device info"):
-            capabilities = self.driver.capabilities
+        with reporting.step("Get device info"):
+            capabilities = self._caps
             info = {
                 "platform_name": capabilities.get("platformName"),
                 "platform_version": capabilities.get("platformVersion"),
@@ -196,50 +344,55 @@ class AppiumMobileActions(BaseMobileActions):
             return info
 
     def long_press(self, locator: str, duration: int = 1000) -> None:
-        with allure.step(f"Long press: {locator}"):
+        with reporting.step(f"Long press: {locator}"):
             logger.info(f"Long pressing element: {locator}")
             element = self._find_element(locator)
-            # Using touch actions for long press
-            from appium.webdriver.common.touch_action import TouchAction
-            action = TouchAction(self.driver)
-            action.long_press(element, duration=duration).release().perform()
+            rect = element.rect
+            x = rect["x"] + rect["width"] // 2
+            y = rect["y"] + rect["height"] // 2
+
+            # W3C pointer actions run natively in a single round-trip
+            appium = _load_appium()
+            builder = appium.ActionBuilder(
+                self.driver,
+                mouse=appium.PointerInput(appium.POINTER_TOUCH, "finger"),
+            )
+            builder.pointer_action.move_to_location(x, y)
+            builder.pointer_action.pointer_down()
+            builder.pointer_action.pause(duration / 1000)
+            builder.pointer_action.release()
+            builder.perform()
 
     def get_attribute(self, locator: str, attribute: str) -> Optional[str]:
-        with allure.step(f"Get attribute '{attribute}' from: {locator}"):
+        with reporting.step(f"Get attribute '{attribute}' from: {locator}"):
             element = self._find_element(locator)
             value = element.get_attribute(attribute)
             logger.info(f"Got attribute {attribute}: {value}")
             return value
 
     def set_value(self, locator: str, value: str) -> None:
-        with allure.step(f"Set value '{value}' on: {locator}"):
+        with reporting.step(f"Set value '{value}' on: {locator}"):
             logger.info(f"Setting value on: {locator}")
             element = self._find_element(locator)
             element.set_value(value)
 
     def back(self) -> None:
-        with allure.step("Press back button"):
+        with reporting.step("Press back button"):
             logger.info("Pressing back button")
             self.driver.back()
 
     def launch_app(self) -> None:
-        with allure.step("Launch app"):
+        with reporting.step("Launch app"):
             logger.info("Launching app")
-            self.driver.activate_app(
-                self.driver.capabilities.get("appPackage")
-                or self.driver.capabilities.get("bundleId")
-            )
+            self.driver.activate_app(self._app_id)
 
     def close_app(self) -> None:
-        with allure.step("Close app"):
+        with reporting.step("Close app"):
             logger.info("Closing app")
-            self.driver.terminate_app(
-                self.driver.capabilities.get("appPackage")
-                or self.driver.capabilities.get("bundleId")
-            )
+            self.driver.terminate_app(self._app_id)
 
     def reset_app(self) -> None:
-        with allure.step("Reset app"):
+        with reporting.step("Reset app"):
             logger.info("Resetting app")
             self.close_app()
             self.launch_app()
@@ -251,7 +404,7 @@ class AppiumMobileActions(BaseMobileActions):
         return self.driver.current_context
 
     def switch_context(self, context: str) -> None:
-        with allure.step(f"Switch to context: {context}"):
+        with reporting.step(f"Switch to context: {context}"):
             logger.info(f"Switching to context: {context}")
             self.driver.switch_to.context(context)
 
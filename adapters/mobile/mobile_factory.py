@@ -13,28 +13,212 @@ Environment variable overrides:
 - MOBILE_APP_PATH: path to APK/IPA
 - MOBILE_APPIUM_SERVER: Appium server URL
 - MOBILE_UDID: device UDID (for real devices)
-- MOBILE_NO_RESET: true, false
-- MOBILE_FULL_RESET: true, false
+- MOBILE_NO_RESET: true/false (also 1/0, yes/no, on/off)
+- MOBILE_FULL_RESET: true/false (also 1/0, yes/no, on/off)
 """
+import functools
 import os
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+import threading
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Callable, ClassVar, Final, Mapping, Tuple
+from dataclasses import dataclass, field, replace
 from loguru import logger
-import allure
 
-try:
-    from appium import webdriver
-    from appium.options.android import UiAutomator2Options
-    from appium.options.ios import XCUITestOptions
-    APPIUM_AVAILABLE = True
-except ImportError:
-    APPIUM_AVAILABLE = False
-    logger.warning("Appium not installed. Mobile testing will not be available.")
+from adapters import reporting
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _load_appium() -> Tuple[Any, Any, Any]:
+    """
+    Import the Appium client on first use.
+    
+    Keeps Appium/Selenium out of module import for runs that never create
+    a mobile driver.
+    
+    Returns:
+        (webdriver module, UiAutomator2Options, XCUITestOptions)
+    
+    Raises:
+        ImportError: If Appium is not installed
+    """
+    try:
+        from appium import webdriver
+        from appium.options.android import UiAutomator2Options
+        from appium.options.ios import XCUITestOptions
+    except ImportError as e:
+        raise ImportError(
+            "Appium is not installed. Install with: pip install Appium-Python-Client"
+        ) from e
+    return webdriver, UiAutomator2Options, XCUITestOptions
+
+
+@functools.lru_cache(maxsize=1)
+def appium_available() -> bool:
+    """Check whether the Appium client can be imported."""
+    try:
+        _load_appium()
+    except ImportError:
+        logger.warning("Appium not installed. Mobile testing will not be available.")
+        return False
+    return True
+
+
+_ENV_KEYS = (
+    "MOBILE_PLATFORM",
+    "MOBILE_APPIUM_SERVER",
+    "MOBILE_DEVICE_NAME",
+    "MOBILE_PLATFORM_VERSION",
+    "MOBILE_APP_PATH",
+    "MOBILE_UDID",
+    "MOBILE_NO_RESET",
+    "MOBILE_FULL_RESET",
+)
+
+
+_TRUE_VALUES: Final = frozenset({"1", "true", "True", "TRUE", "yes", "Yes", "YES", "on", "On", "ON"})
+
+
+def _env_bool(value: str) -> bool:
+    """Parse a boolean environment variable value without allocating."""
+    return value in _TRUE_VALUES
+
+
+# (source key, MobileConfig fields to set, value transform)
+OverrideTable = Tuple[Tuple[str, Tuple[str, ...], Optional[Callable[[Any], Any]]], ...]
+
+_ENV_OVERRIDES: OverrideTable = (
+    ("MOBILE_PLATFORM", ("platform",), str.lower),
+    ("MOBILE_APPIUM_SERVER", ("appium_server",), None),
+    ("MOBILE_DEVICE_NAME", ("android_device_name", "ios_device_name"), None),
+    ("MOBILE_PLATFORM_VERSION", ("android_platform_version", "ios_platform_version"), None),
+    ("MOBILE_APP_PATH", ("android_app_path", "ios_app_path"), None),
+    ("MOBILE_UDID", ("ios_udid",), None),
+    ("MOBILE_NO_RESET", ("no_reset",), _env_bool),
+    ("MOBILE_FULL_RESET", ("full_reset",), _env_bool),
+)
+
+_CLI_OVERRIDES: OverrideTable = (
+    ("platform", ("platform",), str.lower),
+    ("device_name", ("android_device_name", "ios_device_name"), None),
+    ("app_path", ("android_app_path", "ios_app_path"), None),
+    ("udid", ("ios_udid",), None),
+    ("no_reset", ("no_reset",), None),
+)
+
+
+# (Appium capability, MobileConfig field) pairs per platform
+_ANDROID_CAPABILITIES = (
+    ("platformVersion", "android_platform_version"),
+    ("deviceName", "android_device_name"),
+    ("automationName", "android_automation_name"),
+    ("newCommandTimeout", "new_command_timeout"),
+    ("noReset", "no_reset"),
+    ("fullReset", "full_reset"),
+    ("app", "android_app_path"),
+    ("appPackage", "android_app_package"),
+    ("appActivity", "android_app_activity"),
+)
+
+_IOS_CAPABILITIES = (
+    ("platformVersion", "ios_platform_version"),
+    ("deviceName", "ios_device_name"),
+    ("automationName", "ios_automation_name"),
+    ("newCommandTimeout", "new_command_timeout"),
+    ("noReset", "no_reset"),
+    ("fullReset", "full_reset"),
+    ("app", "ios_app_path"),
+    ("bundleId", "ios_bundle_id"),
+    ("udid", "ios_udid"),
+)
+
+
+PLATFORM_ANDROID: Final = "android"
+PLATFORM_IOS: Final = "ios"
+
+
+class _AndroidPlatform:
+    """Android-specific capability and app handling."""
+    
+    name: Final = "Android"
+    capabilities = _ANDROID_CAPABILITIES
+    
+    @staticmethod
+    def device_name(config: "MobileConfig") -> str:
+        return config.android_device_name
+    
+    @staticmethod
+    def app_id(config: "MobileConfig") -> Optional[str]:
+        return config.android_app_package
+
+
+class _IOSPlatform:
+    """iOS-specific capability and app handling."""
+    
+    name: Final = "iOS"
+    capabilities = _IOS_CAPABILITIES
+    
+    @staticmethod
+    def device_name(config: "MobileConfig") -> str:
+        return config.ios_device_name
+    
+    @staticmethod
+    def app_id(config: "MobileConfig") -> Optional[str]:
+        return config.ios_bundle_id
+
+
+_PLATFORMS: Final = {
+    PLATFORM_ANDROID: _AndroidPlatform,
+    PLATFORM_IOS: _IOSPlatform,
+}
+
+
+# Idle Appium sessions keyed by (capabilities, server), reused across factories
+_PoolKey = Tuple[Tuple[Tuple[str, Any], ...], str]
+_DRIVER_POOL: Dict[_PoolKey, Any] = {}
+_DRIVER_POOL_LOCK = threading.Lock()
+
+
+def _cap_tuple(caps: Mapping[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Canonical, hashable form of a capabilities mapping."""
+    return tuple(sorted((k, v) for k, v in caps.items() if v is not None))
+
+
+def _is_driver_alive(driver: Any) -> bool:
+    """Check that a pooled driver's session is still usable."""
+    if driver.session_id is None:
+        return False
+    try:
+        driver.current_context
+        return True
+    except Exception:
+        return False
+
+
+def quit_pooled_drivers() -> None:
+    """Quit every idle pooled driver session."""
+    with _DRIVER_POOL_LOCK:
+        drivers = list(_DRIVER_POOL.values())
+        _DRIVER_POOL.clear()
+    
+    for driver in drivers:
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Error closing pooled driver: {e}")
+    
+    if drivers:
+        logger.info(f"Closed {len(drivers)} pooled mobile driver(s)")
+
+
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> Dict[str, Optional[str]]:
+    """Read the mobile override environment variables once per process."""
+    return {key: os.environ.get(key) for key in _ENV_KEYS}
+
+
+@dataclass(frozen=True, slots=True)
 class MobileConfig:
-    """Mobile configuration with all options."""
+    """Mobile configuration with all options (immutable once built)."""
     
     # Platform settings
     platform: str = "android"  # android or ios
@@ -65,6 +249,30 @@ class MobileConfig:
     # Artifact settings
     screenshot_on_failure: bool = True
     
+    # Defaults for each config section, merged with the provided values once
+    _CORE_DEFAULTS: ClassVar[Dict[str, Any]] = {
+        "appium_server": "http://localhost:4723",
+        "automation_name": "UiAutomator2",
+        "new_command_timeout": 300,
+        "no_reset": False,
+        "full_reset": False,
+    }
+    _ANDROID_DEFAULTS: ClassVar[Dict[str, Any]] = {
+        "platform": "android",
+        "device_name": "emulator-5554",
+        "platform_version": "13",
+        "app_path": None,
+        "app_package": None,
+        "app_activity": None,
+    }
+    _IOS_DEFAULTS: ClassVar[Dict[str, Any]] = {
+        "device_name": "iPhone 14",
+        "platform_version": "16.0",
+        "app_path": None,
+        "bundle_id": None,
+        "udid": None,
+    }
+    
     @classmethod
     def from_dict(
         cls,
@@ -72,37 +280,37 @@ class MobileConfig:
         data_config: Dict[str, Any],
     ) -> "MobileConfig":
         """Create MobileConfig from core and data config dictionaries."""
-        mobile_core = core_config.get("mobile", {})
         mobile_data = data_config.get("mobile_app", {})
-        android_data = mobile_data.get("android", {})
-        ios_data = mobile_data.get("ios", {})
+        mobile_core = {**cls._CORE_DEFAULTS, **core_config.get("mobile", {})}
+        android = {**cls._ANDROID_DEFAULTS, **mobile_data.get("android", {})}
+        ios = {**cls._IOS_DEFAULTS, **mobile_data.get("ios", {})}
         
         return cls(
             # Platform
-            platform=android_data.get("platform", "android"),
-            appium_server=mobile_core.get("appium_server", "http://localhost:4723"),
+            platform=android["platform"],
+            appium_server=mobile_core["appium_server"],
             
             # Android
-            android_device_name=android_data.get("device_name", "emulator-5554"),
-            android_platform_version=android_data.get("platform_version", "13"),
-            android_app_path=android_data.get("app_path"),
-            android_app_package=android_data.get("app_package"),
-            android_app_activity=android_data.get("app_activity"),
-            android_automation_name=mobile_core.get("automation_name", "UiAutomator2"),
+            android_device_name=android["device_name"],
+            android_platform_version=android["platform_version"],
+            android_app_path=android["app_path"],
+            android_app_package=android["app_package"],
+            android_app_activity=android["app_activity"],
+            android_automation_name=mobile_core["automation_name"],
             
             # iOS
-            ios_device_name=ios_data.get("device_name", "iPhone 14"),
-            ios_platform_version=ios_data.get("platform_version", "16.0"),
-            ios_app_path=ios_data.get("app_path"),
-            ios_bundle_id=ios_data.get("bundle_id"),
-            ios_udid=ios_data.get("udid"),
+            ios_device_name=ios["device_name"],
+            ios_platform_version=ios["platform_version"],
+            ios_app_path=ios["app_path"],
+            ios_bundle_id=ios["bundle_id"],
+            ios_udid=ios["udid"],
             ios_automation_name="XCUITest",
             
             # Common
-            new_command_timeout=mobile_core.get("new_command_timeout", 300),
+            new_command_timeout=mobile_core["new_command_timeout"],
             implicit_wait=data_config.get("timeouts", {}).get("implicit_wait", 10),
-            no_reset=mobile_core.get("no_reset", False),
-            full_reset=mobile_core.get("full_reset", False),
+            no_reset=mobile_core["no_reset"],
+            full_reset=mobile_core["full_reset"],
             screenshot_on_failure=core_config.get("browser", {}).get("screenshot_on_failure", True),
         )
 
@@ -122,7 +330,7 @@ class MobileFactory:
         factory = MobileFactory(core_config, data_config)
         driver = factory.create_driver()
         # ... use driver ...
-        factory.close()
+        factory.close()  # or release() to pool the session for reuse
     """
     
     def __init__(
@@ -139,20 +347,23 @@ class MobileFactory:
             data_config: Data configuration dictionary
             cli_overrides: Optional CLI parameter overrides
         """
-        if not APPIUM_AVAILABLE:
-            raise ImportError(
-                "Appium is not installed. Install with: pip install Appium-Python-Client"
-            )
-        
         self._driver = None
+        self._pool_key: Optional[_PoolKey] = None
+        self._options = None
         self._core_config = core_config
         self._data_config = data_config
         
         # Build configuration with overrides
         self.config = self._build_config(core_config, data_config, cli_overrides or {})
-        
-        logger.info(f"MobileFactory initialized: {self.config.platform}, "
-                   f"device={self.get_device_name()}")
+        self._is_android = self.config.platform == PLATFORM_ANDROID
+        # Anything other than Android is treated as iOS
+        self._platform = _PLATFORMS.get(self.config.platform, _IOSPlatform)
+        
+        logger.opt(lazy=True).info(
+            "MobileFactory initialized: {}, device={}",
+            lambda: self.config.platform,
+            self.get_device_name,
+        )
     
     def _build_config(
         self,
@@ -164,90 +375,54 @@ class MobileFactory:
         # Create base config
         config = MobileConfig.from_dict(core_config, data_config)
         
-        # Apply environment variable overrides
-        self._apply_env_overrides(config)
+        # Collect environment variable overrides, then CLI overrides
+        changes: Dict[str, Any] = {}
+        applied = self._apply_env_overrides(changes)
+        applied += self._apply_cli_overrides(changes, cli_overrides)
+        if applied:
+            logger.info("Config overrides applied: {}", ", ".join(applied))
         
-        # Apply CLI overrides
-        self._apply_cli_overrides(config, cli_overrides)
+        # Normalize once so platform checks are plain comparisons
+        changes["platform"] = changes.get("platform", config.platform).lower()
         
-        return config
+        return replace(config, **changes)
     
-    def _apply_env_overrides(self, config: MobileConfig) -> None:
-        """Apply environment variable overrides."""
-        # Platform override
-        if os.environ.get("MOBILE_PLATFORM"):
-            config.platform = os.environ["MOBILE_PLATFORM"].lower()
-            logger.info(f"Environment override: platform={config.platform}")
-        
-        # Appium server override
-        if os.environ.get("MOBILE_APPIUM_SERVER"):
-            config.appium_server = os.environ["MOBILE_APPIUM_SERVER"]
-            logger.info(f"Environment override: appium_server={config.appium_server}")
-        
-        # Device name override
-        if os.environ.get("MOBILE_DEVICE_NAME"):
-            device = os.environ["MOBILE_DEVICE_NAME"]
-            config.android_device_name = device
-            config.ios_device_name = device
-            logger.info(f"Environment override: device_name={device}")
-        
-        # Platform version override
-        if os.environ.get("MOBILE_PLATFORM_VERSION"):
-            version = os.environ["MOBILE_PLATFORM_VERSION"]
-            config.android_platform_version = version
-            config.ios_platform_version = version
-            logger.info(f"Environment override: platform_version={version}")
-        
-        # App path override
-        if os.environ.get("MOBILE_APP_PATH"):
-            app_path = os.environ["MOBILE_APP_PATH"]
-            config.android_app_path = app_path
-            config.ios_app_path = app_path
-            logger.info(f"Environment override: app_path={app_path}")
-        
-        # UDID override (for real devices)
-        if os.environ.get("MOBILE_UDID"):
-            config.ios_udid = os.environ["MOBILE_UDID"]
-            logger.info(f"Environment override: udid={config.ios_udid}")
-        
-        # Reset options
-        if os.environ.get("MOBILE_NO_RESET"):
-            config.no_reset = os.environ["MOBILE_NO_RESET"].lower() == "true"
-            logger.info(f"Environment override: no_reset={config.no_reset}")
+    @staticmethod
+    def _apply_overrides(
+        changes: Dict[str, Any],
+        values: Dict[str, Any],
+        table: OverrideTable,
+        source: str,
+    ) -> List[str]:
+        """
+        Collect config field changes from a key/value source using an override table.
         
-        if os.environ.get("MOBILE_FULL_RESET"):
-            config.full_reset = os.environ["MOBILE_FULL_RESET"].lower() == "true"
-            logger.info(f"Environment override: full_reset={config.full_reset}")
+        Returns:
+            Descriptions of the applied overrides, for a single summary log line
+        """
+        applied = []
+        for key, fields, transform in table:
+            value = values.get(key)
+            if value is None or value == "":
+                continue
+            if transform is not None:
+                value = transform(value)
+            for name in fields:
+                changes[name] = value
+            applied.append(f"{source} {key}={value}")
+        return applied
+    
+    def _apply_env_overrides(self, changes: Dict[str, Any]) -> List[str]:
+        """Apply environment variable overrides."""
+        return self._apply_overrides(changes, _env_snapshot(), _ENV_OVERRIDES, "env")
     
     def _apply_cli_overrides(
         self,
-        config: MobileConfig,
+        changes: Dict[str, Any],
         cli_overrides: Dict[str, Any],
-    ) -> None:
+    ) -> List[str]:
         """Apply CLI parameter overrides."""
-        if cli_overrides.get("platform"):
-            config.platform = cli_overrides["platform"].lower()
-            logger.info(f"CLI override: platform={config.platform}")
-        
-        if cli_overrides.get("device_name"):
-            device = cli_overrides["device_name"]
-            config.android_device_name = device
-            config.ios_device_name = device
-            logger.info(f"CLI override: device_name={device}")
-        
-        if cli_overrides.get("app_path"):
-            app_path = cli_overrides["app_path"]
-            config.android_app_path = app_path
-            config.ios_app_path = app_path
-            logger.info(f"CLI override: app_path={app_path}")
-        
-        if cli_overrides.get("udid"):
-            config.ios_udid = cli_overrides["udid"]
-            logger.info(f"CLI override: udid={config.ios_udid}")
-        
-        if cli_overrides.get("no_reset") is not None:
-            config.no_reset = cli_overrides["no_reset"]
-            logger.info(f"CLI override: no_reset={config.no_reset}")
+        return self._apply_overrides(changes, cli_overrides, _CLI_OVERRIDES, "cli")
     
     @property
     def platform(self) -> str:
@@ -257,62 +432,34 @@ class MobileFactory:
     @property
     def is_android(self) -> bool:
         """Check if running Android tests."""
-        return self.config.platform.lower() == "android"
+        return self._is_android
     
     @property
     def is_ios(self) -> bool:
         """Check if running iOS tests."""
-        return self.config.platform.lower() == "ios"
+        return self.config.platform == PLATFORM_IOS
     
     def get_device_name(self) -> str:
         """Get the configured device name."""
-        if self.is_android:
-            return self.config.android_device_name
-        return self.config.ios_device_name
+        return self._platform.device_name(self.config)
+    
+    @functools.cached_property
+    def capabilities(self) -> Mapping[str, Any]:
+        """Appium capabilities for the configured platform, built once."""
+        caps = {"platformName": self._platform.name}
+        
+        # None values are left out so Appium falls back to its own defaults
+        for cap, attr in self._platform.capabilities:
+            value = getattr(self.config, attr)
+            if value is not None:
+                caps[cap] = value
+        
+        return MappingProxyType(caps)
     
-    def get_capabilities(self) -> Dict[str, Any]:
+    def get_capabilities(self) -> Mapping[str, Any]:
         """Get Appium capabilities based on platform."""
-        if self.is_android:
-            caps = {
-                "platformName": "Android",
-                "platformVersion": self.config.android_platform_version,
-                "deviceName": self.config.android_device_name,
-                "automationName": self.config.android_automation_name,
-                "newCommandTimeout": self.config.new_command_timeout,
-                "noReset": self.config.no_reset,
-                "fullReset": self.config.full_reset,
-            }
-            
-            if self.config.android_app_path:
-                caps["app"] = self.config.android_app_path
-            if self.config.android_app_package:
-                caps["appPackage"] = self.config.android_app_package
-            if self.config.android_app_activity:
-                caps["appActivity"] = self.config.android_app_activity
-            
-            return caps
-        
-        else:  # iOS
-            caps = {
-                "platformName": "iOS",
-                "platformVersion": self.config.ios_platform_version,
-                "deviceName": self.config.ios_device_name,
-                "automationName": self.config.ios_automation_name,
-                "newCommandTimeout": self.config.new_command_timeout,
-                "noReset": self.config.no_reset,
-                "fullReset": self.config.full_reset,
-            }
-            
-            if self.config.ios_app_path:
-                caps["app"] = self.config.ios_app_path
-            if self.config.ios_bundle_id:
-                caps["bundleId"] = self.config.ios_bundle_id
-            if self.config.ios_udid:
-                caps["udid"] = self.config.ios_udid
-            
-            return caps
+        return self.capabilities
     
-    @allure.step("Create Appium driver: {self.config.platform}")
     def create_driver(self):
         """
         Create Appium driver with configured capabilities.
@@ -320,42 +467,57 @@ class MobileFactory:
         Returns:
             Appium WebDriver instance
         """
-        if self._driver is not None:
+        with reporting.step(f"Create Appium driver: {self.config.platform}"):
+            if self._driver is not None:
+                return self._driver
+            
+            cap_tuple = _cap_tuple(self.capabilities)
+            capabilities = dict(cap_tuple)
+            self._pool_key = (cap_tuple, self.config.appium_server)
+            
+            with _DRIVER_POOL_LOCK:
+                pooled = _DRIVER_POOL.pop(self._pool_key, None)
+            
+            if pooled is not None and _is_driver_alive(pooled):
+                logger.info(f"Reusing pooled {self.config.platform} driver")
+                self._driver = pooled
+            else:
+                logger.info(f"Creating {self.config.platform} driver")
+                logger.opt(lazy=True).debug(
+                    "Capabilities: {}", lambda c=capabilities: repr(c)
+                )
+            
+                webdriver, UiAutomator2Options, XCUITestOptions = _load_appium()
+            
+                # Options only depend on the frozen config, so build them once
+                if self._options is None:
+                    options_cls = UiAutomator2Options if self._is_android else XCUITestOptions
+                    self._options = options_cls().load_capabilities(capabilities)
+            
+                self._driver = webdriver.Remote(
+                    command_executor=self.config.appium_server,
+                    options=self._options,
+                )
+            
+            # Set implicit wait (pooled drivers may already carry it)
+            if getattr(self._driver, "_impl_wait_set", None) != self.config.implicit_wait:
+                self._driver.implicitly_wait(self.config.implicit_wait)
+                self._driver._impl_wait_set = self.config.implicit_wait
+            
+            # Attach capabilities to Allure report
+            if reporting.ALLURE_ENABLED:
+                reporting.attach(
+                    "Platform: %s\nDevice: %s\nAppium Server: %s\nCapabilities: %s" % (
+                        self.config.platform,
+                        self.get_device_name(),
+                        self.config.appium_server,
+                        capabilities,
+                    ),
+                    name="Mobile Configuration",
+                    attachment_type="TEXT",
+                )
+            
             return self._driver
-        
-        capabilities = self.get_capabilities()
-        
-        # Filter out None values
-        capabilities = {k: v for k, v in capabilities.items() if v is not None}
-        
-        logger.info(f"Creating {self.config.platform} driver")
-        logger.debug(f"Capabilities: {capabilities}")
-        
-        # Create appropriate options
-        if self.is_android:
-            options = UiAutomator2Options().load_capabilities(capabilities)
-        else:
-            options = XCUITestOptions().load_capabilities(capabilities)
-        
-        self._driver = webdriver.Remote(
-            command_executor=self.config.appium_server,
-            options=options,
-        )
-        
-        # Set implicit wait
-        self._driver.implicitly_wait(self.config.implicit_wait)
-        
-        # Attach capabilities to Allure report
-        allure.attach(
-            f"Platform: {self.config.platform}\n"
-            f"Device: {self.get_device_name()}\n"
-            f"Appium Server: {self.config.appium_server}\n"
-            f"Capabilities: {capabilities}",
-            name="Mobile Configuration",
-            attachment_type=allure.attachment_type.TEXT,
-        )
-        
-        return self._driver
     
     def get_driver(self):
         """Get existing driver or create new one."""
@@ -370,11 +532,7 @@ class MobileFactory:
         
         try:
             screenshot = self._driver.get_screenshot_as_png()
-            allure.attach(
-                screenshot,
-                name=name,
-                attachment_type=allure.attachment_type.PNG,
-            )
+            reporting.attach(screenshot, name=name, attachment_type="PNG")
             logger.info(f"Screenshot captured: {name}")
             return screenshot
         except Exception as e:
@@ -414,20 +572,36 @@ class MobileFactory:
         """Reset the app to initial state."""
         if self._driver:
             try:
-                if self.is_android:
-                    package = self.config.android_app_package
-                    if package:
-                        self._driver.terminate_app(package)
-                        self._driver.activate_app(package)
-                else:
-                    bundle_id = self.config.ios_bundle_id
-                    if bundle_id:
-                        self._driver.terminate_app(bundle_id)
-                        self._driver.activate_app(bundle_id)
+                app_id = self._platform.app_id(self.config)
+                if app_id:
+                    self._driver.terminate_app(app_id)
+                    self._driver.activate_app(app_id)
                 logger.info("App reset completed")
             except Exception as e:
                 logger.warning(f"Failed to reset app: {e}")
     
+    def release(self) -> None:
+        """
+        Return the driver to the session pool instead of quitting it.
+        
+        The app is reset so the next user starts clean; the Appium session
+        itself stays open until quit_pooled_drivers() is called.
+        """
+        if self._driver:
+            driver = self._driver
+            try:
+                self.reset_app()
+                with _DRIVER_POOL_LOCK:
+                    displaced = _DRIVER_POOL.get(self._pool_key)
+                    _DRIVER_POOL[self._pool_key] = driver
+                if displaced is not None and displaced is not driver:
+                    displaced.quit()
+                logger.info("Mobile driver returned to pool")
+            except Exception as e:
+                logger.warning(f"Error releasing driver: {e}")
+            finally:
+                self._driver = None
+    
     def close(self) -> None:
         """Close driver and cleanup resources."""
         if self._driver:
@@ -448,8 +622,36 @@ class MobileFactory:
         self.close()
 
 
-# Singleton instance for session-scoped usage
-_factory_instance: Optional[MobileFactory] = None
+# Factory instances for session-scoped usage, keyed by resolved (platform, appium_server)
+_factories: Dict[Tuple[str, str], MobileFactory] = {}
+_factories_lock = threading.Lock()
+# Returned by a get_mobile_factory() call without any config
+_last_factory: Optional[MobileFactory] = None
+
+
+def _factory_key(
+    core_config: Dict[str, Any],
+    data_config: Dict[str, Any],
+    cli_overrides: Dict[str, Any],
+) -> Tuple[str, str]:
+    """
+    Resolve just (platform, appium_server) with the precedence MobileFactory
+    uses (CLI, then environment, then config files, then defaults).
+    """
+    env = _env_snapshot()
+    android = data_config.get("mobile_app", {}).get("android", {})
+    platform = (
+        cli_overrides.get("platform")
+        or env.get("MOBILE_PLATFORM")
+        or android.get("platform")
+        or MobileConfig._ANDROID_DEFAULTS["platform"]
+    )
+    appium_server = (
+        env.get("MOBILE_APPIUM_SERVER")
+        or core_config.get("mobile", {}).get("appium_server")
+        or MobileConfig._CORE_DEFAULTS["appium_server"]
+    )
+    return platform.lower(), appium_server
 
 
 def get_mobile_factory(
@@ -461,6 +663,11 @@ def get_mobile_factory(
     """
     Get or create a MobileFactory instance.
     
+    Factories are shared per resolved (platform, appium_server), after env
+    and CLI overrides, so multi-device sessions do not replace each other.
+    Called without any config, returns the most recently created factory.
+    Creation is thread-safe.
+    
     Args:
         core_config: Core configuration dictionary
         data_config: Data configuration dictionary
@@ -470,23 +677,45 @@ def get_mobile_factory(
     Returns:
         MobileFactory instance
     """
-    global _factory_instance
+    global _last_factory
+    
+    no_config = core_config is None and data_config is None and cli_overrides is None
+    if no_config and not force_new and _last_factory is not None:
+        return _last_factory
     
-    if _factory_instance is None or force_new:
-        if core_config is None:
-            core_config = {}
-        if data_config is None:
-            data_config = {}
-        _factory_instance = MobileFactory(core_config, data_config, cli_overrides)
+    core_config = core_config or {}
+    data_config = data_config or {}
+    cli_overrides = cli_overrides or {}
+    key = _factory_key(core_config, data_config, cli_overrides)
     
-    return _factory_instance
+    # Fast path without the lock
+    factory = _factories.get(key)
+    if factory is not None and not force_new:
+        return factory
+    
+    with _factories_lock:
+        factory = _factories.get(key)
+        if factory is None or force_new:
+            factory = MobileFactory(core_config, data_config, cli_overrides)
+            _factories[key] = factory
+            _last_factory = factory
+    
+    return factory
 
 
 def close_mobile_factory() -> None:
-    """Close the global mobile factory instance."""
-    global _factory_instance
+    """Close all shared mobile factory instances and quit all pooled drivers."""
+    global _last_factory
     
-    if _factory_instance:
-        _factory_instance.close()
-        _factory_instance = None
-
+    with _factories_lock:
+        factories = list(_factories.values())
+        _factories.clear()
+        _last_factory = None
+    
+    for factory in factories:
+        factory.close()
+    
+    quit_pooled_drivers()
+    
+    # Let the next factory pick up environment changes
+    _env_snapshot.cache_clear()
@@ -0,0 +1,47 @@
+"""
+Allure reporting helpers shared by the adapters.
+
+Allure is imported on first use and every helper becomes a no-op when
+reporting is disabled with ``ALLURE_ENABLED=0``.
+"""
+import contextlib
+import os
+from typing import Any, ContextManager, Optional
+
+ALLURE_ENABLED = os.environ.get("ALLURE_ENABLED", "1") != "0"
+
+
+def step(title: str, *args: Any) -> ContextManager:
+    """
+    Return an Allure step context, or a no-op context when disabled.
+
+    ``title`` may contain ``{}`` placeholders filled from ``args``; the
+    formatting only happens when reporting is enabled.
+    """
+    if not ALLURE_ENABLED:
+        return contextlib.nullcontext()
+    import allure
+    return allure.step(title.format(*args) if args else title)
+
+
+def attach(
+    body: Any,
+    name: str,
+    attachment_type: str,
+    extension: Optional[str] = None,
+) -> None:
+    """
+    Attach data to the Allure report.
+
+    Args:
+        body: Attachment content (str or bytes)
+        name: Attachment name shown in the report
+        attachment_type: Name of an ``allure.attachment_type`` member
+            (e.g. "PNG", "JSON") or a raw MIME type
+        extension: Optional file extension for raw MIME types
+    """
+    if not ALLURE_ENABLED:
+        return
+    import allure
+    resolved = getattr(allure.attachment_type, attachment_type, attachment_type)
+    allure.attach(body, name=name, attachment_type=resolved, extension=extension)
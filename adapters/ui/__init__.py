@@ -1,11 +1,37 @@
 # UI adapters module
-from .ui_actions_impl import PlaywrightUIActions
-from .browser_factory import BrowserFactory, BrowserConfig, get_browser_factory, close_browser_factory
+# Exports are resolved lazily (PEP 562) so importing this package does not
+# pull in Playwright until a UI class is actually used.
+import importlib
+
+_EXPORTS = {
+    "PlaywrightUIActions": ".ui_actions_impl",
+    "BatchedUIActions": ".ui_actions_impl",
+    "BrowserFactory": ".browser_factory",
+    "BrowserConfig": ".browser_factory",
+    "get_browser_factory": ".browser_factory",
+    "close_browser_factory": ".browser_factory",
+    "reset_env_cache": ".browser_factory",
+}
 
 __all__ = [
     "PlaywrightUIActions",
+    "BatchedUIActions",
     "BrowserFactory",
     "BrowserConfig",
     "get_browser_factory",
     "close_browser_factory",
+    "reset_env_cache",
 ]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
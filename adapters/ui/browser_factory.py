@@ -5,15 +5,67 @@ Default parameters are overridden by below items
 2. Environment variables (for Jenkins/CI)
 3. CLI parameters (pytest command line)
 """
+import functools
 import os
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
-from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Playwright
+import queue
+import tempfile
+from collections import ChainMap
+from typing import Optional, Dict, Any, Callable, Mapping, Tuple
+from dataclasses import dataclass
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, BrowserType, Page, Playwright
 from loguru import logger
-import allure
 
+from adapters import reporting
 
-@dataclass
+
+def _str_to_bool(value: str) -> bool:
+    return value.lower() == "true"
+
+
+# (environment variable, config key, converter); viewport sizes use flat
+# keys so overrides never touch the caller's nested viewport dict
+_ENV_MAPPINGS: Tuple[Tuple[str, str, Callable[[str], Any]], ...] = (
+    ("BROWSER_TYPE", "type", str),
+    ("BROWSER_HEADLESS", "headless", _str_to_bool),
+    ("BROWSER_SLOW_MO", "slow_mo", int),
+    ("BROWSER_TIMEOUT", "timeout", int),
+    ("BROWSER_VIEWPORT_WIDTH", "viewport_width", int),
+    ("BROWSER_VIEWPORT_HEIGHT", "viewport_height", int),
+)
+_ENV_KEYS = tuple(env_var for env_var, _, _ in _ENV_MAPPINGS)
+
+BROWSER_TYPES = ("chromium", "firefox", "webkit")
+
+# Trace zips are staged on tmpfs when available to avoid a physical disk write
+_TRACE_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+# Resolved configs keyed by (config, cli overrides, env snapshot)
+_CONFIG_CACHE: Dict[Tuple[Any, Any, Any], "BrowserConfig"] = {}
+_CONFIG_CACHE_SIZE = 32
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a (possibly nested) config value."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Read the browser override environment variables once per process."""
+    return tuple((key, os.environ.get(key)) for key in _ENV_KEYS)
+
+
+def reset_env_cache() -> None:
+    """Re-read BROWSER_* environment variables on the next factory build."""
+    _env_snapshot.cache_clear()
+
+
+@dataclass(frozen=True, slots=True)
 class BrowserConfig:
     browser_type: str = "chromium"
     headless: bool = True
@@ -24,30 +76,115 @@ class BrowserConfig:
     screenshot_on_failure: bool = True
     video_on_failure: bool = False
     trace_on_failure: bool = True
-    args: List[str] = field(default_factory=list)
+    context_pool_size: int = 0
+    args: Tuple[str, ...] = ()
     
     @classmethod
-    def from_dict(cls, config: Dict[str, Any]) -> "BrowserConfig":
-        """Create BrowserConfig from dictionary."""
-        viewport = config.get("viewport", {})
+    def from_dict(cls, config: Mapping[str, Any]) -> "BrowserConfig":
+        """Create BrowserConfig from a mapping (flat viewport_* keys win)."""
+        # Only keys actually present are passed; the field defaults above
+        # fill in the rest
+        kwargs = {key: config[key] for key in _PASSTHROUGH_FIELDS if key in config}
+        viewport = config.get("viewport") or {}
+        for key in ("width", "height"):
+            if key in viewport:
+                kwargs.setdefault(f"viewport_{key}", viewport[key])
+        
         browser_type = config.get("type") or config.get("default", "chromium")
         
         # Get browser-specific args
         browser_specific = config.get(browser_type, {})
         args = browser_specific.get("args", [])
         
-        return cls(
-            browser_type=browser_type,
-            headless=config.get("headless", True),
-            slow_mo=config.get("slow_mo", 0),
-            timeout=config.get("timeout", 30000),
-            viewport_width=viewport.get("width", 1920),
-            viewport_height=viewport.get("height", 1080),
-            screenshot_on_failure=config.get("screenshot_on_failure", True),
-            video_on_failure=config.get("video_on_failure", False),
-            trace_on_failure=config.get("trace_on_failure", True),
-            args=args,
-        )
+        return cls(browser_type=browser_type, args=tuple(args), **kwargs)
+
+
+# Config keys that map one-to-one onto BrowserConfig fields
+_PASSTHROUGH_FIELDS = tuple(
+    name for name in BrowserConfig.__dataclass_fields__
+    if name not in ("browser_type", "args")
+)
+
+
+class ContextPool:
+    """
+    Bounded pool of reusable browser contexts (opt-in, off by default).
+    
+    Contexts are reset (pages, routes, localStorage, cookies, permissions,
+    extra headers, geolocation, offline mode) when released and handed out
+    again, so tests after the first skip context creation. Init scripts,
+    IndexedDB and service workers are not reset, so only enable pooling for
+    suites that do not use them. Only contexts created by the pool itself
+    are pooled; anything else, and contexts released while the pool is full
+    or that cannot be reset, are closed.
+    """
+    
+    def __init__(self, factory: "BrowserFactory", size: int):
+        self._factory = factory
+        self._size = size
+        self._idle: "queue.Queue[BrowserContext]" = queue.Queue(maxsize=max(size, 0))
+        # Contexts created by acquire(), keyed by id() like the factory's
+        self._owned: Dict[int, BrowserContext] = {}
+    
+    def acquire(self) -> BrowserContext:
+        """Check out an idle context, creating one if none is available."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            context = self._factory.create_context()
+            self._owned[id(context)] = context
+            return context
+    
+    def release(self, context: BrowserContext) -> None:
+        """Reset a context and return it to the pool."""
+        if self._size > 0 and self._owned.get(id(context)) is context:
+            try:
+                self._reset(context)
+                self._idle.put_nowait(context)
+                return
+            except queue.Full:
+                pass
+            except Exception as e:
+                logger.warning("Failed to reset pooled context: {}", e)
+        self._owned.pop(id(context), None)
+        self._factory.close_context(context)
+    
+    def _reset(self, context: BrowserContext) -> None:
+        self._factory.discard_trace(context)
+        # Closing the pages also discards their sessionStorage
+        for page in context.pages:
+            self._factory.close_page(page)
+        context.unroute_all()
+        self._clear_origin_storage(context)
+        context.clear_cookies()
+        context.clear_permissions()
+        context.set_extra_http_headers({})
+        context.set_geolocation(None)
+        context.set_offline(False)
+    
+    @staticmethod
+    def _clear_origin_storage(context: BrowserContext) -> None:
+        """
+        Clear localStorage for every origin the previous test wrote to.
+        
+        The test's pages are already closed, so a scratch page visits each
+        origin with every request fulfilled locally (nothing hits the
+        network). Raises if storage survives, so the context is closed
+        rather than pooled.
+        """
+        origins = [entry["origin"] for entry in context.storage_state()["origins"]]
+        if not origins:
+            return
+        page = context.new_page()
+        try:
+            page.route("**/*", lambda route: route.fulfill(status=200, content_type="text/html", body=""))
+            for origin in origins:
+                page.goto(origin)
+                page.evaluate("() => localStorage.clear()")
+        finally:
+            page.close()
+        if context.storage_state()["origins"]:
+            raise RuntimeError("localStorage could not be cleared")
 
 
 class BrowserFactory:
@@ -64,47 +201,69 @@ class BrowserFactory:
             cli_overrides: Optional CLI parameter overrides
         """
         self._playwright: Optional[Playwright] = None
+        self._launcher: Optional[BrowserType] = None
         self._browser: Optional[Browser] = None
-        self._contexts: List[BrowserContext] = []
-        self._pages: List[Page] = []
+        # Open contexts/pages keyed by id() for O(1) removal
+        self._contexts: Dict[int, BrowserContext] = {}
+        self._pages: Dict[int, Page] = {}
+        # Contexts with a running trace, keyed by id() like _contexts
+        self._tracing: Dict[int, BrowserContext] = {}
+        # Default context/page, created on first access via the properties
+        self._context: Optional[BrowserContext] = None
+        self._page: Optional[Page] = None
+        self._context_pool: Optional[ContextPool] = None
+        # Authenticated cookies/localStorage captured once and reused
+        self._storage_state: Optional[Dict[str, Any]] = None
         
         # Build configuration with overrides
         self.config = self._build_config(config, cli_overrides or {})
-        
-        logger.info(f"BrowserFactory initialized: {self.config.browser_type}, "
-                   f"headless={self.config.headless}")
+        if self.config.browser_type not in BROWSER_TYPES:
+            raise ValueError(
+                f"Unknown browser_type: {self.config.browser_type}. "
+                f"Expected one of: {', '.join(BROWSER_TYPES)}"
+            )
+        self._launch_options = self._build_launch_options()
+        self._context_options = self._build_context_options()
+        
+        logger.info(
+            "BrowserFactory initialized: {}, headless={}",
+            self.config.browser_type,
+            self.config.headless,
+        )
     
     def _build_config(
         self,
         config: Dict[str, Any],
         cli_overrides: Dict[str, Any],
     ) -> BrowserConfig:
-        merged = dict(config)
-        self._apply_env_overrides(merged)
-        self._apply_cli_overrides(merged, cli_overrides)
-        return BrowserConfig.from_dict(merged)
+        env = _env_snapshot()
+        key = (_freeze(config), _freeze(cli_overrides), env)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None:
+            return cached
+        
+        env_layer: Dict[str, Any] = {}
+        cli_layer: Dict[str, Any] = {}
+        self._apply_env_overrides(env_layer, dict(env))
+        self._apply_cli_overrides(cli_layer, cli_overrides)
+        resolved = BrowserConfig.from_dict(ChainMap(cli_layer, env_layer, config))
+        
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+        _CONFIG_CACHE[key] = resolved
+        return resolved
     
-    def _apply_env_overrides(self, config: Dict[str, Any]) -> None:
+    def _apply_env_overrides(
+        self,
+        config: Dict[str, Any],
+        env: Dict[str, Optional[str]],
+    ) -> None:
         """Apply environment variable overrides."""
-        env_mappings = {
-            "BROWSER_TYPE": ("type", str),
-            "BROWSER_HEADLESS": ("headless", lambda x: x.lower() == "true"),
-            "BROWSER_SLOW_MO": ("slow_mo", int),
-            "BROWSER_TIMEOUT": ("timeout", int),
-            "BROWSER_VIEWPORT_WIDTH": ("viewport.width", int),
-            "BROWSER_VIEWPORT_HEIGHT": ("viewport.height", int),
-        }
-        
-        for env_var, (config_key, converter) in env_mappings.items():
-            value = os.environ.get(env_var)
+        for env_var, config_key, converter in _ENV_MAPPINGS:
+            value = env.get(env_var)
             if value:
-                if "." in config_key:
-                    # Nested key like viewport.width
-                    parts = config_key.split(".")
-                    config.setdefault(parts[0], {})[parts[1]] = converter(value)
-                else:
-                    config[config_key] = converter(value)
-                logger.info(f"Environment override: {env_var}={value}")
+                config[config_key] = converter(value)
+                logger.info("Environment override: {}={}", env_var, value)
     
     def _apply_cli_overrides(
         self,
@@ -112,20 +271,20 @@ class BrowserFactory:
         cli_overrides: Dict[str, Any],
     ) -> None:
         """Apply CLI parameter overrides."""
-        if cli_overrides.get("browser_type"):
-            config["type"] = cli_overrides["browser_type"]
-            logger.info(f"CLI override: browser_type={cli_overrides['browser_type']}")
+        if browser_type := cli_overrides.get("browser_type"):
+            config["type"] = browser_type
+            logger.info("CLI override: browser_type={}", browser_type)
         
         if cli_overrides.get("headed"):
             config["headless"] = False
             logger.info("CLI override: headed mode enabled")
         
-        if cli_overrides.get("headless") is not None:
-            config["headless"] = cli_overrides["headless"]
+        if (headless := cli_overrides.get("headless")) is not None:
+            config["headless"] = headless
         
-        if cli_overrides.get("slow_mo") is not None:
-            config["slow_mo"] = cli_overrides["slow_mo"]
-            logger.info(f"CLI override: slow_mo={cli_overrides['slow_mo']}")
+        if (slow_mo := cli_overrides.get("slow_mo")) is not None:
+            config["slow_mo"] = slow_mo
+            logger.info("CLI override: slow_mo={}", slow_mo)
     
     @property
     def browser_type(self) -> str:
@@ -137,20 +296,89 @@ class BrowserFactory:
         """Check if running in headless mode."""
         return self.config.headless
     
+    @property
+    def browser(self) -> Browser:
+        """Browser instance, launched on first access."""
+        return self._ensure_browser()
+    
+    @property
+    def context(self) -> BrowserContext:
+        """Default browser context, created on first access."""
+        return self._ensure_context()
+    
+    @property
+    def page(self) -> Page:
+        """Default page, opened on first access."""
+        return self._ensure_page()
+    
+    @property
+    def context_pool(self) -> ContextPool:
+        """Pool of reusable contexts, sized by ``context_pool_size``."""
+        if self._context_pool is None:
+            self._context_pool = ContextPool(self, self.config.context_pool_size)
+        return self._context_pool
+    
+    def acquire_context(self) -> BrowserContext:
+        """Check out a (possibly reused) context from the pool."""
+        return self.context_pool.acquire()
+    
+    def release_context(self, context: BrowserContext) -> None:
+        """Return a context obtained from acquire_context to the pool."""
+        self.context_pool.release(context)
+    
+    def _ensure_playwright(self) -> Playwright:
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+            self._launcher = getattr(self._playwright, self.config.browser_type)
+        return self._playwright
+    
+    def _ensure_browser(self) -> Browser:
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+        return self.launch_browser()
+    
+    def _ensure_context(self) -> BrowserContext:
+        if self._context is None:
+            self._context = self.create_context()
+        return self._context
+    
+    def _ensure_page(self) -> Page:
+        if self._page is None or self._page.is_closed():
+            self._page = self.create_page(self._ensure_context())
+        return self._page
+    
+    def _start_tracing(self, context: BrowserContext) -> None:
+        """Start tracing on a context the first time a page is opened in it."""
+        if not self.config.trace_on_failure or id(context) in self._tracing:
+            return
+        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        self._tracing[id(context)] = context
+        logger.debug("Tracing started for context")
+    
+    def _take_tracing(self, context: BrowserContext) -> bool:
+        """Mark tracing stopped for ``context``; True if it was running."""
+        return self._tracing.pop(id(context), None) is context
+    
     def get_launch_options(self) -> Dict[str, Any]:
         """Get browser launch options."""
+        return self._launch_options
+    
+    def get_context_options(self) -> Dict[str, Any]:
+        """Get browser context options."""
+        return self._context_options
+    
+    def _build_launch_options(self) -> Dict[str, Any]:
         options = {
             "headless": self.config.headless,
             "slow_mo": self.config.slow_mo,
         }
         
         if self.config.args:
-            options["args"] = self.config.args
+            options["args"] = list(self.config.args)
         
         return options
     
-    def get_context_options(self) -> Dict[str, Any]:
-        """Get browser context options."""
+    def _build_context_options(self) -> Dict[str, Any]:
         options = {
             "viewport": {
                 "width": self.config.viewport_width,
@@ -165,35 +393,34 @@ class BrowserFactory:
         
         return options
     
-    @allure.step("Launch browser")
     def launch_browser(self) -> Browser:
         if self._browser is not None and self._browser.is_connected():
             return self._browser
         
-        self._playwright = sync_playwright().start()
-        launch_options = self.get_launch_options()
-        
-        logger.info(f"Launching {self.config.browser_type} browser")
-        logger.debug(f"Launch options: {launch_options}")
-        
-        # Get the browser launcher based on type
-        browser_launcher = getattr(self._playwright, self.config.browser_type)
-        self._browser = browser_launcher.launch(**launch_options)
-        
-        allure.attach(
-            f"Browser: {self.config.browser_type}\n"
-            f"Headless: {self.config.headless}\n"
-            f"Slow Mo: {self.config.slow_mo}ms",
-            name="Browser Configuration",
-            attachment_type=allure.attachment_type.TEXT,
-        )
-        
-        return self._browser
+        with reporting.step("Launch browser: {}", self.config.browser_type):
+            self._ensure_playwright()
+            launch_options = self.get_launch_options()
+            
+            logger.info("Launching {} browser", self.config.browser_type)
+            logger.debug("Launch options: {}", launch_options)
+            
+            self._browser = self._launcher.launch(**launch_options)
+            
+            if reporting.ALLURE_ENABLED:
+                reporting.attach(
+                    f"Browser: {self.config.browser_type}\n"
+                    f"Headless: {self.config.headless}\n"
+                    f"Slow Mo: {self.config.slow_mo}ms",
+                    name="Browser Configuration",
+                    attachment_type="TEXT",
+                )
+            
+            return self._browser
     
-    @allure.step("Create browser context")
     def create_context(
         self,
         browser: Optional[Browser] = None,
+        authenticated: bool = False,
         **extra_options,
     ) -> BrowserContext:
         """
@@ -201,47 +428,83 @@ class BrowserFactory:
         
         Args:
             browser: Browser instance (uses internal if not provided)
+            authenticated: Start from the cached authenticated storage state
+                (see get_or_create_authenticated_state)
             **extra_options: Additional context options to merge
         
         Returns:
             BrowserContext instance
         """
-        if browser is None:
-            browser = self.launch_browser()
-        
-        context_options = self.get_context_options()
-        context_options.update(extra_options)
-        
-        logger.debug(f"Creating context with options: {context_options}")
-        
-        context = browser.new_context(**context_options)
-        
-        # Start tracing if configured
-        if self.config.trace_on_failure:
-            context.tracing.start(screenshots=True, snapshots=True, sources=True)
-            logger.debug("Tracing started for context")
-        
-        self._contexts.append(context)
-        return context
+        with reporting.step("Create browser context"):
+            if browser is None:
+                browser = self._ensure_browser()
+            
+            context_options = {**self._context_options, **extra_options}
+            if authenticated:
+                if self._storage_state is None:
+                    raise RuntimeError(
+                        "No authenticated storage state; call "
+                        "get_or_create_authenticated_state() first"
+                    )
+                context_options["storage_state"] = self._storage_state
+            
+            logger.debug("Creating context with options: {}", context_options)
+            
+            context = browser.new_context(**context_options)
+            
+            # Tracing is deferred to the first page opened in this context
+            self._contexts[id(context)] = context
+            return context
     
-    @allure.step("Create new page")
     def create_page(
         self,
         context: Optional[BrowserContext] = None,
     ) -> Page:
-        if context is None:
-            context = self.create_context()
-        
-        page = context.new_page()
+        with reporting.step("Create new page"):
+            if context is None:
+                context = self._ensure_context()
+            
+            self._start_tracing(context)
+            page = context.new_page()
+            
+            # Set default timeout
+            page.set_default_timeout(self.config.timeout)
+            page.set_default_navigation_timeout(self.config.timeout)
+            
+            logger.debug("Created new page with timeout: {}ms", self.config.timeout)
+            
+            self._pages[id(page)] = page
+            return page
+    
+    def get_or_create_authenticated_state(
+        self,
+        login_fn: Callable[[Page], None],
+    ) -> Dict[str, Any]:
+        """
+        Log in once and cache the resulting storage state.
         
-        # Set default timeout
-        page.set_default_timeout(self.config.timeout)
-        page.set_default_navigation_timeout(self.config.timeout)
+        Args:
+            login_fn: Callable that performs the login on the given page
         
-        logger.debug(f"Created new page with timeout: {self.config.timeout}ms")
+        Returns:
+            Storage state (cookies and origins) for new_context(storage_state=...)
+        """
+        if self._storage_state is not None:
+            return self._storage_state
         
-        self._pages.append(page)
-        return page
+        with reporting.step("Capture authenticated storage state"):
+            context = self.create_context()
+            try:
+                login_fn(self.create_page(context))
+                self._storage_state = context.storage_state()
+            finally:
+                self.close_context(context)
+            logger.info("Cached authenticated storage state")
+            return self._storage_state
+    
+    def invalidate_storage_state(self) -> None:
+        """Drop the cached storage state so the next request logs in again."""
+        self._storage_state = None
     
     def stop_tracing(
         self,
@@ -258,65 +521,84 @@ class BrowserFactory:
         Returns:
             Trace data as bytes if no save_path provided
         """
-        if not self.config.trace_on_failure:
+        if not self._take_tracing(context):
             return None
         
         try:
             if save_path:
                 context.tracing.stop(path=save_path)
-                logger.info(f"Trace saved to: {save_path}")
+                logger.info("Trace saved to: {}", save_path)
                 return None
             else:
-                import tempfile
-                temp_path = tempfile.mktemp(suffix=".zip")
-                context.tracing.stop(path=temp_path)
-                
-                with open(temp_path, "rb") as f:
-                    trace_data = f.read()
-                
-                os.unlink(temp_path)
-                return trace_data
+                fd, temp_path = tempfile.mkstemp(suffix=".zip", dir=_TRACE_TMP_DIR)
+                os.close(fd)
+                try:
+                    context.tracing.stop(path=temp_path)
+                    with open(temp_path, "rb") as f:
+                        return f.read()
+                finally:
+                    os.unlink(temp_path)
         except Exception as e:
-            logger.warning(f"Failed to stop tracing: {e}")
+            logger.warning("Failed to stop tracing: {}", e)
             return None
     
+    def discard_trace(self, context: BrowserContext) -> None:
+        """Stop tracing on ``context`` without saving the trace."""
+        if not self._take_tracing(context):
+            return
+        try:
+            context.tracing.stop()
+        except Exception as e:
+            logger.warning("Failed to stop tracing: {}", e)
+    
     def close_page(self, page: Page) -> None:
         """Close a specific page."""
         try:
-            if page in self._pages:
-                self._pages.remove(page)
+            self._pages.pop(id(page), None)
+            if page is self._page:
+                self._page = None
             page.close()
         except Exception as e:
-            logger.warning(f"Error closing page: {e}")
+            logger.warning("Error closing page: {}", e)
     
     def close_context(self, context: BrowserContext) -> None:
         """Close a specific context."""
         try:
-            if context in self._contexts:
-                self._contexts.remove(context)
+            self._contexts.pop(id(context), None)
+            self._tracing.pop(id(context), None)
+            if context is self._context:
+                self._context = None
+                self._page = None
             context.close()
         except Exception as e:
-            logger.warning(f"Error closing context: {e}")
+            logger.warning("Error closing context: {}", e)
     
     def close(self) -> None:
         """Close browser and cleanup all resources."""
+        if self._playwright is None and not self._pages and not self._contexts:
+            return
+        
         logger.info("Closing browser factory resources...")
         
         # Close all pages
-        for page in self._pages[:]:
+        while self._pages:
+            _, page = self._pages.popitem()
             try:
                 page.close()
             except Exception:
                 pass
-        self._pages.clear()
         
         # Close all contexts
-        for context in self._contexts[:]:
+        while self._contexts:
+            _, context = self._contexts.popitem()
             try:
                 context.close()
             except Exception:
                 pass
-        self._contexts.clear()
+        self._tracing.clear()
+        self._context = None
+        self._page = None
+        self._context_pool = None
         
         # Close browser
         if self._browser:
@@ -333,6 +615,7 @@ class BrowserFactory:
             except Exception:
                 pass
             self._playwright = None
+            self._launcher = None
         
         logger.info("Browser factory resources cleaned up")
     
@@ -382,4 +665,5 @@ def close_browser_factory() -> None:
     if _factory_instance:
         _factory_instance.close()
         _factory_instance = None
+    reset_env_cache()
 
@@ -1,98 +1,215 @@
 """Playwright implementation for UI automation actions."""
-from typing import Optional
-import allure
-from playwright.sync_api import Page, expect, TimeoutError as PlaywrightTimeout
+import re
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from playwright.sync_api import Locator, Page, expect, TimeoutError as PlaywrightTimeout
 from loguru import logger
 
+from adapters import reporting
 from adapters.base import BaseUIActions
 
+# Selectors that obviously need a Playwright engine (text=, xpath, >>,
+# Playwright pseudo-classes) skip the round-trip and run per call. Anything
+# else the browser rejects as CSS is handed back by _BATCH_SCRIPT.
+_PLAYWRIGHT_SELECTOR = re.compile(
+    r"^[a-z_:-]+=|^//|^\.\.|>>"
+    r"|:(?:has-text|text|text-is|text-matches|nth-match|left-of|right-of|above|below|near)\("
+    r"|:visible\b"
+)
+
+# Runs ops in order and returns how many it ran. It stops early, without
+# running that op, when a selector is not valid CSS or a fill target is not
+# an input/textarea, so the caller can run it through Playwright instead.
+# Values are set with the native setter so React-style controlled inputs
+# see the change.
+_BATCH_SCRIPT = """(ops) => {
+    for (let i = 0; i < ops.length; i++) {
+        const [op, sel, val] = ops[i];
+        let el;
+        try {
+            el = document.querySelector(sel);
+        } catch (e) {
+            return i;
+        }
+        if (!el) throw new Error(`Element not found: ${sel}`);
+        if (op === "fill") {
+            const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+                : el instanceof HTMLInputElement ? HTMLInputElement.prototype
+                : null;
+            if (!proto) return i;
+            el.focus();
+            Object.getOwnPropertyDescriptor(proto, "value").set.call(el, val);
+            el.dispatchEvent(new Event("input", { bubbles: true }));
+            el.dispatchEvent(new Event("change", { bubbles: true }));
+        } else if (op === "click") {
+            el.click();
+        }
+    }
+    return ops.length;
+}"""
+
+
+class BatchedUIActions:
+    """
+    Queues click/fill operations and runs them in a single page.evaluate call.
+    
+    Batched operations skip Playwright's auto-waiting and actionability
+    checks, so use them for forms that are already rendered. Locators that
+    need a Playwright selector engine are executed immediately (after
+    flushing anything queued before them) to keep operation order; any the
+    browser still rejects as CSS are run through Playwright during flush.
+    """
+
+    __slots__ = ("_actions", "queue")
+
+    def __init__(self, actions: "PlaywrightUIActions"):
+        self._actions = actions
+        self.queue: List[Tuple[str, str, Optional[str]]] = []
+
+    def click(self, locator: str) -> None:
+        if _PLAYWRIGHT_SELECTOR.search(locator):
+            self.flush()
+            self._actions.click(locator)
+        else:
+            self.queue.append(("click", locator, None))
+
+    def fill(self, locator: str, text: str) -> None:
+        if _PLAYWRIGHT_SELECTOR.search(locator):
+            self.flush()
+            self._actions.fill(locator, text)
+        else:
+            self.queue.append(("fill", locator, text))
+
+    def flush(self) -> None:
+        """Execute all queued operations in one round-trip."""
+        if not self.queue:
+            return
+        ops, self.queue = self.queue, []
+        with reporting.step("Run {} batched actions", len(ops)):
+            logger.info("Running {} batched actions", len(ops))
+            while ops:
+                done = self._actions.page.evaluate(_BATCH_SCRIPT, ops)
+                if done >= len(ops):
+                    break
+                op, locator, text = ops[done]
+                if op == "fill":
+                    self._actions.fill(locator, text)
+                else:
+                    self._actions.click(locator)
+                ops = ops[done + 1:]
+
 
 class PlaywrightUIActions(BaseUIActions):
+    __slots__ = ("page", "_default_timeout", "_locator_cache")
+
     def __init__(self, page: Page):
         self.page = page
         self._default_timeout = 30000  # 30 seconds in milliseconds
+        self._locator_cache: Dict[str, Locator] = {}
+
+    def _loc(self, locator: str) -> Locator:
+        """Return a cached Locator for the selector on this page."""
+        loc = self._locator_cache.get(locator)
+        if loc is None:
+            loc = self._locator_cache[locator] = self.page.locator(locator)
+        return loc
+
+    def clear_locator_cache(self) -> None:
+        """Drop cached Locators (called after navigation)."""
+        self._locator_cache.clear()
+
+    @contextmanager
+    def batched(self) -> Iterator[BatchedUIActions]:
+        """
+        Collect click/fill calls and send them to the page in one evaluate.
+        
+        Usage:
+            with actions.batched() as batch:
+                batch.fill("#email", "user@example.com")
+                batch.click("#submit")
+        """
+        batch = BatchedUIActions(self)
+        yield batch
+        batch.flush()
 
     def navigate(self, url: str) -> None:
-        with allure.step(f"Navigate to: {url}"):
-            logger.info(f"Navigating to: {url}")
+        with reporting.step("Navigate to: {}", url):
+            logger.info("Navigating to: {}", url)
             self.page.goto(url, wait_until="domcontentloaded")
+            self.clear_locator_cache()
 
     def click(self, locator: str) -> None:
-        with allure.step(f"Click element: {locator}"):
-            logger.info(f"Clicking element: {locator}")
-            self.page.locator(locator).click()
+        with reporting.step("Click element: {}", locator):
+            logger.info("Clicking element: {}", locator)
+            self._loc(locator).click()
 
     def fill(self, locator: str, text: str) -> None:
-        with allure.step(f"Fill '{text}' into: {locator}"):
-            logger.info(f"Filling text into: {locator}")
-            self.page.locator(locator).fill(text)
+        with reporting.step("Fill '{}' into: {}", text, locator):
+            logger.info("Filling text into: {}", locator)
+            self._loc(locator).fill(text)
 
     def get_text(self, locator: str) -> str:
-        with allure.step(f"Get text from: {locator}"):
-            text = self.page.locator(locator).text_content() or ""
-            logger.info(f"Got text from {locator}: {text[:50]}...")
+        with reporting.step("Get text from: {}", locator):
+            text = self._loc(locator).text_content() or ""
+            logger.opt(lazy=True).info("Got text from {}: {}...", lambda: locator, lambda: text[:50])
             return text
 
     def is_visible(self, locator: str, timeout: Optional[float] = None) -> bool:
-        with allure.step(f"Check visibility: {locator}"):
+        with reporting.step("Check visibility: {}", locator):
             try:
                 timeout_ms = int(timeout * 1000) if timeout else self._default_timeout
-                self.page.locator(locator).wait_for(
+                self._loc(locator).wait_for(
                     state="visible", timeout=timeout_ms
                 )
-                logger.info(f"Element is visible: {locator}")
+                logger.info("Element is visible: {}", locator)
                 return True
             except PlaywrightTimeout:
-                logger.info(f"Element not visible: {locator}")
+                logger.info("Element not visible: {}", locator)
                 return False
 
     def wait_for_element(self, locator: str, timeout: float = 30) -> None:
-        with allure.step(f"Wait for element: {locator}"):
-            logger.info(f"Waiting for element: {locator}")
-            self.page.locator(locator).wait_for(
+        with reporting.step("Wait for element: {}", locator):
+            logger.info("Waiting for element: {}", locator)
+            self._loc(locator).wait_for(
                 state="visible", timeout=int(timeout * 1000)
             )
 
     def take_screenshot(self, name: str) -> bytes:
-        with allure.step(f"Take screenshot: {name}"):
-            logger.info(f"Taking screenshot: {name}")
+        with reporting.step("Take screenshot: {}", name):
+            logger.info("Taking screenshot: {}", name)
             screenshot = self.page.screenshot()
-            allure.attach(
-                screenshot,
-                name=name,
-                attachment_type=allure.attachment_type.PNG,
-            )
+            reporting.attach(screenshot, name=name, attachment_type="PNG")
             return screenshot
 
     def select_option(self, locator: str, value: str) -> None:
-        with allure.step(f"Select '{value}' from: {locator}"):
-            logger.info(f"Selecting option '{value}' from: {locator}")
-            self.page.locator(locator).select_option(value)
+        with reporting.step("Select '{}' from: {}", value, locator):
+            logger.info("Selecting option '{}' from: {}", value, locator)
+            self._loc(locator).select_option(value)
 
     def get_attribute(self, locator: str, attribute: str) -> Optional[str]:
-        with allure.step(f"Get attribute '{attribute}' from: {locator}"):
-            value = self.page.locator(locator).get_attribute(attribute)
-            logger.info(f"Got attribute {attribute}: {value}")
+        with reporting.step("Get attribute '{}' from: {}", attribute, locator):
+            value = self._loc(locator).get_attribute(attribute)
+            logger.info("Got attribute {}: {}", attribute, value)
             return value
 
     def hover(self, locator: str) -> None:
-        with allure.step(f"Hover over: {locator}"):
-            logger.info(f"Hovering over: {locator}")
-            self.page.locator(locator).hover()
+        with reporting.step("Hover over: {}", locator):
+            logger.info("Hovering over: {}", locator)
+            self._loc(locator).hover()
 
     def double_click(self, locator: str) -> None:
-        with allure.step(f"Double click: {locator}"):
-            logger.info(f"Double clicking: {locator}")
-            self.page.locator(locator).dblclick()
+        with reporting.step("Double click: {}", locator):
+            logger.info("Double clicking: {}", locator)
+            self._loc(locator).dblclick()
 
     def right_click(self, locator: str) -> None:
-        with allure.step(f"Right click: {locator}"):
-            logger.info(f"Right clicking: {locator}")
-            self.page.locator(locator).click(button="right")
+        with reporting.step("Right click: {}", locator):
+            logger.info("Right clicking: {}", locator)
+            self._loc(locator).click(button="right")
 
     def press_key(self, key: str) -> None:
-        with allure.step(f"Press key: {key}"):
-            logger.info(f"Pressing key: {key}")
+        with reporting.step("Press key: {}", key):
+            logger.info("Pressing key: {}", key)
             self.page.keyboard.press(key)
 
     def get_url(self) -> str:
@@ -102,36 +219,50 @@ class PlaywrightUIActions(BaseUIActions):
         return self.page.title()
 
     def wait_for_url(self, url_pattern: str, timeout: float = 30) -> None:
-        with allure.step(f"Wait for URL pattern: {url_pattern}"):
-            logger.info(f"Waiting for URL: {url_pattern}")
+        with reporting.step("Wait for URL pattern: {}", url_pattern):
+            logger.info("Waiting for URL: {}", url_pattern)
             self.page.wait_for_url(url_pattern, timeout=int(timeout * 1000))
 
     def wait_for_load_state(self, state: str = "load") -> None:
-        with allure.step(f"Wait for load state: {state}"):
-            logger.info(f"Waiting for load state: {state}")
+        with reporting.step("Wait for load state: {}", state):
+            logger.info("Waiting for load state: {}", state)
             self.page.wait_for_load_state(state)
 
     def execute_script(self, script: str, *args) -> any:
-        with allure.step("Execute JavaScript"):
-            logger.info(f"Executing script: {script[:100]}...")
+        with reporting.step("Execute JavaScript"):
+            logger.opt(lazy=True).info("Executing script: {}...", lambda: script[:100])
             return self.page.evaluate(script, *args)
 
     def get_element_count(self, locator: str) -> int:
-        with allure.step(f"Get element count: {locator}"):
-            count = self.page.locator(locator).count()
-            logger.info(f"Element count for {locator}: {count}")
+        with reporting.step("Get element count: {}", locator):
+            count = self._loc(locator).count()
+            logger.info("Element count for {}: {}", locator, count)
             return count
 
+    def get_all_texts(self, locator: str) -> List[Optional[str]]:
+        with reporting.step("Get all texts: {}", locator):
+            texts = self._loc(locator).evaluate_all("els => els.map(e => e.textContent)")
+            logger.info("Got {} texts for {}", len(texts), locator)
+            return texts
+
+    def get_all_attributes(self, locator: str, attribute: str) -> List[Optional[str]]:
+        with reporting.step("Get all '{}' attributes: {}", attribute, locator):
+            values = self._loc(locator).evaluate_all(
+                "(els, name) => els.map(e => e.getAttribute(name))", attribute
+            )
+            logger.info("Got {} '{}' attributes for {}", len(values), attribute, locator)
+            return values
+
     def expect_visible(self, locator: str, timeout: float = 30) -> None:
-        with allure.step(f"Expect visible: {locator}"):
-            logger.info(f"Expecting element visible: {locator}")
-            expect(self.page.locator(locator)).to_be_visible(
+        with reporting.step("Expect visible: {}", locator):
+            logger.info("Expecting element visible: {}", locator)
+            expect(self._loc(locator)).to_be_visible(
                 timeout=int(timeout * 1000)
             )
 
     def expect_text(self, locator: str, text: str, timeout: float = 30) -> None:
-        with allure.step(f"Expect text '{text}' in: {locator}"):
-            logger.info(f"Expecting text '{text}' in element: {locator}")
-            expect(self.page.locator(locator)).to_contain_text(
+        with reporting.step("Expect text '{}' in: {}", text, locator):
+            logger.info("Expecting text '{}' in element: {}", text, locator)
+            expect(self._loc(locator)).to_contain_text(
                 text, timeout=int(timeout * 1000)
             )
@@ -0,0 +1,213 @@
+"""
+Pre-generated fastjsonschema validators for api.schemas.
+
+Generated by scripts/gen_schema_validators.py with fastjsonschema 2.21.1; do not edit.
+"""
+from decimal import Decimal  # noqa: F401
+from fastjsonschema import JsonSchemaValueException  # noqa: F401
+
+SCHEMA_CHECKSUM = "25aa749541947863687bd237e328d7eaed5986ec33362ab96e0dfdb5e9b8a817"
+
+
+def _build_validate_user():
+    NoneType = type(None)
+
+    def validate(data, custom_formats={}, name_prefix=None):
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'id': {'type': ['string', 'integer']}, 'username': {'type': 'string'}, 'email': {'type': 'string', 'format': 'email'}, 'created_at': {'type': 'string'}, 'updated_at': {'type': 'string'}, 'profile': {'type': 'object', 'properties': {'first_name': {'type': 'string'}, 'last_name': {'type': 'string'}, 'avatar_url': {'type': ['string', 'null']}}}}, 'required': ['id', 'username', 'email']}, rule='type')
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['id', 'username', 'email']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'id': {'type': ['string', 'integer']}, 'username': {'type': 'string'}, 'email': {'type': 'string', 'format': 'email'}, 'created_at': {'type': 'string'}, 'updated_at': {'type': 'string'}, 'profile': {'type': 'object', 'properties': {'first_name': {'type': 'string'}, 'last_name': {'type': 'string'}, 'avatar_url': {'type': ['string', 'null']}}}}, 'required': ['id', 'username', 'email']}, rule='required')
+            data_keys = set(data.keys())
+            if "id" in data_keys:
+                data_keys.remove("id")
+                data__id = data["id"]
+                if not isinstance(data__id, (str, int)) and not (isinstance(data__id, float) and data__id.is_integer()) or isinstance(data__id, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".id must be string or integer", value=data__id, name="" + (name_prefix or "data") + ".id", definition={'type': ['string', 'integer']}, rule='type')
+            if "username" in data_keys:
+                data_keys.remove("username")
+                data__username = data["username"]
+                if not isinstance(data__username, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".username must be string", value=data__username, name="" + (name_prefix or "data") + ".username", definition={'type': 'string'}, rule='type')
+            if "email" in data_keys:
+                data_keys.remove("email")
+                data__email = data["email"]
+                if not isinstance(data__email, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".email must be string", value=data__email, name="" + (name_prefix or "data") + ".email", definition={'type': 'string', 'format': 'email'}, rule='type')
+            if "created_at" in data_keys:
+                data_keys.remove("created_at")
+                data__createdat = data["created_at"]
+                if not isinstance(data__createdat, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".created_at must be string", value=data__createdat, name="" + (name_prefix or "data") + ".created_at", definition={'type': 'string'}, rule='type')
+            if "updated_at" in data_keys:
+                data_keys.remove("updated_at")
+                data__updatedat = data["updated_at"]
+                if not isinstance(data__updatedat, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".updated_at must be string", value=data__updatedat, name="" + (name_prefix or "data") + ".updated_at", definition={'type': 'string'}, rule='type')
+            if "profile" in data_keys:
+                data_keys.remove("profile")
+                data__profile = data["profile"]
+                if not isinstance(data__profile, (dict)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile must be object", value=data__profile, name="" + (name_prefix or "data") + ".profile", definition={'type': 'object', 'properties': {'first_name': {'type': 'string'}, 'last_name': {'type': 'string'}, 'avatar_url': {'type': ['string', 'null']}}}, rule='type')
+                data__profile_is_dict = isinstance(data__profile, dict)
+                if data__profile_is_dict:
+                    data__profile_keys = set(data__profile.keys())
+                    if "first_name" in data__profile_keys:
+                        data__profile_keys.remove("first_name")
+                        data__profile__firstname = data__profile["first_name"]
+                        if not isinstance(data__profile__firstname, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.first_name must be string", value=data__profile__firstname, name="" + (name_prefix or "data") + ".profile.first_name", definition={'type': 'string'}, rule='type')
+                    if "last_name" in data__profile_keys:
+                        data__profile_keys.remove("last_name")
+                        data__profile__lastname = data__profile["last_name"]
+                        if not isinstance(data__profile__lastname, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.last_name must be string", value=data__profile__lastname, name="" + (name_prefix or "data") + ".profile.last_name", definition={'type': 'string'}, rule='type')
+                    if "avatar_url" in data__profile_keys:
+                        data__profile_keys.remove("avatar_url")
+                        data__profile__avatarurl = data__profile["avatar_url"]
+                        if not isinstance(data__profile__avatarurl, (str, NoneType)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".profile.avatar_url must be string or null", value=data__profile__avatarurl, name="" + (name_prefix or "data") + ".profile.avatar_url", definition={'type': ['string', 'null']}, rule='type')
+        return data
+    return validate
+
+
+validate_user = _build_validate_user()
+
+
+def _build_validate_auth_response():
+    NoneType = type(None)
+
+    def validate(data, custom_formats={}, name_prefix=None):
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'access_token': {'type': 'string'}, 'refresh_token': {'type': 'string'}, 'token_type': {'type': 'string'}, 'expires_in': {'type': 'integer'}, 'user': {'type': 'object', 'properties': {'id': {'type': ['string', 'integer']}, 'username': {'type': 'string'}, 'email': {'type': 'string', 'format': 'email'}, 'created_at': {'type': 'string'}, 'updated_at': {'type': 'string'}, 'profile': {'type': 'object', 'properties': {'first_name': {'type': 'string'}, 'last_name': {'type': 'string'}, 'avatar_url': {'type': ['string', 'null']}}}}, 'required': ['id', 'username', 'email']}}, 'required': ['access_token']}, rule='type')
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['access_token']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'access_token': {'type': 'string'}, 'refresh_token': {'type': 'string'}, 'token_type': {'type': 'string'}, 'expires_in': {'type': 'integer'}, 'user': {'type': 'object', 'properties': {'id': {'type': ['string', 'integer']}, 'username': {'type': 'string'}, 'email': {'type': 'string', 'format': 'email'}, 'created_at': {'type': 'string'}, 'updated_at': {'type': 'string'}, 'profile': {'type': 'object', 'properties': {'first_name': {'type': 'string'}, 'last_name': {'type': 'string'}, 'avatar_url': {'type': ['string', 'null']}}}}, 'required': ['id', 'username', 'email']}}, 'required': ['access_token']}, rule='required')
+            data_keys = set(data.keys())
+            if "access_token" in data_keys:
+                data_keys.remove("access_token")
+                data__accesstoken = data["access_token"]
+                if not isinstance(data__accesstoken, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".access_token must be string", value=data__accesstoken, name="" + (name_prefix or "data") + ".access_token", definition={'type': 'string'}, rule='type')
+            if "refresh_token" in data_keys:
+                data_keys.remove("refresh_token")
+                data__refreshtoken = data["refresh_token"]
+                if not isinstance(data__refreshtoken, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".refresh_token must be string", value=data__refreshtoken, name="" + (name_prefix or "data") + ".refresh_token", definition={'type': 'string'}, rule='type')
+            if "token_type" in data_keys:
+                data_keys.remove("token_type")
+                data__tokentype = data["token_type"]
+                if not isinstance(data__tokentype, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".token_type must be string", value=data__tokentype, name="" + (name_prefix or "data") + ".token_type", definition={'type': 'string'}, rule='type')
+            if "expires_in" in data_keys:
+                data_keys.remove("expires_in")
+                data__expiresin = data["expires_in"]
+                if not isinstance(data__expiresin, (int)) and not (isinstance(data__expiresin, float) and data__expiresin.is_integer()) or isinstance(data__expiresin, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".expires_in must be integer", value=data__expiresin, name="" + (name_prefix or "data") + ".expires_in", definition={'type': 'integer'}, rule='type')
+            if "user" in data_keys:
+                data_keys.remove("user")
+                data__user = data["user"]
+                if not isinstance(data__user, (dict)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".user must be object", value=data__user, name="" + (name_prefix or "data") + ".user", definition={'type': 'object', 'properties': {'id': {'type': ['string', 'integer']}, 'username': {'type': 'string'}, 'email': {'type': 'string', 'format': 'email'}, 'created_at': {'type': 'string'}, 'updated_at': {'type': 'string'}, 'profile': {'type': 'object', 'properties': {'first_name': {'type': 'string'}, 'last_name': {'type': 'string'}, 'avatar_url': {'type': ['string', 'null']}}}}, 'required': ['id', 'username', 'email']}, rule='type')
+                data__user_is_dict = isinstance(data__user, dict)
+                if data__user_is_dict:
+                    data__user__missing_keys = set(['id', 'username', 'email']) - data__user.keys()
+                    if data__user__missing_keys:
+                        raise JsonSchemaValueException("" + (name_prefix or "data") + ".user must contain " + (str(sorted(data__user__missing_keys)) + " properties"), value=data__user, name="" + (name_prefix or "data") + ".user", definition={'type': 'object', 'properties': {'id': {'type': ['string', 'integer']}, 'username': {'type': 'string'}, 'email': {'type': 'string', 'format': 'email'}, 'created_at': {'type': 'string'}, 'updated_at': {'type': 'string'}, 'profile': {'type': 'object', 'properties': {'first_name': {'type': 'string'}, 'last_name': {'type': 'string'}, 'avatar_url': {'type': ['string', 'null']}}}}, 'required': ['id', 'username', 'email']}, rule='required')
+                    data__user_keys = set(data__user.keys())
+                    if "id" in data__user_keys:
+                        data__user_keys.remove("id")
+                        data__user__id = data__user["id"]
+                        if not isinstance(data__user__id, (str, int)) and not (isinstance(data__user__id, float) and data__user__id.is_integer()) or isinstance(data__user__id, bool):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.id must be string or integer", value=data__user__id, name="" + (name_prefix or "data") + ".user.id", definition={'type': ['string', 'integer']}, rule='type')
+                    if "username" in data__user_keys:
+                        data__user_keys.remove("username")
+                        data__user__username = data__user["username"]
+                        if not isinstance(data__user__username, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.username must be string", value=data__user__username, name="" + (name_prefix or "data") + ".user.username", definition={'type': 'string'}, rule='type')
+                    if "email" in data__user_keys:
+                        data__user_keys.remove("email")
+                        data__user__email = data__user["email"]
+                        if not isinstance(data__user__email, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.email must be string", value=data__user__email, name="" + (name_prefix or "data") + ".user.email", definition={'type': 'string', 'format': 'email'}, rule='type')
+                    if "created_at" in data__user_keys:
+                        data__user_keys.remove("created_at")
+                        data__user__createdat = data__user["created_at"]
+                        if not isinstance(data__user__createdat, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.created_at must be string", value=data__user__createdat, name="" + (name_prefix or "data") + ".user.created_at", definition={'type': 'string'}, rule='type')
+                    if "updated_at" in data__user_keys:
+                        data__user_keys.remove("updated_at")
+                        data__user__updatedat = data__user["updated_at"]
+                        if not isinstance(data__user__updatedat, (str)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.updated_at must be string", value=data__user__updatedat, name="" + (name_prefix or "data") + ".user.updated_at", definition={'type': 'string'}, rule='type')
+                    if "profile" in data__user_keys:
+                        data__user_keys.remove("profile")
+                        data__user__profile = data__user["profile"]
+                        if not isinstance(data__user__profile, (dict)):
+                            raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.profile must be object", value=data__user__profile, name="" + (name_prefix or "data") + ".user.profile", definition={'type': 'object', 'properties': {'first_name': {'type': 'string'}, 'last_name': {'type': 'string'}, 'avatar_url': {'type': ['string', 'null']}}}, rule='type')
+                        data__user__profile_is_dict = isinstance(data__user__profile, dict)
+                        if data__user__profile_is_dict:
+                            data__user__profile_keys = set(data__user__profile.keys())
+                            if "first_name" in data__user__profile_keys:
+                                data__user__profile_keys.remove("first_name")
+                                data__user__profile__firstname = data__user__profile["first_name"]
+                                if not isinstance(data__user__profile__firstname, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.profile.first_name must be string", value=data__user__profile__firstname, name="" + (name_prefix or "data") + ".user.profile.first_name", definition={'type': 'string'}, rule='type')
+                            if "last_name" in data__user__profile_keys:
+                                data__user__profile_keys.remove("last_name")
+                                data__user__profile__lastname = data__user__profile["last_name"]
+                                if not isinstance(data__user__profile__lastname, (str)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.profile.last_name must be string", value=data__user__profile__lastname, name="" + (name_prefix or "data") + ".user.profile.last_name", definition={'type': 'string'}, rule='type')
+                            if "avatar_url" in data__user__profile_keys:
+                                data__user__profile_keys.remove("avatar_url")
+                                data__user__profile__avatarurl = data__user__profile["avatar_url"]
+                                if not isinstance(data__user__profile__avatarurl, (str, NoneType)):
+                                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".user.profile.avatar_url must be string or null", value=data__user__profile__avatarurl, name="" + (name_prefix or "data") + ".user.profile.avatar_url", definition={'type': ['string', 'null']}, rule='type')
+        return data
+    return validate
+
+
+validate_auth_response = _build_validate_auth_response()
+
+
+def _build_validate_error():
+    NoneType = type(None)
+
+    def validate(data, custom_formats={}, name_prefix=None):
+        if not isinstance(data, (dict)):
+            raise JsonSchemaValueException("" + (name_prefix or "data") + " must be object", value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'error': {'type': 'string'}, 'message': {'type': 'string'}, 'status_code': {'type': 'integer'}, 'details': {'type': ['object', 'array', 'null']}}, 'required': ['message']}, rule='type')
+        data_is_dict = isinstance(data, dict)
+        if data_is_dict:
+            data__missing_keys = set(['message']) - data.keys()
+            if data__missing_keys:
+                raise JsonSchemaValueException("" + (name_prefix or "data") + " must contain " + (str(sorted(data__missing_keys)) + " properties"), value=data, name="" + (name_prefix or "data") + "", definition={'type': 'object', 'properties': {'error': {'type': 'string'}, 'message': {'type': 'string'}, 'status_code': {'type': 'integer'}, 'details': {'type': ['object', 'array', 'null']}}, 'required': ['message']}, rule='required')
+            data_keys = set(data.keys())
+            if "error" in data_keys:
+                data_keys.remove("error")
+                data__error = data["error"]
+                if not isinstance(data__error, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".error must be string", value=data__error, name="" + (name_prefix or "data") + ".error", definition={'type': 'string'}, rule='type')
+            if "message" in data_keys:
+                data_keys.remove("message")
+                data__message = data["message"]
+                if not isinstance(data__message, (str)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".message must be string", value=data__message, name="" + (name_prefix or "data") + ".message", definition={'type': 'string'}, rule='type')
+            if "status_code" in data_keys:
+                data_keys.remove("status_code")
+                data__statuscode = data["status_code"]
+                if not isinstance(data__statuscode, (int)) and not (isinstance(data__statuscode, float) and data__statuscode.is_integer()) or isinstance(data__statuscode, bool):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".status_code must be integer", value=data__statuscode, name="" + (name_prefix or "data") + ".status_code", definition={'type': 'integer'}, rule='type')
+            if "details" in data_keys:
+                data_keys.remove("details")
+                data__details = data["details"]
+                if not isinstance(data__details, (dict, list, tuple, NoneType)):
+                    raise JsonSchemaValueException("" + (name_prefix or "data") + ".details must be object or array or null", value=data__details, name="" + (name_prefix or "data") + ".details", definition={'type': ['object', 'array', 'null']}, rule='type')
+        return data
+    return validate
+
+
+validate_error = _build_validate_error()
@@ -1,8 +1,8 @@
 """API client wrapper providing high-level API operations."""
-from typing import Optional, Any
-import allure
+from typing import Optional, Any, Dict, Iterable, List
 from loguru import logger
 
+from adapters import reporting
 from adapters.api import RequestsAPIActions
 
 
@@ -14,6 +14,8 @@ class APIClient:
     and common patterns like authentication flows.
     """
 
+    __slots__ = ("api", "_token")
+
     def __init__(self, base_url: str, timeout: float = 30):
         """
         Initialize the API client.
@@ -36,7 +38,7 @@ class APIClient:
         Returns:
             Authentication response data
         """
-        with allure.step(f"Authenticate user: {username}"):
+        with reporting.step(f"Authenticate user: {username}"):
             logger.info(f"Authenticating user: {username}")
             
             response = self.api.post(
@@ -76,7 +78,7 @@ class APIClient:
         Returns:
             Registration response data
         """
-        with allure.step(f"Register user: {username}"):
+        with reporting.step(f"Register user: {username}"):
             logger.info(f"Registering user: {username}")
             
             payload = {
@@ -96,7 +98,7 @@ class APIClient:
         Returns:
             User profile data
         """
-        with allure.step("Get current user profile"):
+        with reporting.step("Get current user profile"):
             logger.info("Fetching current user profile")
             response = self.api.get("/users/me")
             self.api.assert_status_code(200)
@@ -113,7 +115,7 @@ class APIClient:
         Returns:
             Updated user data
         """
-        with allure.step(f"Update user: {user_id}"):
+        with reporting.step(f"Update user: {user_id}"):
             logger.info(f"Updating user: {user_id}")
             response = self.api.patch(f"/users/{user_id}", json_data=fields)
             return response.json()
@@ -128,7 +130,7 @@ class APIClient:
         Returns:
             True if deletion was successful
         """
-        with allure.step(f"Delete user: {user_id}"):
+        with reporting.step(f"Delete user: {user_id}"):
             logger.info(f"Deleting user: {user_id}")
             response = self.api.delete(f"/users/{user_id}")
             return response.status_code in (200, 204)
@@ -144,7 +146,7 @@ class APIClient:
         Returns:
             Resource data
         """
-        with allure.step(f"Get {resource_type}/{resource_id}"):
+        with reporting.step(f"Get {resource_type}/{resource_id}"):
             logger.info(f"Fetching {resource_type}/{resource_id}")
             response = self.api.get(f"/{resource_type}/{resource_id}")
             return response.json()
@@ -168,13 +170,66 @@ class APIClient:
         Returns:
             List response with data and pagination info
         """
-        with allure.step(f"List {resource_type} (page {page})"):
+        with reporting.step(f"List {resource_type} (page {page})"):
             logger.info(f"Listing {resource_type}, page {page}")
             
             params = {"page": page, "per_page": per_page, **filters}
             response = self.api.get(f"/{resource_type}", params=params)
             return response.json()
 
+    def bulk_get(
+        self,
+        resource_type: str,
+        resource_ids: Iterable[str],
+        max_workers: int = 8,
+    ) -> List[dict]:
+        """
+        Get several resources of one type concurrently.
+
+        Args:
+            resource_type: Type of resource (e.g., 'posts', 'comments')
+            resource_ids: IDs of the resources to fetch
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            Resource data in the same order as ``resource_ids``
+        """
+        endpoints = [f"/{resource_type}/{resource_id}" for resource_id in resource_ids]
+        with reporting.step(f"Bulk get {len(endpoints)} {resource_type}"):
+            logger.info(f"Fetching {len(endpoints)} {resource_type} concurrently")
+            return self._get_concurrently([(endpoint, None) for endpoint in endpoints], max_workers)
+
+    def bulk_list(
+        self,
+        specs: Iterable[Dict[str, Any]],
+        max_workers: int = 8,
+    ) -> List[dict]:
+        """
+        Run several list queries concurrently.
+
+        Args:
+            specs: Keyword arguments for list_resources, one dict per query,
+                e.g. ``{"resource_type": "posts", "page": 2, "status": "draft"}``
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            List responses in the same order as ``specs``
+        """
+        queries = []
+        for spec in specs:
+            spec = dict(spec)
+            resource_type = spec.pop("resource_type")
+            params = {"page": spec.pop("page", 1), "per_page": spec.pop("per_page", 20), **spec}
+            queries.append((f"/{resource_type}", params))
+        with reporting.step(f"Bulk list {len(queries)} queries"):
+            logger.info(f"Running {len(queries)} list queries concurrently")
+            return self._get_concurrently(queries, max_workers)
+
+    def _get_concurrently(self, queries: List[tuple], max_workers: int) -> List[dict]:
+        """GET each (endpoint, params) pair concurrently and decode the JSON bodies."""
+        responses = self.api.get_batch(queries, max_workers=max_workers)
+        return [response.json() for response in responses]
+
     def create_resource(self, resource_type: str, **data) -> dict:
         """
         Create a new resource.
@@ -186,7 +241,7 @@ class APIClient:
         Returns:
             Created resource data
         """
-        with allure.step(f"Create {resource_type}"):
+        with reporting.step(f"Create {resource_type}"):
             logger.info(f"Creating {resource_type}")
             response = self.api.post(f"/{resource_type}", json_data=data)
             return response.json()
@@ -208,7 +263,7 @@ class APIClient:
         Returns:
             Updated resource data
         """
-        with allure.step(f"Update {resource_type}/{resource_id}"):
+        with reporting.step(f"Update {resource_type}/{resource_id}"):
             logger.info(f"Updating {resource_type}/{resource_id}")
             response = self.api.put(
                 f"/{resource_type}/{resource_id}",
@@ -227,7 +282,7 @@ class APIClient:
         Returns:
             True if deletion was successful
         """
-        with allure.step(f"Delete {resource_type}/{resource_id}"):
+        with reporting.step(f"Delete {resource_type}/{resource_id}"):
             logger.info(f"Deleting {resource_type}/{resource_id}")
             response = self.api.delete(f"/{resource_type}/{resource_id}")
             return response.status_code in (200, 204)
@@ -239,7 +294,7 @@ class APIClient:
         Returns:
             True if API is healthy
         """
-        with allure.step("API health check"):
+        with reporting.step("API health check"):
             logger.info("Performing health check")
             try:
                 response = self.api.get("/health")
@@ -263,10 +318,21 @@ class APIClient:
         self._token = None
         self.api.remove_header("Authorization")
 
+    def reset(self) -> None:
+        """Forget the auth token and per-test session state, keeping connections."""
+        self._token = None
+        self.api.reset()
+
     def close(self) -> None:
-        """Close the API client session."""
+        """Close the API client session and release pooled connections."""
         self.api.close()
 
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
 
 class AuthenticationError(Exception):
     """Exception raised for authentication failures."""
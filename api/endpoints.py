@@ -1,4 +1,5 @@
 """API endpoint constants and builders."""
+from urllib.parse import urlencode
 
 
 class Endpoints:
@@ -82,8 +83,9 @@ class Endpoints:
             **params: Query parameters
 
         Returns:
-            Query string (without leading ?)
+            URL-encoded query string (without leading ?); list values
+            are expanded into repeated keys
         """
         filtered = {k: v for k, v in params.items() if v is not None}
-        return "&".join(f"{k}={v}" for k, v in filtered.items())
+        return urlencode(filtered, doseq=True)
 
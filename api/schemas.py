@@ -1,6 +1,19 @@
 """JSON Schema definitions for API response validation."""
-from jsonschema import validate, ValidationError
-from typing import Any
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+import orjson
+from jsonschema import ValidationError, validators
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from typing import Any, Callable, Dict, Tuple, Union
+
+# Optional code-generating validator; falls back to jsonschema when missing
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 
 # User schema
@@ -37,17 +50,72 @@ AUTH_RESPONSE_SCHEMA = {
     "required": ["access_token"],
 }
 
+# Entries kept per id-keyed schema cache; schemas built per call would
+# otherwise pile up (and stay alive) for the whole session
+_SCHEMA_CACHE_SIZE = 256
+
+
+class _SchemaCache:
+    """
+    LRU map from id(schema) to something derived from the schema.
+
+    Each entry holds the schema itself so its id cannot be reused by another
+    object while cached. Pinned entries are never evicted.
+    """
+
+    def __init__(self, maxsize: int = _SCHEMA_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[int, Tuple[dict, Any]]" = OrderedDict()
+        self._pinned: Dict[int, Tuple[dict, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, schema: dict, build: Callable[[dict], Any]) -> Any:
+        """Return the cached value for ``schema``, building it on a miss."""
+        key = id(schema)
+        entry = self._pinned.get(key)
+        if entry is not None:
+            return entry[1]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = (schema, build(schema))
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+            else:
+                self._entries.move_to_end(key)
+            return entry[1]
+
+    def pin(self, schema: dict, value: Any) -> None:
+        """Store a value for ``schema`` that is never evicted."""
+        self._pinned[id(schema)] = (schema, value)
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._entries)
+
+
+# Paginated schemas keyed by item schema; sharing the dict lets its compiled
+# validators be reused too
+_PAGINATED = _SchemaCache()
+
+
 # Paginated list response schema
 def paginated_schema(item_schema: dict) -> dict:
     """
     Create a paginated response schema.
 
+    The same dict is returned for the same item schema, so treat it as
+    read-only.
+
     Args:
         item_schema: Schema for individual items
 
     Returns:
         Complete paginated response schema
     """
+    return _PAGINATED.get(item_schema, _build_paginated_schema)
+
+
+def _build_paginated_schema(item_schema: dict) -> dict:
     return {
         "type": "object",
         "properties": {
@@ -70,6 +138,12 @@ def paginated_schema(item_schema: dict) -> dict:
     }
 
 
+# Pagination envelope without the per-item subtree; validate_paginated
+# checks the items separately with the item schema's own validator
+_PAGINATION_WRAPPER_SCHEMA = _build_paginated_schema({})
+del _PAGINATION_WRAPPER_SCHEMA["properties"]["data"]["items"]
+
+
 # Error response schema
 ERROR_SCHEMA = {
     "type": "object",
@@ -83,6 +157,68 @@ ERROR_SCHEMA = {
 }
 
 
+# Compiled jsonschema validators keyed by schema
+_VALIDATORS = _SchemaCache()
+
+
+def _build_validator(schema: dict) -> Validator:
+    cls = validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+def _get_validator(schema: dict) -> Validator:
+    """Return a validator for ``schema``, checking and compiling it once."""
+    return _VALIDATORS.get(schema, _build_validator)
+
+
+# fastjsonschema validators keyed by schema; the pre-generated ones are pinned
+_FAST = _SchemaCache()
+
+
+def _build_fast_validator(schema: dict) -> Callable[[Any], Any]:
+    # Formats are not enforced, matching jsonschema without a FormatChecker
+    return fastjsonschema.compile(schema, use_formats=False)
+
+
+def _get_fast_validator(schema: dict) -> Callable[[Any], Any]:
+    """Return a fastjsonschema validator for ``schema``, compiling it once."""
+    return _FAST.get(schema, _build_fast_validator)
+
+
+# Schemas with validators pre-generated into api/_generated_validators.py
+# by scripts/gen_schema_validators.py
+_GENERATED_SCHEMAS = (
+    ("validate_user", USER_SCHEMA),
+    ("validate_auth_response", AUTH_RESPONSE_SCHEMA),
+    ("validate_error", ERROR_SCHEMA),
+)
+
+
+def _schema_checksum() -> str:
+    """Checksum of the pre-generated schemas, used to detect stale code."""
+    payload = json.dumps([schema for _, schema in _GENERATED_SCHEMAS], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _register_generated_validators() -> None:
+    """Use the checked-in validators, or compile at runtime if they are stale."""
+    try:
+        from api import _generated_validators as generated
+    except ImportError:
+        generated = None
+    if generated is not None and generated.SCHEMA_CHECKSUM == _schema_checksum():
+        for name, schema in _GENERATED_SCHEMAS:
+            _FAST.pin(schema, getattr(generated, name))
+        return
+    for _, schema in _GENERATED_SCHEMAS:
+        _FAST.pin(schema, _build_fast_validator(schema))
+
+
+if fastjsonschema is not None:
+    _register_generated_validators()
+
+
 def validate_response(data: Any, schema: dict) -> bool:
     """
     Validate response data against a JSON schema.
@@ -97,7 +233,79 @@ def validate_response(data: Any, schema: dict) -> bool:
     Raises:
         ValidationError: If validation fails
     """
-    validate(instance=data, schema=schema)
+    if fastjsonschema is not None:
+        try:
+            _get_fast_validator(schema)(data)
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise ValidationError(e.message, instance=e.value) from e
+        return True
+
+    error = best_match(_get_validator(schema).iter_errors(data))
+    if error is not None:
+        raise error
+    return True
+
+
+def validate_response_json(raw: Union[bytes, str], schema: dict) -> Any:
+    """
+    Decode a raw JSON payload and validate it against a JSON schema.
+
+    Prefer this over ``json.loads`` + ``validate_response`` when holding
+    the response body as bytes; decoding is done with orjson.
+
+    Args:
+        raw: JSON document as bytes or str
+        schema: JSON schema to validate against
+
+    Returns:
+        The decoded data
+
+    Raises:
+        orjson.JSONDecodeError: If the payload is not valid JSON
+        ValidationError: If validation fails
+    """
+    data = orjson.loads(raw)
+    validate_response(data, schema)
+    return data
+
+
+def validate_paginated(data: Any, item_schema: dict) -> bool:
+    """
+    Validate a paginated response, checking each item with a compiled item validator.
+
+    Equivalent to ``validate_response(data, paginated_schema(item_schema))``
+    but the envelope is validated once with a slim schema and the items are
+    looped over directly, which is faster for long pages.
+
+    Args:
+        data: Paginated response data to validate
+        item_schema: Schema for individual items
+
+    Returns:
+        True if validation passes
+
+    Raises:
+        ValidationError: If validation fails (item errors carry the
+            ``data``/index path)
+    """
+    validate_response(data, _PAGINATION_WRAPPER_SCHEMA)
+    items = data["data"]
+
+    if fastjsonschema is not None:
+        check = _get_fast_validator(item_schema)
+        for index, item in enumerate(items):
+            try:
+                check(item)
+            except fastjsonschema.JsonSchemaValueException as e:
+                raise ValidationError(e.message, instance=e.value, path=("data", index)) from e
+        return True
+
+    validator = _get_validator(item_schema)
+    for index, item in enumerate(items):
+        error = best_match(validator.iter_errors(item))
+        if error is not None:
+            error.path.extendleft((index, "data"))
+            raise error
     return True
 
 
@@ -112,9 +320,15 @@ def is_valid_response(data: Any, schema: dict) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    try:
-        validate(instance=data, schema=schema)
+    if fastjsonschema is not None:
+        # Generated validators only signal failure by raising; catch it
+        # directly rather than converting to a jsonschema ValidationError
+        try:
+            _get_fast_validator(schema)(data)
+        except fastjsonschema.JsonSchemaValueException:
+            return False
         return True
-    except ValidationError:
-        return False
+
+    # Stop at the first error without raising or ranking errors
+    return next(iter(_get_validator(schema).iter_errors(data)), None) is None
 
@@ -6,6 +6,7 @@ from .config import (
     get_settings,
     load_config,
     load_configs,
+    clear_yaml_cache,
 )
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "get_settings",
     "load_config",
     "load_configs",
+    "clear_yaml_cache",
 ]
@@ -1,40 +1,89 @@
 """Configuration management using YAML files with split core and data configs."""
-from functools import lru_cache
-from typing import Optional, Literal, Any, Dict
+import copy
+import threading
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Optional, Literal, Any, Dict, Mapping, Tuple
 from pathlib import Path
-import yaml
-from pydantic import BaseModel, Field, ConfigDict
-from loguru import logger
+from pydantic import BaseModel, Field, ConfigDict, model_validator
+
+def _parse_yaml(stream) -> Any:
+    """Parse YAML, importing PyYAML only once a file actually has to be parsed."""
+    import yaml
+    
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(stream, Loader=loader)
+
+
+# Parsed YAML keyed by (resolved path, mtime_ns, size) so unchanged files
+# are neither re-read nor re-parsed
+_YAML_CACHE: Dict[Tuple[str, int, int], dict] = {}
+
+
+def _read_yaml(file_path: Path) -> dict:
+    """Parse a YAML file, raising FileNotFoundError if it does not exist."""
+    st = file_path.stat()
+    key = (str(file_path.resolve()), st.st_mtime_ns, st.st_size)
+    data = _YAML_CACHE.get(key)
+    if data is None:
+        with open(file_path, "rb") as f:
+            data = _parse_yaml(f) or {}
+        _YAML_CACHE[key] = data
+    # Callers get their own copy so the cached tree is never mutated
+    return copy.deepcopy(data)
 
 
 def load_yaml_file(file_path: Path) -> dict:
-    """Load a single YAML file."""
-    if file_path.exists():
-        with open(file_path, "r") as f:
-            return yaml.safe_load(f) or {}
-    return {}
+    """Load a single YAML file (cached until the file changes)."""
+    try:
+        return _read_yaml(file_path)
+    except FileNotFoundError:
+        return {}
 
 
-def find_config_file(filename: str, config_path: Optional[str] = None) -> Optional[Path]:
-    """Find a config file in common locations."""
+def clear_yaml_cache() -> None:
+    """Forget cached YAML contents and config file locations."""
+    _YAML_CACHE.clear()
+    _candidate_paths.cache_clear()
+
+
+# Directories searched for config files when no explicit path is given:
+# the working directory, ./configs and this package's own directory
+_MODULE_DIR = Path(__file__).parent
+_SEARCH_DIRS = (Path(), Path("configs"), _MODULE_DIR)
+
+
+@lru_cache(maxsize=32)
+def _candidate_paths(filename: str, config_path: Optional[str] = None) -> Tuple[Path, ...]:
+    """Locations searched for a config file, in priority order."""
     if config_path:
         path = Path(config_path)
         if path.is_dir():
             path = path / filename
-        return path if path.exists() else None
+        return (path,)
     
-    possible_paths = [
-        Path(filename),
-        Path(f"configs/{filename}"),
-        Path(__file__).parent / filename,
-    ]
-    
-    for p in possible_paths:
+    return tuple(directory / filename for directory in _SEARCH_DIRS)
+
+
+def find_config_file(filename: str, config_path: Optional[str] = None) -> Optional[Path]:
+    """Find a config file in common locations."""
+    for p in _candidate_paths(filename, config_path):
         if p.exists():
             return p
     return None
 
 
+def _load_first(filename: str, config_path: Optional[str] = None) -> Tuple[Optional[Path], dict]:
+    """Load the first candidate config file that exists (one stat per miss)."""
+    for p in _candidate_paths(filename, config_path):
+        try:
+            return p, _read_yaml(p)
+        except FileNotFoundError:
+            continue
+    return None, {}
+
+
 def load_configs(
     core_config_path: Optional[str] = None,
     data_config_path: Optional[str] = None,
@@ -49,27 +98,48 @@ def load_configs(
     Returns:
         Dictionary with 'core' and 'data' config dictionaries
     """
-    # Find and load core config
-    core_path = find_config_file("core_config.yml", core_config_path)
-    core_config = load_yaml_file(core_path) if core_path else {}
+    from loguru import logger
     
-    # Find and load data config
-    data_path = find_config_file("data_config.yml", data_config_path)
-    data_config = load_yaml_file(data_path) if data_path else {}
+    core_path, core_config = _load_first("core_config.yml", core_config_path)
+    data_path, data_config = _load_first("data_config.yml", data_config_path)
     
     if core_path:
-        logger.debug(f"Loaded core config from: {core_path}")
+        logger.debug("Loaded core config from: {}", core_path)
     if data_path:
-        logger.debug(f"Loaded data config from: {data_path}")
+        logger.debug("Loaded data config from: {}", data_path)
     
     return {"core": core_config, "data": data_config}
 
 
+# One shared all-defaults instance per config class
+_DEFAULT_INSTANCES: Dict[type, "_ConfigModel"] = {}
+
+
+class _ConfigModel(BaseModel):
+    """Base for config sections: read-only once loaded, unknown YAML keys ignored."""
+    
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _empty_section(cls, data: Any) -> Any:
+        """Treat a YAML section with no value (``mobile:`` alone parses as None) as empty."""
+        return {} if data is None else data
+
+    @classmethod
+    def defaults(cls) -> "_ConfigModel":
+        """Shared instance with every field at its default (safe since models are frozen)."""
+        instance = _DEFAULT_INSTANCES.get(cls)
+        if instance is None:
+            instance = _DEFAULT_INSTANCES[cls] = cls()
+        return instance
+
+
 # =============================================================================
 # Core Configuration Classes
 # =============================================================================
 
-class BrowserConfig(BaseModel):
+class BrowserConfig(_ConfigModel):
     """Browser/Playwright configuration."""
     
     type: Literal["chromium", "firefox", "webkit"] = Field(default="chromium")
@@ -79,28 +149,25 @@ class BrowserConfig(BaseModel):
     viewport_width: int = Field(default=1920)
     viewport_height: int = Field(default=1080)
     screenshot_on_failure: bool = Field(default=True)
+    full_page_screenshot: bool = Field(default=False, description="Capture the whole page instead of the viewport")
     video_on_failure: bool = Field(default=False)
     trace_on_failure: bool = Field(default=True)
+    context_pool_size: int = Field(default=0, description="Max idle browser contexts kept for reuse (0 disables pooling)")
 
+    @model_validator(mode="before")
     @classmethod
-    def from_yaml(cls, data: dict) -> "BrowserConfig":
-        if not data:
-            return cls()
-        viewport = data.get("viewport", {})
-        return cls(
-            type=data.get("type", "chromium"),
-            headless=data.get("headless", True),
-            slow_mo=data.get("slow_mo", 0),
-            timeout=data.get("timeout", 30000),
-            viewport_width=viewport.get("width", 1920),
-            viewport_height=viewport.get("height", 1080),
-            screenshot_on_failure=data.get("screenshot_on_failure", True),
-            video_on_failure=data.get("video_on_failure", False),
-            trace_on_failure=data.get("trace_on_failure", True),
-        )
-
-
-class MobileFrameworkConfig(BaseModel):
+    def _flatten_viewport(cls, data: Any) -> Any:
+        """Map the YAML ``viewport: {width, height}`` block onto the flat fields."""
+        if isinstance(data, dict) and "viewport" in data:
+            data = dict(data)
+            viewport = data.pop("viewport") or {}
+            for key in ("width", "height"):
+                if key in viewport:
+                    data.setdefault(f"viewport_{key}", viewport[key])
+        return data
+
+
+class MobileFrameworkConfig(_ConfigModel):
     """Mobile framework configuration (Appium settings)."""
     
     appium_server: str = Field(default="http://localhost:4723")
@@ -109,38 +176,16 @@ class MobileFrameworkConfig(BaseModel):
     no_reset: bool = Field(default=False)
     full_reset: bool = Field(default=False)
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "MobileFrameworkConfig":
-        if not data:
-            return cls()
-        return cls(
-            appium_server=data.get("appium_server", "http://localhost:4723"),
-            automation_name=data.get("automation_name", "UiAutomator2"),
-            new_command_timeout=data.get("new_command_timeout", 300),
-            no_reset=data.get("no_reset", False),
-            full_reset=data.get("full_reset", False),
-        )
-
-
-class AllureConfig(BaseModel):
+
+class AllureConfig(_ConfigModel):
     """Allure reporting configuration."""
     
     results_dir: str = Field(default="reports/allure-results")
     report_dir: str = Field(default="reports/allure-report")
     clean_results: bool = Field(default=True)
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "AllureConfig":
-        if not data:
-            return cls()
-        return cls(
-            results_dir=data.get("results_dir", "reports/allure-results"),
-            report_dir=data.get("report_dir", "reports/allure-report"),
-            clean_results=data.get("clean_results", True),
-        )
 
-
-class LoggingConfig(BaseModel):
+class LoggingConfig(_ConfigModel):
     """Logging configuration."""
     
     level: str = Field(default="INFO")
@@ -154,81 +199,38 @@ class LoggingConfig(BaseModel):
     rotation: str = Field(default="10 MB")
     retention: str = Field(default="1 week")
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "LoggingConfig":
-        if not data:
-            return cls()
-        return cls(
-            level=data.get("level", "INFO"),
-            file_path=data.get("file_path", "reports/logs/test.log"),
-            rotation=data.get("rotation", "10 MB"),
-            retention=data.get("retention", "1 week"),
-        )
-
-
-class CoreConfig(BaseModel):
+
+class CoreConfig(_ConfigModel):
     """Core framework configuration."""
     
     environment: Literal["local", "dev", "staging", "prod"] = Field(default="local")
     debug: bool = Field(default=False)
-    browser: BrowserConfig = Field(default_factory=BrowserConfig)
-    mobile: MobileFrameworkConfig = Field(default_factory=MobileFrameworkConfig)
-    allure: AllureConfig = Field(default_factory=AllureConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
-
-    @classmethod
-    def from_yaml(cls, data: dict) -> "CoreConfig":
-        if not data:
-            return cls()
-        return cls(
-            environment=data.get("environment", "local"),
-            debug=data.get("debug", False),
-            browser=BrowserConfig.from_yaml(data.get("browser", {})),
-            mobile=MobileFrameworkConfig.from_yaml(data.get("mobile", {})),
-            allure=AllureConfig.from_yaml(data.get("allure", {})),
-            logging=LoggingConfig.from_yaml(data.get("logging", {})),
-        )
+    browser: BrowserConfig = Field(default_factory=BrowserConfig.defaults)
+    mobile: MobileFrameworkConfig = Field(default_factory=MobileFrameworkConfig.defaults)
+    allure: AllureConfig = Field(default_factory=AllureConfig.defaults)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig.defaults)
 
 
 # =============================================================================
 # Data Configuration Classes
 # =============================================================================
 
-class UIDataConfig(BaseModel):
+class UIDataConfig(_ConfigModel):
     """UI URLs configuration."""
     
     base_url: str = Field(default="http://localhost:3000")
     login_url: str = Field(default="/login")
     dashboard_url: str = Field(default="/dashboard")
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "UIDataConfig":
-        if not data:
-            return cls()
-        return cls(
-            base_url=data.get("base_url", "http://localhost:3000"),
-            login_url=data.get("login_url", "/login"),
-            dashboard_url=data.get("dashboard_url", "/dashboard"),
-        )
-
 
-class APIDataConfig(BaseModel):
+class APIDataConfig(_ConfigModel):
     """API configuration."""
     
     base_url: str = Field(default="http://localhost:8000/api")
     version: str = Field(default="v1")
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "APIDataConfig":
-        if not data:
-            return cls()
-        return cls(
-            base_url=data.get("base_url", "http://localhost:8000/api"),
-            version=data.get("version", "v1"),
-        )
 
-
-class TimeoutsConfig(BaseModel):
+class TimeoutsConfig(_ConfigModel):
     """Timeout and wait configurations."""
     
     default: int = Field(default=30)
@@ -237,56 +239,24 @@ class TimeoutsConfig(BaseModel):
     api_timeout: int = Field(default=30)
     implicit_wait: int = Field(default=10)
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "TimeoutsConfig":
-        if not data:
-            return cls()
-        return cls(
-            default=data.get("default", 30),
-            page_load=data.get("page_load", 60),
-            element_wait=data.get("element_wait", 10),
-            api_timeout=data.get("api_timeout", 30),
-            implicit_wait=data.get("implicit_wait", 10),
-        )
-
-
-class UserCredentials(BaseModel):
+
+class UserCredentials(_ConfigModel):
     """Single user credentials."""
     
     username: str = Field(default="")
     password: str = Field(default="")
     email: str = Field(default="")
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "UserCredentials":
-        if not data:
-            return cls()
-        return cls(
-            username=data.get("username", ""),
-            password=data.get("password", ""),
-            email=data.get("email", ""),
-        )
 
-
-class CredentialsConfig(BaseModel):
+class CredentialsConfig(_ConfigModel):
     """All credentials configuration."""
     
-    valid_user: UserCredentials = Field(default_factory=UserCredentials)
-    admin_user: UserCredentials = Field(default_factory=UserCredentials)
-    invalid_user: UserCredentials = Field(default_factory=UserCredentials)
-
-    @classmethod
-    def from_yaml(cls, data: dict) -> "CredentialsConfig":
-        if not data:
-            return cls()
-        return cls(
-            valid_user=UserCredentials.from_yaml(data.get("valid_user", {})),
-            admin_user=UserCredentials.from_yaml(data.get("admin_user", {})),
-            invalid_user=UserCredentials.from_yaml(data.get("invalid_user", {})),
-        )
+    valid_user: UserCredentials = Field(default_factory=UserCredentials.defaults)
+    admin_user: UserCredentials = Field(default_factory=UserCredentials.defaults)
+    invalid_user: UserCredentials = Field(default_factory=UserCredentials.defaults)
 
 
-class AndroidAppConfig(BaseModel):
+class AndroidAppConfig(_ConfigModel):
     """Android app configuration."""
     
     platform: str = Field(default="android")
@@ -296,21 +266,8 @@ class AndroidAppConfig(BaseModel):
     app_package: Optional[str] = Field(default=None)
     app_activity: Optional[str] = Field(default=None)
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "AndroidAppConfig":
-        if not data:
-            return cls()
-        return cls(
-            platform=data.get("platform", "android"),
-            platform_version=data.get("platform_version", "13"),
-            device_name=data.get("device_name", "emulator-5554"),
-            app_path=data.get("app_path"),
-            app_package=data.get("app_package"),
-            app_activity=data.get("app_activity"),
-        )
-
-
-class IOSAppConfig(BaseModel):
+
+class IOSAppConfig(_ConfigModel):
     """iOS app configuration."""
     
     platform: str = Field(default="ios")
@@ -320,67 +277,31 @@ class IOSAppConfig(BaseModel):
     bundle_id: Optional[str] = Field(default=None)
     udid: Optional[str] = Field(default=None)
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "IOSAppConfig":
-        if not data:
-            return cls()
-        return cls(
-            platform=data.get("platform", "ios"),
-            platform_version=data.get("platform_version", "16.0"),
-            device_name=data.get("device_name", "iPhone 14"),
-            app_path=data.get("app_path"),
-            bundle_id=data.get("bundle_id"),
-            udid=data.get("udid"),
-        )
-
-
-class MobileAppConfig(BaseModel):
+
+class MobileAppConfig(_ConfigModel):
     """Mobile app data configuration."""
     
-    android: AndroidAppConfig = Field(default_factory=AndroidAppConfig)
-    ios: IOSAppConfig = Field(default_factory=IOSAppConfig)
-
-    @classmethod
-    def from_yaml(cls, data: dict) -> "MobileAppConfig":
-        if not data:
-            return cls()
-        return cls(
-            android=AndroidAppConfig.from_yaml(data.get("android", {})),
-            ios=IOSAppConfig.from_yaml(data.get("ios", {})),
-        )
+    android: AndroidAppConfig = Field(default_factory=AndroidAppConfig.defaults)
+    ios: IOSAppConfig = Field(default_factory=IOSAppConfig.defaults)
 
 
-class DataConfig(BaseModel):
+class DataConfig(_ConfigModel):
     """Data/test-specific configuration."""
     
-    ui: UIDataConfig = Field(default_factory=UIDataConfig)
-    api: APIDataConfig = Field(default_factory=APIDataConfig)
-    timeouts: TimeoutsConfig = Field(default_factory=TimeoutsConfig)
-    credentials: CredentialsConfig = Field(default_factory=CredentialsConfig)
-    mobile_app: MobileAppConfig = Field(default_factory=MobileAppConfig)
+    ui: UIDataConfig = Field(default_factory=UIDataConfig.defaults)
+    api: APIDataConfig = Field(default_factory=APIDataConfig.defaults)
+    timeouts: TimeoutsConfig = Field(default_factory=TimeoutsConfig.defaults)
+    credentials: CredentialsConfig = Field(default_factory=CredentialsConfig.defaults)
+    mobile_app: MobileAppConfig = Field(default_factory=MobileAppConfig.defaults)
     endpoints: dict = Field(default_factory=dict)
     test_data: dict = Field(default_factory=dict)
 
-    @classmethod
-    def from_yaml(cls, data: dict) -> "DataConfig":
-        if not data:
-            return cls()
-        return cls(
-            ui=UIDataConfig.from_yaml(data.get("ui", {})),
-            api=APIDataConfig.from_yaml(data.get("api", {})),
-            timeouts=TimeoutsConfig.from_yaml(data.get("timeouts", {})),
-            credentials=CredentialsConfig.from_yaml(data.get("credentials", {})),
-            mobile_app=MobileAppConfig.from_yaml(data.get("mobile_app", {})),
-            endpoints=data.get("endpoints", {}),
-            test_data=data.get("test_data", {}),
-        )
-
 
 # =============================================================================
 # Main Settings Class
 # =============================================================================
 
-class Settings(BaseModel):
+class Settings(_ConfigModel):
     """
     Main settings combining core and data configurations.
     
@@ -389,10 +310,8 @@ class Settings(BaseModel):
         data: Test-specific settings (URLs, credentials, timeouts)
     """
     
-    model_config = ConfigDict(extra="ignore")
-    
-    core: CoreConfig = Field(default_factory=CoreConfig)
-    data: DataConfig = Field(default_factory=DataConfig)
+    core: CoreConfig = Field(default_factory=CoreConfig.defaults)
+    data: DataConfig = Field(default_factory=DataConfig.defaults)
 
     @classmethod
     def from_yaml(
@@ -411,52 +330,87 @@ class Settings(BaseModel):
             Settings instance populated from YAML files
         """
         configs = load_configs(core_config_path, data_config_path)
+        if not configs["core"] and not configs["data"]:
+            return cls.defaults()
         
-        return cls(
-            core=CoreConfig.from_yaml(configs["core"]),
-            data=DataConfig.from_yaml(configs["data"]),
-        )
+        # A single pydantic-core pass validates the whole tree and applies
+        # field defaults for missing keys
+        return cls.model_validate(configs)
 
     # -------------------------------------------------------------------------
     # Convenience Properties (backward compatibility)
+    # Cached on first read; settings are not modified after loading.
     # -------------------------------------------------------------------------
     
-    @property
+    @cached_property
     def environment(self) -> str:
         """Get current environment."""
         return self.core.environment
 
-    @property
+    @cached_property
     def ui_base_url(self) -> str:
         """Get UI base URL."""
         return self.data.ui.base_url
 
-    @property
+    @cached_property
     def api_base_url(self) -> str:
         """Get API base URL."""
         return self.data.api.base_url
 
-    @property
+    @cached_property
     def valid_username(self) -> str:
         """Get valid test username."""
         return self.data.credentials.valid_user.username
 
-    @property
+    @cached_property
     def valid_password(self) -> str:
         """Get valid test password."""
         return self.data.credentials.valid_user.password
 
-    @property
+    @cached_property
     def default_timeout(self) -> int:
         """Get default timeout in seconds."""
         return self.data.timeouts.default
 
-    @property
+    @cached_property
     def browser_timeout(self) -> int:
         """Get browser timeout in milliseconds."""
         return self.data.timeouts.default * 1000
 
-    def get_mobile_capabilities(self, platform: str = "android") -> dict:
+    @cached_property
+    def _mobile_caps(self) -> Dict[str, Mapping[str, Any]]:
+        """Appium capabilities per platform, built once."""
+        android = self.data.mobile_app.android
+        ios = self.data.mobile_app.ios
+        mobile = self.core.mobile
+        return {
+            "android": MappingProxyType({
+                "platformName": "Android",
+                "platformVersion": android.platform_version,
+                "deviceName": android.device_name,
+                "automationName": mobile.automation_name,
+                "app": android.app_path,
+                "appPackage": android.app_package,
+                "appActivity": android.app_activity,
+                "newCommandTimeout": mobile.new_command_timeout,
+                "noReset": mobile.no_reset,
+                "fullReset": mobile.full_reset,
+            }),
+            "ios": MappingProxyType({
+                "platformName": "iOS",
+                "platformVersion": ios.platform_version,
+                "deviceName": ios.device_name,
+                "automationName": "XCUITest",
+                "app": ios.app_path,
+                "bundleId": ios.bundle_id,
+                "udid": ios.udid,
+                "newCommandTimeout": mobile.new_command_timeout,
+                "noReset": mobile.no_reset,
+                "fullReset": mobile.full_reset,
+            }),
+        }
+
+    def get_mobile_capabilities(self, platform: str = "android") -> Mapping[str, Any]:
         """
         Get Appium capabilities based on platform.
         
@@ -464,36 +418,10 @@ class Settings(BaseModel):
             platform: 'android' or 'ios'
             
         Returns:
-            Dictionary of Appium capabilities
+            Read-only mapping of Appium capabilities (copy with dict() to modify)
         """
-        if platform.lower() == "android":
-            app_config = self.data.mobile_app.android
-            return {
-                "platformName": "Android",
-                "platformVersion": app_config.platform_version,
-                "deviceName": app_config.device_name,
-                "automationName": self.core.mobile.automation_name,
-                "app": app_config.app_path,
-                "appPackage": app_config.app_package,
-                "appActivity": app_config.app_activity,
-                "newCommandTimeout": self.core.mobile.new_command_timeout,
-                "noReset": self.core.mobile.no_reset,
-                "fullReset": self.core.mobile.full_reset,
-            }
-        else:  # iOS
-            app_config = self.data.mobile_app.ios
-            return {
-                "platformName": "iOS",
-                "platformVersion": app_config.platform_version,
-                "deviceName": app_config.device_name,
-                "automationName": "XCUITest",
-                "app": app_config.app_path,
-                "bundleId": app_config.bundle_id,
-                "udid": app_config.udid,
-                "newCommandTimeout": self.core.mobile.new_command_timeout,
-                "noReset": self.core.mobile.no_reset,
-                "fullReset": self.core.mobile.full_reset,
-            }
+        caps = self._mobile_caps
+        return caps["android"] if platform.lower() == "android" else caps["ios"]
 
 
 # =============================================================================
@@ -501,6 +429,7 @@ class Settings(BaseModel):
 # =============================================================================
 
 _settings_instance: Optional[Settings] = None
+_settings_lock = threading.Lock()
 
 
 def get_settings(
@@ -521,10 +450,17 @@ def get_settings(
     """
     global _settings_instance
     
-    if _settings_instance is None or reload:
-        _settings_instance = Settings.from_yaml(core_config_path, data_config_path)
+    # Fast path without the lock
+    settings = _settings_instance
+    if settings is not None and not reload:
+        return settings
     
-    return _settings_instance
+    with _settings_lock:
+        if reload:
+            _candidate_paths.cache_clear()
+        if _settings_instance is None or reload:
+            _settings_instance = Settings.from_yaml(core_config_path, data_config_path)
+        return _settings_instance
 
 
 def load_config(
@@ -9,24 +9,58 @@ CLI Options:
     --slow-mo           Slow down browser operations by ms
     --core-config       Path to core_config.yml
     --data-config       Path to data_config.yml
+    --no-mobile         Skip mobile tests (Appium is never imported)
 """
+from __future__ import annotations
+
+import json
 import os
+import shutil
 import sys
+import tempfile
+import zipfile
 import pytest
 import allure
-from typing import Generator, Optional
+from typing import TYPE_CHECKING, Generator, Optional
 from pathlib import Path
 from loguru import logger
-from faker import Faker
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from configs import Settings, get_settings
-from adapters.ui import PlaywrightUIActions, BrowserFactory
-from adapters.mobile import AppiumMobileActions, MobileFactory
-from adapters.api import RequestsAPIActions
-from api import APIClient
+
+# Adapters and Faker are imported inside the fixtures that use them, so e.g.
+# an API-only run never loads Playwright or the Appium client
+if TYPE_CHECKING:
+    from faker import Faker
+    from adapters.ui import PlaywrightUIActions, BrowserFactory
+    from adapters.mobile import AppiumMobileActions, MobileFactory
+    from adapters.api import RequestsAPIActions
+    from api import APIClient
+
+# With PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 pytest skips scanning every installed
+# plugin entry point; load just the plugins this suite relies on. Listing them
+# unconditionally would register them twice when autoload is on.
+if os.environ.get("PYTEST_DISABLE_PLUGIN_AUTOLOAD"):
+    pytest_plugins = [
+        "pytest_playwright.pytest_playwright",
+        "allure_pytest.plugin",
+        "pytest_asyncio.plugin",
+        "xdist.plugin",
+        "xdist.looponfail",
+        "pytest_rerunfailures",
+        "pytest_ordering",
+    ]
+
+# Seed for the session Faker; override with FAKER_SEED for different data
+FAKER_SEED = int(os.environ.get("FAKER_SEED", "0"))
+
+# Settings resolved once in pytest_configure and reused by the hooks
+_SETTINGS_KEY = pytest.StashKey[Settings]()
+# Factory config dicts derived from those settings, built once per session
+_BROWSER_CONFIG_KEY = pytest.StashKey[dict]()
+_MOBILE_CONFIG_KEY = pytest.StashKey[tuple]()
 
 
 # ---------------------------------------------------------------------------
@@ -83,6 +117,12 @@ def pytest_addoption(parser):
         default=False,
         help="Don't reset app state before test",
     )
+    parser.addoption(
+        "--no-mobile",
+        action="store_true",
+        default=False,
+        help="Skip mobile tests without loading the Appium client",
+    )
     
     # Config file options
     parser.addoption(
@@ -112,21 +152,11 @@ def test_config(request) -> Settings:
     1. CLI options (--core-config, --data-config)
     2. Environment variables (CORE_CONFIG_PATH, DATA_CONFIG_PATH)
     3. Default locations (configs/core_config.yml, configs/data_config.yml)
-    """
-    # Check CLI options first
-    core_config_path = request.config.getoption("--core-config")
-    data_config_path = request.config.getoption("--data-config")
-    
-    # Fall back to environment variables
-    if not core_config_path:
-        core_config_path = os.environ.get("CORE_CONFIG_PATH")
-    if not data_config_path:
-        data_config_path = os.environ.get("DATA_CONFIG_PATH")
     
-    return get_settings(
-        core_config_path=core_config_path,
-        data_config_path=data_config_path,
-    )
+    The files are resolved and parsed once, in pytest_configure; this
+    returns that same Settings instance.
+    """
+    return request.config.stash[_SETTINGS_KEY]
 
 
 @pytest.fixture(scope="session")
@@ -187,8 +217,14 @@ def cli_mobile_overrides(request) -> dict:
 
 @pytest.fixture(scope="session")
 def faker() -> Faker:
-    """Get Faker instance for generating test data."""
-    return Faker()
+    """Get a seeded, single-locale Faker instance for generating test data."""
+    from faker import Faker
+    
+    # A plain locale string (not a list) avoids Faker's multi-locale proxy;
+    # seeding the instance keeps generated data reproducible across runs
+    fake = Faker("en_US")
+    fake.seed_instance(FAKER_SEED)
+    return fake
 
 
 # ---------------------------------------------------------------------------
@@ -196,7 +232,12 @@ def faker() -> Faker:
 # ---------------------------------------------------------------------------
 
 def configure_logging(settings: Settings) -> None:
-    """Configure loguru logging."""
+    """
+    Configure loguru logging.
+    
+    Sinks are enqueued: records are written by a background thread so tests
+    never block on stderr/file I/O or rotation checks.
+    """
     logger.remove()  # Remove default handler
     
     logging_config = settings.core.logging
@@ -207,6 +248,7 @@ def configure_logging(settings: Settings) -> None:
         format=logging_config.format,
         level=logging_config.level,
         colorize=True,
+        enqueue=True,
     )
     
     # File handler
@@ -219,15 +261,82 @@ def configure_logging(settings: Settings) -> None:
             level=logging_config.level,
             rotation=logging_config.rotation,
             retention=logging_config.retention,
+            enqueue=True,
         )
 
 
+# ---------------------------------------------------------------------------
+# Factory Config Dicts
+# ---------------------------------------------------------------------------
+
+def _browser_config_dict(settings: Settings) -> dict:
+    """Build the BrowserFactory config dict from settings."""
+    browser = settings.core.browser
+    return {
+        "type": browser.type,
+        "headless": browser.headless,
+        "slow_mo": browser.slow_mo,
+        "timeout": browser.timeout,
+        "viewport": {
+            "width": browser.viewport_width,
+            "height": browser.viewport_height,
+        },
+        "screenshot_on_failure": browser.screenshot_on_failure,
+        "video_on_failure": browser.video_on_failure,
+        "trace_on_failure": browser.trace_on_failure,
+        "context_pool_size": browser.context_pool_size,
+    }
+
+
+def _mobile_config_dicts(settings: Settings) -> tuple:
+    """Build the MobileFactory (core_config, data_config) dicts from settings."""
+    mobile = settings.core.mobile
+    android = settings.data.mobile_app.android
+    ios = settings.data.mobile_app.ios
+    core_config = {
+        "mobile": {
+            "appium_server": mobile.appium_server,
+            "automation_name": mobile.automation_name,
+            "new_command_timeout": mobile.new_command_timeout,
+            "no_reset": mobile.no_reset,
+            "full_reset": mobile.full_reset,
+        },
+        "browser": {
+            "screenshot_on_failure": settings.core.browser.screenshot_on_failure,
+        },
+    }
+    data_config = {
+        "mobile_app": {
+            "android": {
+                "platform": android.platform,
+                "device_name": android.device_name,
+                "platform_version": android.platform_version,
+                "app_path": android.app_path,
+                "app_package": android.app_package,
+                "app_activity": android.app_activity,
+            },
+            "ios": {
+                "platform": ios.platform,
+                "device_name": ios.device_name,
+                "platform_version": ios.platform_version,
+                "app_path": ios.app_path,
+                "bundle_id": ios.bundle_id,
+                "udid": ios.udid,
+            },
+        },
+        "timeouts": {
+            "implicit_wait": settings.data.timeouts.implicit_wait,
+        },
+    }
+    return core_config, data_config
+
+
 # ---------------------------------------------------------------------------
 # Playwright UI Fixtures (using BrowserFactory)
 # ---------------------------------------------------------------------------
 
 @pytest.fixture(scope="session")
-def browser_factory(test_config: Settings, cli_browser_overrides: dict) -> Generator[BrowserFactory, None, None]:
+def browser_factory(request, cli_browser_overrides: dict) -> Generator[BrowserFactory, None, None]:
     """
     Create and manage BrowserFactory for the test session.
     
@@ -239,21 +348,9 @@ def browser_factory(test_config: Settings, cli_browser_overrides: dict) -> Gener
     Yields:
         BrowserFactory instance
     """
-    # Get browser config as dict
-    browser_config = {
-        "type": test_config.core.browser.type,
-        "headless": test_config.core.browser.headless,
-        "slow_mo": test_config.core.browser.slow_mo,
-        "timeout": getattr(test_config.core.browser, "timeout", 30000),
-        "viewport": {
-            "width": test_config.core.browser.viewport_width,
-            "height": test_config.core.browser.viewport_height,
-        },
-        "screenshot_on_failure": test_config.core.browser.screenshot_on_failure,
-        "video_on_failure": test_config.core.browser.video_on_failure,
-        "trace_on_failure": test_config.core.browser.trace_on_failure,
-    }
+    from adapters.ui import BrowserFactory
     
+    browser_config = request.config.stash[_BROWSER_CONFIG_KEY]
     factory = BrowserFactory(browser_config, cli_browser_overrides)
     
     yield factory
@@ -274,13 +371,14 @@ def browser(browser_factory: BrowserFactory):
 @pytest.fixture
 def context(browser_factory: BrowserFactory, browser):
     """
-    Create browser context using the BrowserFactory.
+    Check out a browser context from the BrowserFactory's context pool.
     
     This enables tracing and video recording based on configuration.
+    The context is reset and returned to the pool after the test.
     """
-    context = browser_factory.create_context(browser)
+    context = browser_factory.acquire_context()
     yield context
-    browser_factory.close_context(context)
+    browser_factory.release_context(context)
 
 
 @pytest.fixture
@@ -302,6 +400,8 @@ def ui_actions(page) -> PlaywrightUIActions:
     
     This fixture depends on pytest-playwright's 'page' fixture.
     """
+    from adapters.ui import PlaywrightUIActions
+    
     return PlaywrightUIActions(page)
 
 
@@ -311,7 +411,7 @@ def ui_actions(page) -> PlaywrightUIActions:
 
 @pytest.fixture(scope="session")
 def mobile_factory(
-    test_config: Settings,
+    request,
     cli_mobile_overrides: dict,
 ) -> Generator[MobileFactory, None, None]:
     """
@@ -325,50 +425,18 @@ def mobile_factory(
     Yields:
         MobileFactory instance
     """
-    # Get core config as dict
-    core_config = {
-        "mobile": {
-            "appium_server": test_config.core.mobile.appium_server,
-            "automation_name": test_config.core.mobile.automation_name,
-            "new_command_timeout": test_config.core.mobile.new_command_timeout,
-            "no_reset": test_config.core.mobile.no_reset,
-            "full_reset": test_config.core.mobile.full_reset,
-        },
-        "browser": {
-            "screenshot_on_failure": test_config.core.browser.screenshot_on_failure,
-        },
-    }
+    if request.config.getoption("--no-mobile"):
+        pytest.skip("mobile tests disabled with --no-mobile")
     
-    # Get data config as dict
-    data_config = {
-        "mobile_app": {
-            "android": {
-                "platform": test_config.data.mobile_app.android.platform,
-                "device_name": test_config.data.mobile_app.android.device_name,
-                "platform_version": test_config.data.mobile_app.android.platform_version,
-                "app_path": test_config.data.mobile_app.android.app_path,
-                "app_package": test_config.data.mobile_app.android.app_package,
-                "app_activity": test_config.data.mobile_app.android.app_activity,
-            },
-            "ios": {
-                "platform": test_config.data.mobile_app.ios.platform,
-                "device_name": test_config.data.mobile_app.ios.device_name,
-                "platform_version": test_config.data.mobile_app.ios.platform_version,
-                "app_path": test_config.data.mobile_app.ios.app_path,
-                "bundle_id": test_config.data.mobile_app.ios.bundle_id,
-                "udid": test_config.data.mobile_app.ios.udid,
-            },
-        },
-        "timeouts": {
-            "implicit_wait": test_config.data.timeouts.implicit_wait,
-        },
-    }
+    from adapters.mobile import MobileFactory
     
+    core_config, data_config = request.config.stash[_MOBILE_CONFIG_KEY]
     factory = MobileFactory(core_config, data_config, cli_mobile_overrides)
     
     yield factory
     
-    factory.close()
+    # Pooled sessions are quit in pytest_sessionfinish
+    factory.release()
 
 
 @pytest.fixture(scope="session")
@@ -384,6 +452,8 @@ def appium_driver(mobile_factory: MobileFactory):
 @pytest.fixture
 def mobile_actions(appium_driver) -> AppiumMobileActions:
     """Get mobile actions adapter wrapping the Appium driver."""
+    from adapters.mobile import AppiumMobileActions
+    
     return AppiumMobileActions(appium_driver)
 
 
@@ -391,9 +461,11 @@ def mobile_actions(appium_driver) -> AppiumMobileActions:
 # API Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
-def api_actions(test_config: Settings) -> Generator[RequestsAPIActions, None, None]:
-    """Get API actions adapter."""
+@pytest.fixture(scope="session")
+def api_actions_session(test_config: Settings) -> Generator[RequestsAPIActions, None, None]:
+    """Session-wide API actions adapter; its HTTP connections are kept alive across tests."""
+    from adapters.api import RequestsAPIActions
+    
     api_config = test_config.data.api
     timeout = test_config.data.timeouts.api_timeout
     actions = RequestsAPIActions(api_config.base_url, timeout)
@@ -402,8 +474,17 @@ def api_actions(test_config: Settings) -> Generator[RequestsAPIActions, None, No
 
 
 @pytest.fixture
-def api_client(test_config: Settings) -> Generator[APIClient, None, None]:
-    """Get API client instance."""
+def api_actions(api_actions_session: RequestsAPIActions) -> Generator[RequestsAPIActions, None, None]:
+    """Get API actions adapter (shared session, auth and headers reset after each test)."""
+    yield api_actions_session
+    api_actions_session.reset()
+
+
+@pytest.fixture(scope="session")
+def api_client_session(test_config: Settings) -> Generator[APIClient, None, None]:
+    """Session-wide API client; its HTTP connections are kept alive across tests."""
+    from api import APIClient
+    
     api_config = test_config.data.api
     timeout = test_config.data.timeouts.api_timeout
     client = APIClient(api_config.base_url, timeout)
@@ -411,6 +492,13 @@ def api_client(test_config: Settings) -> Generator[APIClient, None, None]:
     client.close()
 
 
+@pytest.fixture
+def api_client(api_client_session: APIClient) -> Generator[APIClient, None, None]:
+    """Get API client instance (shared session, auth reset after each test)."""
+    yield api_client_session
+    api_client_session.reset()
+
+
 # ---------------------------------------------------------------------------
 # Pytest Hooks
 # ---------------------------------------------------------------------------
@@ -430,6 +518,9 @@ def pytest_configure(config):
         core_config_path=core_config_path,
         data_config_path=data_config_path,
     )
+    config.stash[_SETTINGS_KEY] = settings
+    config.stash[_BROWSER_CONFIG_KEY] = _browser_config_dict(settings)
+    config.stash[_MOBILE_CONFIG_KEY] = _mobile_config_dicts(settings)
     configure_logging(settings)
     
     # Log configuration summary
@@ -437,25 +528,34 @@ def pytest_configure(config):
     headed = config.getoption("--headed", default=False)
     mobile_platform = config.getoption("--mobile-platform", default=None) or "android"
     
-    logger.info(f"Test Configuration:")
-    logger.info(f"  Environment: {settings.core.environment}")
-    logger.info(f"  Browser: {browser_type} ({'headed' if headed else 'headless'})")
-    logger.info(f"  Mobile Platform: {mobile_platform}")
-    logger.info(f"  UI Base URL: {settings.data.ui.base_url}")
-    logger.info(f"  API Base URL: {settings.data.api.base_url}")
-    logger.info(f"  Appium Server: {settings.core.mobile.appium_server}")
+    # One record (one handler lock, one write) for the whole summary
+    logger.info(
+        "Test Configuration:\n"
+        "  Environment: {}\n"
+        "  Browser: {} ({})\n"
+        "  Mobile Platform: {}\n"
+        "  UI Base URL: {}\n"
+        "  API Base URL: {}\n"
+        "  Appium Server: {}",
+        settings.core.environment,
+        browser_type,
+        "headed" if headed else "headless",
+        mobile_platform,
+        settings.data.ui.base_url,
+        settings.data.api.base_url,
+        settings.core.mobile.appium_server,
+    )
     
-    # Create reports directory
     allure_config = settings.core.allure
-    Path(allure_config.results_dir).mkdir(parents=True, exist_ok=True)
+    results_path = Path(allure_config.results_dir)
+    
+    # Clean previous results if configured (once, in the xdist controller,
+    # so workers never remove each other's freshly written results)
+    if allure_config.clean_results and not hasattr(config, "workerinput"):
+        shutil.rmtree(results_path, ignore_errors=True)
     
-    # Clean previous results if configured
-    if allure_config.clean_results:
-        results_path = Path(allure_config.results_dir)
-        if results_path.exists():
-            for file in results_path.glob("*"):
-                if file.is_file():
-                    file.unlink()
+    # Create reports directory
+    results_path.mkdir(parents=True, exist_ok=True)
     
     # Register custom markers
     config.addinivalue_line("markers", "smoke: mark test as smoke test")
@@ -466,18 +566,69 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "e2e: mark test as end-to-end test")
 
 
+def pytest_sessionstart(session):
+    """Log the session start (a hook, so no fixture resolution per test)."""
+    settings = session.config.stash[_SETTINGS_KEY]
+    logger.info(
+        "Starting test session in {} environment\n"
+        "UI Base URL: {}\n"
+        "API Base URL: {}",
+        settings.core.environment,
+        settings.data.ui.base_url,
+        settings.data.api.base_url,
+    )
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Log the start of each test."""
+    logger.info("Starting test: {}", nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    """Log the end of each test."""
+    logger.info("Completed test: {}", nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Quit pooled Appium sessions and log the end of the session."""
+    # Nothing to quit if no mobile fixture ever imported the adapters
+    mobile = sys.modules.get("adapters.mobile")
+    if mobile is not None:
+        mobile.close_mobile_factory()
+    logger.info("Test session completed")
+    # Drain the enqueued sinks before pytest prints its summary
+    logger.complete()
+
+
+# Test directory name -> marker, checked in this order
+_MARKER_BY_DIR = {
+    "api": pytest.mark.api,
+    "ui": pytest.mark.ui,
+    "mobile": pytest.mark.mobile,
+    "cross": pytest.mark.e2e,
+}
+
+
 def pytest_collection_modifyitems(config, items):
     """Modify collected tests."""
+    skip_mobile = None
+    if config.getoption("--no-mobile"):
+        skip_mobile = pytest.mark.skip(reason="mobile tests disabled with --no-mobile")
+    
     for item in items:
-        # Auto-add markers based on test path
-        if "/api/" in str(item.fspath):
-            item.add_marker(pytest.mark.api)
-        elif "/ui/" in str(item.fspath):
-            item.add_marker(pytest.mark.ui)
-        elif "/mobile/" in str(item.fspath):
-            item.add_marker(pytest.mark.mobile)
-        elif "/cross/" in str(item.fspath):
-            item.add_marker(pytest.mark.e2e)
+        # Auto-add markers based on the test's directories below rootdir,
+        # so a checkout under e.g. /src/ui/ does not mark everything
+        try:
+            dirs = set(item.path.parent.relative_to(config.rootpath).parts)
+        except ValueError:
+            dirs = set()
+        for dir_name, marker in _MARKER_BY_DIR.items():
+            if dir_name in dirs:
+                item.add_marker(marker)
+                break
+        
+        if skip_mobile is not None and item.get_closest_marker("mobile"):
+            item.add_marker(skip_mobile)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -487,48 +638,59 @@ def pytest_runtest_makereport(item, call):
     report = outcome.get_result()
     
     if report.when == "call" and report.failed:
-        core_config_path = os.environ.get("CORE_CONFIG_PATH")
-        data_config_path = os.environ.get("DATA_CONFIG_PATH")
-        settings = get_settings(
-            core_config_path=core_config_path,
-            data_config_path=data_config_path,
-        )
+        settings = item.config.stash[_SETTINGS_KEY]
         
         test_name = item.name
         
-        # Attach failure artifacts for UI tests (Playwright)
         if settings.core.browser.screenshot_on_failure and hasattr(item, "funcargs"):
-            _attach_playwright_artifacts(item, test_name)
+            page, driver = _resolve_ui_targets(item.funcargs)
+            
+            # Attach failure artifacts for UI tests (Playwright)
+            if page is not None:
+                context = item.funcargs.get("context") or getattr(page, "context", None)
+                _attach_playwright_artifacts(
+                    page,
+                    context,
+                    item.funcargs.get("browser_factory"),
+                    test_name,
+                    settings.core.browser.full_page_screenshot,
+                )
             
             # Attach failure artifacts for mobile tests (Appium)
-            _attach_appium_artifacts(item, test_name)
+            if driver is not None:
+                _attach_appium_artifacts(driver, test_name)
 
 
-def _attach_playwright_artifacts(item, test_name: str) -> None:
-    """Attach Playwright artifacts (screenshot, page source, URL, trace) on failure."""
-    page = None
-    context = None
-    
-    # Try to get page from various fixtures
-    if "page" in item.funcargs:
-        page = item.funcargs["page"]
-    elif "ui_actions" in item.funcargs:
-        ui_actions = item.funcargs["ui_actions"]
-        if hasattr(ui_actions, "page"):
-            page = ui_actions.page
-    
-    # Try to get context for trace
-    if "context" in item.funcargs:
-        context = item.funcargs["context"]
-    elif page and hasattr(page, "context"):
-        context = page.context
-    
+def _resolve_ui_targets(funcargs: dict) -> tuple:
+    """Find the Playwright page and Appium driver a test used, via its fixtures."""
+    page = funcargs.get("page")
     if page is None:
-        return
+        page = getattr(funcargs.get("ui_actions"), "page", None)
+    driver = funcargs.get("appium_driver")
+    if driver is None:
+        driver = getattr(funcargs.get("mobile_actions"), "driver", None)
+    return page, driver
+
+
+def _attach_playwright_artifacts(
+    page,
+    context,
+    factory: Optional[BrowserFactory],
+    test_name: str,
+    full_page: bool = False,
+) -> None:
+    """
+    Attach Playwright artifacts on failure.
+    
+    The screenshot is attached on its own so the report shows it inline;
+    URL, page source, trace and video are bundled into one ZIP so each
+    failure adds one results file instead of four. Entries are stored as-is
+    except the page source, which is deflated at the fastest level.
+    """
     
     # 1. Attach screenshot
     try:
-        screenshot = page.screenshot(full_page=True)
+        screenshot = page.screenshot(full_page=full_page)
         allure.attach(
             screenshot,
             name=f"Screenshot - {test_name}",
@@ -538,84 +700,80 @@ def _attach_playwright_artifacts(item, test_name: str) -> None:
     except Exception as e:
         logger.warning(f"Failed to capture screenshot: {e}")
     
-    # 2. Attach current URL
+    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as bundle_file:
+        bundle_path = bundle_file.name
     try:
-        current_url = page.url
-        allure.attach(
-            current_url,
-            name="Page URL",
-            attachment_type=allure.attachment_type.TEXT,
-        )
+        with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_STORED) as bundle:
+            _bundle_playwright_artifacts(bundle, page, context, factory)
+            has_entries = bool(bundle.namelist())
+        
+        if has_entries:
+            # Let allure copy the file rather than reading it into memory
+            allure.attach.file(
+                bundle_path,
+                name=f"Artifacts - {test_name}.zip",
+                attachment_type="application/zip",
+                extension="zip",
+            )
+            logger.info(f"Attached failure artifacts for: {test_name}")
+    except Exception as e:
+        logger.warning(f"Failed to attach failure artifacts: {e}")
+    finally:
+        os.unlink(bundle_path)
+
+
+def _bundle_playwright_artifacts(
+    bundle: zipfile.ZipFile,
+    page,
+    context,
+    factory: Optional[BrowserFactory],
+) -> None:
+    """Write URL, page source, trace and video into ``bundle``, skipping any that fail."""
+    # 2. Current URL
+    try:
+        bundle.writestr("url.txt", page.url)
     except Exception as e:
         logger.warning(f"Failed to capture URL: {e}")
     
-    # 3. Attach page HTML source
+    # 3. Page HTML source (deflated at the fastest level: HTML shrinks ~10x,
+    # unlike the already-compressed trace and video)
     try:
-        page_source = page.content()
-        allure.attach(
-            page_source,
-            name="Page Source",
-            attachment_type=allure.attachment_type.HTML,
+        bundle.writestr(
+            "page.html",
+            page.content(),
+            compress_type=zipfile.ZIP_DEFLATED,
+            compresslevel=1,
         )
     except Exception as e:
         logger.warning(f"Failed to capture page source: {e}")
     
-    # 4. Attach Playwright trace (if tracing was enabled)
-    if context:
+    # 4. Playwright trace (if the factory started one for this context)
+    if context and factory is not None:
         try:
-            import tempfile
-            trace_path = tempfile.mktemp(suffix=".zip")
-            context.tracing.stop(path=trace_path)
-            
-            with open(trace_path, "rb") as trace_file:
-                trace_data = trace_file.read()
-                allure.attach(
-                    trace_data,
-                    name=f"Trace - {test_name}.zip",
-                    attachment_type="application/zip",
-                    extension="zip",
-                )
-            logger.info(f"Attached Playwright trace for: {test_name}")
-            
-            # Clean up temp file
-            import os
-            os.unlink(trace_path)
+            with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as trace_file:
+                trace_path = trace_file.name
+            try:
+                factory.stop_tracing(context, save_path=trace_path)
+                if os.path.getsize(trace_path):
+                    bundle.write(trace_path, "trace.zip")
+            finally:
+                # Clean up temp file
+                os.unlink(trace_path)
         except Exception as e:
             logger.warning(f"Failed to capture trace: {e}")
     
-    # 5. Attach video if it exists
+    # 5. Video if it exists
     try:
         if page.video:
             video_path = page.video.path()
             if video_path:
-                with open(video_path, "rb") as video_file:
-                    video_data = video_file.read()
-                    allure.attach(
-                        video_data,
-                        name=f"Video - {test_name}.webm",
-                        attachment_type="video/webm",
-                        extension="webm",
-                    )
-                logger.info(f"Attached video for: {test_name}")
+                bundle.write(video_path, "video.webm")
     except Exception as e:
         logger.warning(f"Failed to capture video: {e}")
 
 
-def _attach_appium_artifacts(item, test_name: str) -> None:
+def _attach_appium_artifacts(driver, test_name: str) -> None:
     """Attach Appium artifacts (screenshot, page source) on failure."""
-    driver = None
-    
-    # Try to get driver from various fixtures
-    if "appium_driver" in item.funcargs:
-        driver = item.funcargs["appium_driver"]
-    elif "mobile_actions" in item.funcargs:
-        mobile_actions = item.funcargs["mobile_actions"]
-        if hasattr(mobile_actions, "driver"):
-            driver = mobile_actions.driver
-    
-    if driver is None:
-        return
-    
     try:
         # Attach screenshot
         screenshot = driver.get_screenshot_as_png()
@@ -647,7 +805,6 @@ def _attach_appium_artifacts(item, test_name: str) -> None:
             "deviceName": driver.capabilities.get("deviceName"),
             "automationName": driver.capabilities.get("automationName"),
         }
-        import json
         allure.attach(
             json.dumps(device_info, indent=2),
             name="Device Info",
@@ -688,33 +845,15 @@ def take_screenshot(request):
             take_screenshot("after_login")
             # ... continue test
     """
+    full_page = request.config.stash[_SETTINGS_KEY].core.browser.full_page_screenshot
+    
     def _take_screenshot(name: str = "screenshot"):
         # Try to find page or driver
-        page = None
-        driver = None
-        
-        if hasattr(request, "node") and hasattr(request.node, "funcargs"):
-            funcargs = request.node.funcargs
-            
-            # Check for Playwright page
-            if "page" in funcargs:
-                page = funcargs["page"]
-            elif "ui_actions" in funcargs:
-                ui_actions = funcargs["ui_actions"]
-                if hasattr(ui_actions, "page"):
-                    page = ui_actions.page
-            
-            # Check for Appium driver
-            if "appium_driver" in funcargs:
-                driver = funcargs["appium_driver"]
-            elif "mobile_actions" in funcargs:
-                mobile_actions = funcargs["mobile_actions"]
-                if hasattr(mobile_actions, "driver"):
-                    driver = mobile_actions.driver
+        page, driver = _resolve_ui_targets(getattr(request.node, "funcargs", {}))
         
         if page:
             try:
-                screenshot = page.screenshot(full_page=True)
+                screenshot = page.screenshot(full_page=full_page)
                 allure.attach(
                     screenshot,
                     name=name,
@@ -739,27 +878,3 @@ def take_screenshot(request):
             logger.warning(f"No page or driver found for screenshot: {name}")
     
     return _take_screenshot
-
-
-# ---------------------------------------------------------------------------
-# Session Fixtures
-# ---------------------------------------------------------------------------
-
-@pytest.fixture(scope="session", autouse=True)
-def setup_session(test_config: Settings):
-    """Setup test session."""
-    logger.info(f"Starting test session in {test_config.core.environment} environment")
-    logger.info(f"UI Base URL: {test_config.data.ui.base_url}")
-    logger.info(f"API Base URL: {test_config.data.api.base_url}")
-    
-    yield
-    
-    logger.info("Test session completed")
-
-
-@pytest.fixture(autouse=True)
-def log_test_info(request):
-    """Log test information."""
-    logger.info(f"Starting test: {request.node.name}")
-    yield
-    logger.info(f"Completed test: {request.node.name}")
\ No newline at end of file
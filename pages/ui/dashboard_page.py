@@ -1,10 +1,19 @@
 # from pages.base_page import BaseWebPage
+from playwright.sync_api import expect
 from adapters.ui.ui_actions_impl import PlaywrightUIActions
 
 class DashboardPage():
     def __init__(self, page=None):
         self.SEARCH_LOCATION = "[aria-label='Where are you going?']"
         self.actions = PlaywrightUIActions(page) if page else None
+        # Built once; expect() re-resolves it on every auto-waiting poll
+        self.search_locator = page.locator(self.SEARCH_LOCATION) if page else None
 
     def is_search_visible(self):
-        return self.actions.is_visible(self.SEARCH_LOCATION, timeout=5)
\ No newline at end of file
+        if self.search_locator is None:
+            raise RuntimeError("DashboardPage was created without a page")
+        try:
+            expect(self.search_locator).to_be_visible(timeout=5000)
+            return True
+        except AssertionError:
+            return False
@@ -0,0 +1,62 @@
+"""
+Regenerate api/_generated_validators.py from the schemas in api/schemas.py.
+
+Run from the repository root after changing USER_SCHEMA, AUTH_RESPONSE_SCHEMA
+or ERROR_SCHEMA:
+
+    python scripts/gen_schema_validators.py
+
+If the generated module is stale, api.schemas compiles validators at import
+time instead, so forgetting to regenerate costs startup time, not correctness.
+"""
+import sys
+import textwrap
+from pathlib import Path
+
+import fastjsonschema
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from api.schemas import _GENERATED_SCHEMAS, _schema_checksum  # noqa: E402
+
+OUTPUT = ROOT / "api" / "_generated_validators.py"
+
+HEADER = '''"""
+Pre-generated fastjsonschema validators for api.schemas.
+
+Generated by scripts/gen_schema_validators.py with fastjsonschema {version}; do not edit.
+"""
+from decimal import Decimal  # noqa: F401
+from fastjsonschema import JsonSchemaValueException  # noqa: F401
+
+SCHEMA_CHECKSUM = "{checksum}"
+'''
+
+# Lines of compile_to_code output that the shared header already provides
+_SKIPPED_PREFIXES = ("VERSION = ", "from decimal import", "from fastjsonschema import")
+
+
+def _render(name: str, schema: dict) -> str:
+    code = fastjsonschema.compile_to_code(schema, use_formats=False)
+    body = "\n".join(
+        line for line in code.splitlines() if not line.startswith(_SKIPPED_PREFIXES)
+    ).strip()
+    # Each validator gets its own scope so generated helper names cannot clash
+    return (
+        f"\n\ndef _build_{name}():\n"
+        f"{textwrap.indent(body, '    ')}\n"
+        f"    return validate\n\n\n"
+        f"{name} = _build_{name}()\n"
+    )
+
+
+def main() -> None:
+    parts = [HEADER.format(version=fastjsonschema.VERSION, checksum=_schema_checksum())]
+    parts.extend(_render(name, schema) for name, schema in _GENERATED_SCHEMAS)
+    OUTPUT.write_text("".join(parts))
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
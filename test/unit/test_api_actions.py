@@ -0,0 +1,152 @@
+import threading
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+
+from adapters.api.api_actions_impl import RequestsAPIActions
+
+
+def make_response(url, payload=None, status=200):
+    response = MagicMock()
+    response.status_code = status
+    response.url = url
+    response.content = b"{}"
+    response.json.return_value = payload if payload is not None else {"url": url}
+    return response
+
+
+def make_actions():
+    actions = RequestsAPIActions("https://api.example.test")
+    actions._allure_enabled = False
+    actions.session.get = MagicMock(side_effect=lambda url, **kwargs: make_response(url))
+    return actions
+
+
+class TestSessionRetries:
+    def test_error_statuses_are_returned_not_retried(self):
+        retry = make_actions().session.get_adapter("https://api.example.test").max_retries
+
+        assert retry.total == 3
+        assert not retry.is_retry("GET", 503)
+        assert not retry.status_forcelist
+
+
+class TestGetMany:
+    def test_responses_follow_endpoint_order(self):
+        actions = make_actions()
+
+        responses = actions.get_many(["/a", "/b", "/c"], params={"q": 1})
+
+        assert [r.url for r in responses] == [
+            "https://api.example.test/a",
+            "https://api.example.test/b",
+            "https://api.example.test/c",
+        ]
+        assert all(call.kwargs["params"] == {"q": 1} for call in actions.session.get.call_args_list)
+
+    def test_last_response_is_the_last_endpoint(self):
+        actions = make_actions()
+
+        responses = actions.get_many(["/a", "/b"])
+
+        assert actions.get_last_response() is responses[-1]
+
+    def test_reporting_runs_on_the_calling_thread(self, monkeypatch):
+        actions = make_actions()
+        threads = []
+        monkeypatch.setattr(actions, "_log_response", lambda response: threads.append(threading.get_ident()))
+
+        actions.get_many(["/a", "/b", "/c"])
+
+        assert threads == [threading.get_ident()] * 3
+
+    def test_empty_list_sends_nothing(self):
+        actions = make_actions()
+
+        assert actions.get_many([]) == []
+        actions.session.get.assert_not_called()
+
+
+def with_last_json(actions, payload):
+    response = make_response("https://api.example.test/x")
+    response.content = orjson.dumps(payload)
+    actions.session.get.side_effect = None
+    actions.session.get.return_value = response
+    actions.get("/x")
+    return actions
+
+
+class TestAssertJsonFields:
+    def test_nested_fields_match(self):
+        actions = with_last_json(make_actions(), {"id": 1, "user": {"name": "ada"}})
+
+        actions.assert_json_fields({"id": 1, "user.name": "ada"})
+
+    def test_wrong_value_names_the_field(self):
+        actions = with_last_json(make_actions(), {"user": {"name": "ada"}})
+
+        with pytest.raises(AssertionError, match="'user.name' to be bob"):
+            actions.assert_json_fields({"user.name": "bob"})
+
+    def test_missing_key_is_reported(self):
+        actions = with_last_json(make_actions(), {"user": {}})
+
+        with pytest.raises(AssertionError, match="Field 'name' not found"):
+            actions.assert_json_fields({"user.name": "ada"})
+
+    def test_non_json_response_fails(self):
+        actions = make_actions()
+        response = make_response("https://api.example.test/x")
+        response.content = b"<html>"
+        actions.session.get.side_effect = None
+        actions.session.get.return_value = response
+        actions.get("/x")
+
+        with pytest.raises(AssertionError, match="not valid JSON"):
+            actions.assert_json_fields({"id": 1})
+
+
+class TestUploadFile:
+    def test_streams_file_with_extra_fields(self, tmp_path):
+        upload = tmp_path / "report.csv"
+        upload.write_bytes(b"a,b\n1,2\n")
+        actions = make_actions()
+        sent = {}
+
+        def fake_post(url, data, headers, timeout):
+            sent.update(url=url, body=data.to_string(), content_type=headers["Content-Type"])
+            return make_response(url, status=201)
+
+        actions.session.post = MagicMock(side_effect=fake_post)
+
+        response = actions.upload_file("/files/upload", str(upload), additional_data={"folder": 7})
+
+        assert response.status_code == 201
+        assert actions.get_last_response() is response
+        assert sent["url"] == "https://api.example.test/files/upload"
+        assert sent["content_type"].startswith("multipart/form-data; boundary=")
+        assert b'name="file"; filename="report.csv"' in sent["body"]
+        assert b"a,b\n1,2\n" in sent["body"]
+        assert b'name="folder"\r\n\r\n7' in sent["body"]
+
+    def test_extra_fields_are_encoded_like_requests(self, tmp_path):
+        upload = tmp_path / "a.txt"
+        upload.write_bytes(b"x")
+        actions = make_actions()
+        sent = {}
+        actions.session.post = MagicMock(
+            side_effect=lambda url, data, headers, timeout: (
+                sent.update(body=data.to_string()) or make_response(url)
+            )
+        )
+
+        actions.upload_file(
+            "/files/upload",
+            str(upload),
+            additional_data={"skip": None, "tag": ["a", "b"], "raw": b"\x00\x01"},
+        )
+
+        assert b'name="skip"' not in sent["body"]
+        assert sent["body"].count(b'name="tag"') == 2
+        assert b'name="raw"\r\n\r\n\x00\x01' in sent["body"]
@@ -0,0 +1,57 @@
+from unittest.mock import MagicMock
+
+from api.client import APIClient
+
+
+def make_client():
+    client = APIClient("https://api.example.test")
+    client.api._allure_enabled = False
+
+    def fake_get(url, params=None, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b"{}"
+        response.json.return_value = {"url": url, "params": params}
+        return response
+
+    client.api.session.get = MagicMock(side_effect=fake_get)
+    return client
+
+
+class TestBulkRequests:
+    def test_bulk_get_keeps_id_order(self):
+        client = make_client()
+
+        results = client.bulk_get("posts", ["3", "1", "2"])
+
+        assert [r["url"] for r in results] == [
+            "https://api.example.test/posts/3",
+            "https://api.example.test/posts/1",
+            "https://api.example.test/posts/2",
+        ]
+
+    def test_bulk_list_applies_paging_defaults_and_filters(self):
+        client = make_client()
+
+        results = client.bulk_list([
+            {"resource_type": "posts"},
+            {"resource_type": "comments", "page": 3, "status": "draft"},
+        ])
+
+        assert results[0]["params"] == {"page": 1, "per_page": 20}
+        assert results[1]["url"] == "https://api.example.test/comments"
+        assert results[1]["params"] == {"page": 3, "per_page": 20, "status": "draft"}
+
+    def test_last_response_is_the_last_query(self):
+        client = make_client()
+
+        client.bulk_get("posts", ["1", "2"])
+
+        assert client.api.get_last_response().json()["url"] == "https://api.example.test/posts/2"
+
+    def test_empty_input_sends_nothing(self):
+        client = make_client()
+
+        assert client.bulk_get("posts", []) == []
+        assert client.bulk_list([]) == []
+        client.api.session.get.assert_not_called()
@@ -0,0 +1,9 @@
+import subprocess
+import sys
+
+
+def test_importing_api_adapters_does_not_load_httpx():
+    code = "import sys, adapters.api; print('httpx' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
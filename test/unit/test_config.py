@@ -0,0 +1,26 @@
+from configs.config import BrowserConfig, CoreConfig, Settings, load_config
+
+
+class TestConfigSections:
+    def test_section_without_value_loads_defaults(self, tmp_path):
+        core = tmp_path / "core_config.yml"
+        core.write_text("environment: dev\nmobile:\n  # nothing configured\nbrowser:\n  headless: false\n")
+
+        settings = load_config(str(core), str(tmp_path / "missing.yml"))
+
+        assert settings.core.environment == "dev"
+        assert settings.core.mobile == CoreConfig().mobile
+        assert settings.core.browser.headless is False
+
+    def test_missing_files_give_shared_defaults(self, tmp_path):
+        settings = load_config(str(tmp_path / "a.yml"), str(tmp_path / "b.yml"))
+
+        assert settings is Settings.defaults()
+        assert settings.core.browser is BrowserConfig.defaults()
+        assert settings.data.timeouts.default == 30
+
+    def test_nested_viewport_is_flattened(self):
+        browser = BrowserConfig.model_validate({"viewport": {"width": 800}})
+
+        assert browser.viewport_width == 800
+        assert browser.viewport_height == 1080
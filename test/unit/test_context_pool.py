@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from adapters.ui.browser_factory import ContextPool
+
+
+class FakeContext:
+    """Context double whose localStorage is cleared by visiting each origin."""
+
+    def __init__(self, origins=(), clearable=True):
+        self.origins = list(origins)
+        self.clearable = clearable
+        self.pages = [MagicMock()]
+        self.visited = []
+        self.unroute_all = MagicMock()
+        self.clear_cookies = MagicMock()
+        self.clear_permissions = MagicMock()
+        self.set_extra_http_headers = MagicMock()
+        self.set_geolocation = MagicMock()
+        self.set_offline = MagicMock()
+
+    def storage_state(self):
+        return {"cookies": [], "origins": [{"origin": o, "localStorage": []} for o in self.origins]}
+
+    def new_page(self):
+        page = MagicMock()
+        page.goto.side_effect = self.visited.append
+        page.evaluate.side_effect = lambda script: self.clearable and self.origins.clear()
+        return page
+
+
+def make_pool(size=2, **context_kwargs):
+    factory = MagicMock()
+    factory.create_context.side_effect = lambda: FakeContext(**context_kwargs)
+    return ContextPool(factory, size), factory
+
+
+class TestContextPool:
+    def test_released_context_is_reset_and_reused(self):
+        pool, factory = make_pool()
+        context = pool.acquire()
+        context.origins = ["https://a.example", "https://b.example"]
+
+        pool.release(context)
+
+        assert context.visited == ["https://a.example", "https://b.example"]
+        assert context.origins == []
+        context.clear_cookies.assert_called_once()
+        context.unroute_all.assert_called_once()
+        context.set_extra_http_headers.assert_called_once_with({})
+        context.set_geolocation.assert_called_once_with(None)
+        context.set_offline.assert_called_once_with(False)
+        factory.discard_trace.assert_called_once_with(context)
+        factory.close_context.assert_not_called()
+        assert pool.acquire() is context
+
+    def test_context_without_storage_skips_scratch_page(self):
+        pool, factory = make_pool()
+        context = pool.acquire()
+
+        pool.release(context)
+
+        assert context.visited == []
+        assert pool.acquire() is context
+
+    def test_context_with_stuck_storage_is_closed(self):
+        pool, factory = make_pool(origins=["https://a.example"], clearable=False)
+        context = pool.acquire()
+
+        pool.release(context)
+
+        factory.close_context.assert_called_once_with(context)
+        assert pool.acquire() is not context
+
+    def test_release_when_full_closes_context(self):
+        pool, factory = make_pool(size=1)
+        first, second = pool.acquire(), pool.acquire()
+
+        pool.release(first)
+        pool.release(second)
+
+        factory.close_context.assert_called_once_with(second)
+
+    def test_context_not_created_by_pool_is_closed(self):
+        pool, factory = make_pool()
+        context = FakeContext()
+
+        pool.release(context)
+
+        factory.close_context.assert_called_once_with(context)
+        context.clear_cookies.assert_not_called()
+
+    def test_pooling_disabled_closes_context(self):
+        pool, factory = make_pool(size=0)
+        context = pool.acquire()
+
+        pool.release(context)
+
+        factory.close_context.assert_called_once_with(context)
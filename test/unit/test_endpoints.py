@@ -0,0 +1,17 @@
+from api.endpoints import Endpoints
+
+
+class TestEndpointBuilders:
+    def test_builders_accept_str_and_int_ids(self):
+        assert Endpoints.Users.by_id("42") == "/users/42"
+        assert Endpoints.Users.profile(42) == "/users/42/profile"
+        assert Endpoints.Posts.comments(7) == "/posts/7/comments"
+
+    def test_tuple_id_is_formatted_not_unpacked(self):
+        assert Endpoints.Files.download(("a", 1)) == "/files/('a', 1)"
+
+    def test_unhashable_id_is_accepted(self):
+        assert Endpoints.Posts.by_id(["x"]) == "/posts/['x']"
+
+    def test_query_string_drops_none_and_expands_lists(self):
+        assert Endpoints.build_query_string(tag=["a", "b"], page=None, q="x y") == "tag=a&tag=b&q=x+y"
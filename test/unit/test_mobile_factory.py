@@ -0,0 +1,151 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from adapters.mobile import mobile_factory
+from adapters.mobile.mobile_factory import MobileFactory, get_mobile_factory
+
+
+@pytest.fixture(autouse=True)
+def isolated_factories(monkeypatch):
+    """Start each test with no shared factories and no mobile env overrides."""
+    for key in mobile_factory._ENV_KEYS:
+        monkeypatch.delenv(key, raising=False)
+    monkeypatch.setattr(mobile_factory, "_factories", {})
+    monkeypatch.setattr(mobile_factory, "_last_factory", None)
+    mobile_factory._env_snapshot.cache_clear()
+    yield
+    mobile_factory._env_snapshot.cache_clear()
+
+
+class TestConfigOverrides:
+    def test_defaults_without_config(self):
+        config = MobileFactory({}, {}).config
+
+        assert config.platform == "android"
+        assert config.appium_server == "http://localhost:4723"
+        assert config.android_device_name == "emulator-5554"
+
+    def test_env_overrides_config_files(self, monkeypatch):
+        monkeypatch.setenv("MOBILE_APPIUM_SERVER", "http://grid:4723")
+        monkeypatch.setenv("MOBILE_NO_RESET", "true")
+
+        config = MobileFactory({"mobile": {"appium_server": "http://file:4723"}}, {}).config
+
+        assert config.appium_server == "http://grid:4723"
+        assert config.no_reset is True
+
+    def test_cli_overrides_env(self, monkeypatch):
+        monkeypatch.setenv("MOBILE_PLATFORM", "android")
+        monkeypatch.setenv("MOBILE_DEVICE_NAME", "env-device")
+
+        config = MobileFactory({}, {}, cli_overrides={"platform": "IOS", "device_name": "cli-device"}).config
+
+        assert config.platform == "ios"
+        assert config.ios_device_name == "cli-device"
+        assert config.android_device_name == "cli-device"
+
+
+class TestSharedFactories:
+    def test_same_resolved_config_shares_a_factory(self):
+        first = get_mobile_factory({}, {})
+        second = get_mobile_factory({}, {})
+
+        assert first is second
+
+    def test_key_uses_platform_after_cli_override(self):
+        android = get_mobile_factory({}, {})
+        ios = get_mobile_factory({}, {}, cli_overrides={"platform": "ios"})
+
+        assert android is not ios
+        assert ios.config.platform == "ios"
+        assert get_mobile_factory({}, {}, cli_overrides={"platform": "ios"}) is ios
+
+    def test_key_uses_server_after_env_override(self, monkeypatch):
+        local = get_mobile_factory({}, {})
+        monkeypatch.setenv("MOBILE_APPIUM_SERVER", "http://grid:4723")
+        mobile_factory._env_snapshot.cache_clear()
+
+        remote = get_mobile_factory({}, {})
+
+        assert remote is not local
+        assert remote.config.appium_server == "http://grid:4723"
+
+    def test_platform_from_data_config_is_part_of_the_key(self):
+        ios_data = {"mobile_app": {"android": {"platform": "iOS"}}}
+
+        factory = get_mobile_factory({}, ios_data)
+
+        assert factory.config.platform == "ios"
+        assert get_mobile_factory({}, {}) is not factory
+
+    @pytest.mark.parametrize("core, data, cli, env", [
+        ({}, {}, None, {}),
+        ({"mobile": {"appium_server": "http://file:4723"}}, {}, None, {}),
+        ({"mobile": {"appium_server": "http://file:4723"}}, {}, None, {"MOBILE_APPIUM_SERVER": "http://env:4723"}),
+        ({}, {"mobile_app": {"android": {"platform": "ios"}}}, {"platform": "Android"}, {"MOBILE_PLATFORM": "ios"}),
+        ({}, {}, {"platform": ""}, {"MOBILE_PLATFORM": "IOS"}),
+    ])
+    def test_key_matches_the_resolved_config(self, monkeypatch, core, data, cli, env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        factory = get_mobile_factory(core, data, cli)
+
+        assert mobile_factory._factory_key(core, data, cli or {}) == (
+            factory.config.platform,
+            factory.config.appium_server,
+        )
+
+    def test_lookup_does_not_build_a_factory(self, monkeypatch):
+        existing = get_mobile_factory({}, {})
+        monkeypatch.setattr(mobile_factory, "MobileFactory", None)
+
+        assert get_mobile_factory({}, {}) is existing
+
+    def test_no_arguments_return_the_latest_factory(self):
+        get_mobile_factory({}, {})
+        ios = get_mobile_factory({}, {}, cli_overrides={"platform": "ios"})
+
+        assert get_mobile_factory() is ios
+
+    def test_force_new_replaces_the_shared_factory(self):
+        first = get_mobile_factory({}, {})
+
+        assert get_mobile_factory({}, {}, force_new=True) is not first
+
+
+class TestDriverRelease:
+    @pytest.fixture
+    def factory(self, monkeypatch):
+        monkeypatch.setattr(mobile_factory, "_DRIVER_POOL", {})
+        factory = MobileFactory({}, {})
+        factory._driver = MagicMock()
+        factory._pool_key = ((), factory.config.appium_server)
+        return factory
+
+    def test_close_quits_the_driver(self, factory):
+        driver = factory._driver
+
+        factory.close()
+
+        driver.quit.assert_called_once()
+        assert mobile_factory._DRIVER_POOL == {}
+
+    def test_context_manager_quits_the_driver(self, factory):
+        driver = factory._driver
+
+        with factory:
+            pass
+
+        driver.quit.assert_called_once()
+
+    def test_release_pools_the_session(self, factory):
+        driver = factory._driver
+
+        factory.release()
+
+        driver.quit.assert_not_called()
+        assert mobile_factory._DRIVER_POOL == {factory._pool_key: driver}
+        mobile_factory.quit_pooled_drivers()
+        driver.quit.assert_called_once()
@@ -0,0 +1,86 @@
+import orjson
+import pytest
+from jsonschema import ValidationError
+
+from api import schemas
+from api.schemas import (
+    USER_SCHEMA,
+    paginated_schema,
+    validate_paginated,
+    validate_response,
+    validate_response_json,
+)
+
+USER = {"id": 1, "username": "ada", "email": "ada@example.test"}
+
+
+def page_of(*items):
+    return {"data": list(items), "pagination": {"page": 1, "total": len(items)}}
+
+
+class TestValidatePaginated:
+    def test_valid_page(self):
+        assert validate_paginated(page_of(USER, {**USER, "id": "2"}), USER_SCHEMA)
+
+    def test_item_error_carries_its_path(self):
+        with pytest.raises(ValidationError) as exc_info:
+            validate_paginated(page_of(USER, {"id": 2}), USER_SCHEMA)
+
+        assert list(exc_info.value.path)[:2] == ["data", 1]
+
+    def test_missing_pagination_fields_fail(self):
+        with pytest.raises(ValidationError):
+            validate_paginated({"data": [], "pagination": {"page": 1}}, USER_SCHEMA)
+
+    def test_matches_the_full_paginated_schema(self):
+        data = page_of(USER)
+
+        assert validate_paginated(data, USER_SCHEMA) == validate_response(data, paginated_schema(USER_SCHEMA))
+
+
+class TestValidateResponseJson:
+    def test_returns_decoded_data(self):
+        assert validate_response_json(orjson.dumps(USER), USER_SCHEMA) == USER
+        assert validate_response_json(orjson.dumps(USER).decode(), USER_SCHEMA) == USER
+
+    def test_invalid_document_raises(self):
+        with pytest.raises(ValidationError):
+            validate_response_json(b'{"id": 1}', USER_SCHEMA)
+
+    def test_malformed_json_raises(self):
+        with pytest.raises(orjson.JSONDecodeError):
+            validate_response_json(b"{", USER_SCHEMA)
+
+
+class TestSchemaCache:
+    def test_entries_are_evicted_least_recently_used_first(self):
+        cache = schemas._SchemaCache(maxsize=2)
+        first, second, third = {"a": 1}, {"b": 2}, {"c": 3}
+        cache.get(first, len)
+        cache.get(second, len)
+        cache.get(first, len)
+        cache.get(third, len)
+
+        built = []
+        cache.get(first, built.append)
+        cache.get(second, built.append)
+
+        assert built == [second]
+        assert len(cache) == 2
+
+    def test_pinned_entries_survive_eviction(self):
+        cache = schemas._SchemaCache(maxsize=1)
+        pinned = {"pinned": True}
+        cache.pin(pinned, "generated")
+        for i in range(3):
+            cache.get({"i": i}, len)
+
+        assert cache.get(pinned, lambda schema: "rebuilt") == "generated"
+
+    def test_ad_hoc_schemas_do_not_grow_the_cache(self):
+        for _ in range(schemas._SCHEMA_CACHE_SIZE + 10):
+            validate_paginated(page_of(USER), dict(USER_SCHEMA))
+
+        assert len(schemas._PAGINATED) <= schemas._SCHEMA_CACHE_SIZE
+        assert len(schemas._FAST) <= schemas._SCHEMA_CACHE_SIZE + len(schemas._GENERATED_SCHEMAS)
+        assert len(schemas._VALIDATORS) <= schemas._SCHEMA_CACHE_SIZE
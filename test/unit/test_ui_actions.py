@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from adapters.ui.ui_actions_impl import BatchedUIActions
+
+
+def make_batch(*evaluate_results):
+    actions = MagicMock()
+    actions.page.evaluate.side_effect = list(evaluate_results)
+    return BatchedUIActions(actions), actions
+
+
+class TestBatchedUIActions:
+    def test_queued_ops_run_in_one_evaluate(self):
+        batch, actions = make_batch(2)
+        batch.fill("#email", "a@example.test")
+        batch.click("#submit")
+
+        batch.flush()
+
+        actions.page.evaluate.assert_called_once()
+        assert actions.page.evaluate.call_args.args[1] == [
+            ("fill", "#email", "a@example.test"),
+            ("click", "#submit", None),
+        ]
+        actions.fill.assert_not_called()
+        actions.click.assert_not_called()
+
+    @pytest.mark.parametrize("locator", [
+        "text=Sign in",
+        "xpath=//button",
+        "form >> button",
+        "a:text-is('Home')",
+        "li:text-matches('item \\\\d')",
+        "button:right-of(#name)",
+        "input:near(label)",
+        "button:visible",
+    ])
+    def test_playwright_selectors_are_not_queued(self, locator):
+        batch, actions = make_batch()
+
+        batch.click(locator)
+
+        actions.click.assert_called_once_with(locator)
+        assert batch.queue == []
+
+    def test_op_handed_back_by_the_page_runs_through_playwright(self):
+        # The page stops at index 1 (e.g. a nested :has() engine), then runs the rest
+        batch, actions = make_batch(1, 1)
+        batch.fill("#a", "1")
+        batch.fill("div:has(text='x') input", "2")
+        batch.click("#go")
+
+        batch.flush()
+
+        actions.fill.assert_called_once_with("div:has(text='x') input", "2")
+        assert actions.page.evaluate.call_args_list[1].args[1] == [("click", "#go", None)]
+        assert batch.queue == []